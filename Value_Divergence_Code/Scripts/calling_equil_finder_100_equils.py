@@ -7,6 +7,9 @@ My words: This generates a bunch of random paramater values and that calls the F
 Minimal batch runner: guarantees ≥5 examples of every mask, then random remainder.
 CSV columns: parameters, efforts (x1,y1,x2,y2), MultipleMatches (Yes/No).
 
+Quota rows are drawn directly inside each mask's region by Equil_finder.mask_sampler
+(Table-1 inequalities inverted for p2y, vectorized batches), so every draw costs one solver call.
+
 Solver:
   /Users/tonymolino/Dropbox/Mac/Desktop/PyProjects/Value_Divergence/Value_Divergence_Code/src/Equil_finder/Finding_Equilibrium_1.py
 
@@ -17,7 +20,6 @@ Output:
 import sys
 import os
 import csv
-import random
 from typing import Dict, Any, List, Tuple
 
 # ---------------- config ----------------
@@ -28,7 +30,7 @@ OUTPUT_CSV: str = (
     "/Users/tonymolino/Dropbox/Mac/Desktop/PyProjects/Value_Divergence/"
     "Value_Divergence_Code/outputs/random_equilibria_quota_min.csv"
 )
-MAX_TRIES_PER_TARGET: int = 200000
+SAMPLER_METHOD: str = "auto"   # "auto" (construct, rejection if that fails), "construct" or "reject"
 
 # Parameter bounds
 BOUNDS: Dict[str, Tuple[float, float]] = {
@@ -49,44 +51,31 @@ if SRC_DIR not in sys.path:
     sys.path.insert(0, SRC_DIR)
 
 from Equil_finder.Finding_Equilibrium_1 import solve_two_task_cobb_douglas_equilibrium  # noqa: E402
+from Equil_finder.mask_sampler import MASKS, PARAM_NAMES, sample_mask_params, table1_pass  # noqa: E402
+
+
+def _rows_of(batch: Dict[str, Any]) -> List[Dict[str, float]]:
+    n = len(batch["a1"])
+    return [{k: float(batch[k][i]) for k in PARAM_NAMES} for i in range(n)]
 
-MASKS = ["B,X", "X,B", "B,Y", "Y,B", "X,Y", "Y,X", "B,B"]
+def draw_params_batch(rng, n: int) -> List[Dict[str, float]]:
+    """n uniform draws inside BOUNDS that pass at least one Table-1 mask test (rng: numpy Generator)."""
+    import numpy as np
 
-def _uniform(lo: float, hi: float) -> float:
     eps = 1e-12
-    return random.uniform(lo + eps, hi - eps)
-
-def draw_params() -> Dict[str, float]:
-    return {k: _uniform(*BOUNDS[k]) for k in ["a1","a2","c1","c2","p1x","p1y","p2x","p2y"]}
-
-def construct_params_BB() -> Dict[str, float]:
-    """
-    Construct parameters satisfying r1 == r2 to hit (B,B).
-    r1 = (a1 p1y)/((1-a1) p1x), r2 = (a2 p2y)/((1-a2) p2x)
-    Choose a1,a2,c1,c2,p1x,p1y,p2x; then set p2y so r2 == r1.
-    Verify via solver; retry if out of bounds or not (B,B).
-    """
-    lo, hi = BOUNDS["p2y"]
-    for _ in range(50000):
-        a1 = _uniform(*BOUNDS["a1"])
-        a2 = _uniform(*BOUNDS["a2"])
-        c1 = _uniform(*BOUNDS["c1"])
-        c2 = _uniform(*BOUNDS["c2"])
-        p1x = _uniform(*BOUNDS["p1x"])
-        p1y = _uniform(*BOUNDS["p1y"])
-        p2x = _uniform(*BOUNDS["p2x"])
-        r1 = (a1 * p1y) / ((1.0 - a1) * p1x)
-        p2y = ((1.0 - a2) * p2x / a2) * r1
-        if not (lo < p2y < hi):
-            continue
-        params = {"a1":a1,"a2":a2,"c1":c1,"c2":c2,"p1x":p1x,"p1y":p1y,"p2x":p2x,"p2y":p2y}
-        res = solve_two_task_cobb_douglas_equilibrium(a1,a2,c1,c2,p1x,p1y,p2x,p2y,tol=1e-10,verbose=False)
-        if res.get("multiple_matches", False):
-            if "B,B" in res.get("masks", []):
-                return params
-        elif res.get("mask") == "B,B":
-            return params
-    raise RuntimeError("Could not construct (B,B) within attempts.")
+    out: List[Dict[str, float]] = []
+    while len(out) < n:
+        batch = {k: rng.uniform(BOUNDS[k][0] + eps, BOUNDS[k][1] - eps, size=2 * n) for k in PARAM_NAMES}
+        feasible = np.any(np.stack(list(table1_pass(batch).values())), axis=0)
+        out.extend(_rows_of({k: v[feasible] for k, v in batch.items()}))
+    return out[:n]
+
+def solve(params: Dict[str, float]) -> Dict[str, Any]:
+    return solve_two_task_cobb_douglas_equilibrium(
+        params["a1"], params["a2"], params["c1"], params["c2"],
+        params["p1x"], params["p1y"], params["p2x"], params["p2y"],
+        tol=1e-10, verbose=False
+    )
 
 def produced_masks(res: Dict[str, Any]) -> List[str]:
     if res.get("multiple_matches", False):
@@ -116,7 +105,9 @@ def row_from_res(params: Dict[str, float], res: Dict[str, Any]) -> List[Any]:
     ]
 
 def main() -> None:
-    random.seed(RANDOM_SEED)
+    import numpy as np
+
+    rng = np.random.default_rng(RANDOM_SEED)
     os.makedirs(os.path.dirname(OUTPUT_CSV), exist_ok=True)
 
     header = [
@@ -127,41 +118,25 @@ def main() -> None:
     rows: List[List[Any]] = []
     counts: Dict[str, int] = {m: 0 for m in MASKS}
 
-    # Stage 1: meet quotas for each mask
+    # Stage 1: meet quotas for each mask (draws land in the target region by construction)
     for target in MASKS:
         needed = max(0, MIN_PER_MASK - counts[target])
-        tries = 0
-        while needed > 0 and tries < MAX_TRIES_PER_TARGET:
-            tries += 1
-            params = construct_params_BB() if target == "B,B" else draw_params()
-            res = solve_two_task_cobb_douglas_equilibrium(
-                params["a1"], params["a2"], params["c1"], params["c2"],
-                params["p1x"], params["p1y"], params["p2x"], params["p2y"],
-                tol=1e-10, verbose=False
-            )
-            masks = produced_masks(res)
-            if target in masks:
-                rows.append(row_from_res(params, res))
-                # credit all masks that appeared in this row up to quota
-                for m in masks:
-                    if m in counts and counts[m] < MIN_PER_MASK:
-                        counts[m] += 1
-                needed = max(0, MIN_PER_MASK - counts[target])
-        if needed > 0:
-            raise RuntimeError(f"Failed to meet quota for mask {target} in {tries} tries.")
-
-    # Stage 2: random remainder until N_TOTAL rows
-    while len(rows) < N_TOTAL:
-        params = draw_params()
-        res = solve_two_task_cobb_douglas_equilibrium(
-            params["a1"], params["a2"], params["c1"], params["c2"],
-            params["p1x"], params["p1y"], params["p2x"], params["p2y"],
-            tol=1e-10, verbose=False
-        )
-        # ignore totally infeasible (should be rare)
-        if (not res.get("multiple_matches", False)) and (res.get("mask") is None):
+        if needed == 0:
             continue
-        rows.append(row_from_res(params, res))
+        for params in _rows_of(sample_mask_params(target, needed, BOUNDS, rng=rng, method=SAMPLER_METHOD)):
+            res = solve(params)
+            masks = produced_masks(res)
+            if target not in masks:
+                raise RuntimeError(f"Sampler draw for {target} solved to {masks}: {params}")
+            rows.append(row_from_res(params, res))
+            # credit all masks that appeared in this row up to quota
+            for m in masks:
+                if m in counts and counts[m] < MIN_PER_MASK:
+                    counts[m] += 1
+
+    # Stage 2: random remainder until N_TOTAL rows (totally infeasible draws are screened out)
+    for params in draw_params_batch(rng, max(0, N_TOTAL - len(rows))):
+        rows.append(row_from_res(params, solve(params)))
 
     # Write CSV
     with open(OUTPUT_CSV, "w", newline="", encoding="utf-8") as f:
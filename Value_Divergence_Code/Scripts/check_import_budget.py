@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Import-time budget check for the src packages. Worker processes and the `valued` CLI import these
+modules over and over, so NumPy / matplotlib must only load inside the functions that use them.
+Exits 1 (CI runs it after the tests) when a module goes over its budget or pulls in a heavy
+dependency at import time.
+
+  python check_import_budget.py                    # all modules in BUDGETS
+  python check_import_budget.py --repeat 15 --scale 1.25   # noisier machine: budgets x 1.25
+  python check_import_budget.py --module Equil_finder.Finding_Equilibrium_1
+
+How it measures: `python -X importtime -c "import <module>"` in a fresh interpreter, with src on
+PYTHONPATH. The cost is the summed self time of every module that import loads on top of a bare
+interpreter (so parent packages and shared stdlib modules such as typing count). Each run is paired
+with a bare `python -X importtime -c pass` run right before it, and the budget applies to the
+median over --repeat pairs of cost / (bare interpreter's own import time). The ratio carries over
+between fast and slow machines and between Python versions far better than milliseconds do.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Set, Tuple
+
+# Scripts/ and src/ are siblings under Value_Divergence_Code
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+# module -> (budget as a multiple of the bare interpreter's import time, heavy packages it may
+# load at import time). Budgets are 2x the median ratio measured when they were set (solver
+# 1.9, optimize_a2 4.4, ...): a module more than twice as slow fails, run-to-run noise (~10%)
+# does not, and a heavy import (numpy alone is ~10x) fails on any machine. valued.cli is the
+# `valued solve` start-up path: it must not load typer.
+BUDGETS: Dict[str, Tuple[float, Tuple[str, ...]]] = {
+    "Equil_finder.Finding_Equilibrium_1": (3.8, ()),   # the core solver: every worker imports it
+    "Equil_finder.batch_solver": (3.8, ()),
+    "Equil_finder.pipeline": (4.9, ()),
+    "optimize_a2": (8.8, ()),
+    "param_sweep": (10.0, ()),
+    "make_optimal_a2_map": (9.4, ()),
+    "make_optimal_a2_graph": (10.2, ()),
+    "figures": (9.0, ()),
+    "valued.cli": (3.8, ()),
+}
+HEAVY = ("numpy", "scipy", "matplotlib", "pandas", "pyarrow", "typer", "click", "rich")
+
+
+def _importtime(code: str) -> Dict[str, int]:
+    """{module: self time in µs} from one `python -X importtime -c code` run."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = SRC_DIR + (os.pathsep + env["PYTHONPATH"] if env.get("PYTHONPATH") else "")
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                          capture_output=True, text=True, env=env)
+    if proc.returncode != 0:
+        raise RuntimeError(f"{code!r} failed:\n{proc.stderr.strip().splitlines()[-1]}")
+    out: Dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        out[name.strip()] = int(self_us)
+    return out
+
+
+def measure(module: str, repeat: int) -> Tuple[float, float, Set[str]]:
+    """
+    (median cost / bare-interpreter import time, median cost in ms, top-level packages loaded on
+    top of a bare interpreter) over `repeat` paired runs.
+    """
+    baseline: Set[str] = set(_importtime("pass"))
+    ratios: List[float] = []
+    costs: List[float] = []
+    loaded: Set[str] = set()
+    for _ in range(repeat):
+        bare = sum(_importtime("pass").values())
+        times = _importtime(f"import {module}")
+        extra = {m: t for m, t in times.items() if m not in baseline}
+        costs.append(sum(extra.values()) / 1000.0)
+        ratios.append(costs[-1] * 1000.0 / bare)
+        loaded = {m.split(".")[0] for m in extra}
+    return statistics.median(ratios), statistics.median(costs), loaded
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Import-time budget check (python -X importtime).")
+    ap.add_argument("--module", action="append", help="check only these modules (repeatable)")
+    ap.add_argument("--repeat", type=int, default=9, help="paired runs per module; the median ratio counts")
+    ap.add_argument("--scale", type=float, default=1.0, help="multiply every budget (slow / loaded machines)")
+    args = ap.parse_args()
+
+    modules = args.module or list(BUDGETS)
+    failures: List[str] = []
+    print(f"{'module':<38s} {'ms':>8s} {'x bare':>8s} {'budget':>8s}  heavy imports")
+    for module in modules:
+        budget, allowed = BUDGETS.get(module, (min(b for b, _ in BUDGETS.values()), ()))
+        budget *= args.scale
+        ratio, ms, loaded = measure(module, args.repeat)
+        heavy = sorted(m for m in loaded if m in HEAVY and m not in allowed)
+        status = "ok"
+        if ratio > budget:
+            status = "OVER BUDGET"
+            failures.append(f"{module}: {ratio:.2f}x bare interpreter ({ms:.1f} ms) > {budget:.2f}x")
+        if heavy:
+            status = "HEAVY IMPORT"
+            failures.append(f"{module}: loads {', '.join(heavy)} at import time")
+        print(f"{module:<38s} {ms:8.1f} {ratio:8.2f} {budget:8.2f}  {', '.join(heavy) or '-':<14s} {status}")
+
+    if failures:
+        print("\nImport budget failed:\n  " + "\n  ".join(failures))
+        sys.exit(1)
+    print("\nAll imports within budget.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Large-scale random equilibrium dataset (the scalable counterpart of calling_equil_finder_100_equils.py).
+Draws random parameter vectors in process workers with independent, reproducible RNG streams, solves
+them with the vectorized solver, and writes npz or CSV chunk files plus a manifest.
+
+  python generate_equilibrium_dataset.py --rows 20000000 --workers 8 --out /data/equils
+  python generate_equilibrium_dataset.py --rows 100000 --format csv --min-per-mask 5 --out /tmp/equils
+
+Same --seed and --chunk-rows always give the same rows (for any --workers). Re-running resumes.
+
+Module:
+  /Users/tonymolino/Dropbox/Mac/Desktop/PyProjects/Value_Divergence/Value_Divergence_Code/src/Equil_finder/dataset.py
+"""
+
+import argparse
+import sys
+
+# --- Make src importable (NO BLANK PATHS) ---
+SRC_DIR = "/Users/tonymolino/Dropbox/Mac/Desktop/PyProjects/Value_Divergence/Value_Divergence_Code/src"
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+from Equil_finder.dataset import generate_equilibrium_dataset  # noqa: E402
+from optimize_a2 import ConsoleProgress  # noqa: E402
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Parallel, reproducible random-equilibrium dataset.")
+    ap.add_argument("--out", required=True, help="output folder (chunks + manifest.json)")
+    ap.add_argument("--rows", type=int, required=True)
+    ap.add_argument("--seed", type=int, default=424242)
+    ap.add_argument("--chunk-rows", type=int, default=1_000_000)
+    ap.add_argument("--format", choices=("npz", "csv"), default="npz")
+    ap.add_argument("--workers", type=int, default=1)
+    ap.add_argument("--min-per-mask", type=int, default=0, help="rows of every mask at the start of each chunk")
+    args = ap.parse_args()
+
+    manifest = generate_equilibrium_dataset(
+        args.out, n_rows=args.rows, seed=args.seed, chunk_rows=args.chunk_rows, fmt=args.format,
+        workers=args.workers, min_per_mask_per_chunk=args.min_per_mask, progress=ConsoleProgress(),
+    )
+    print(f"Wrote {manifest['n_rows_done']} rows in {len(manifest['chunks'])} chunks to:\n  {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Streaming generate -> solve -> verify pipeline: one pass in place of calling_equil_finder_100_equils.py
+followed by Checking_Equil_From_Csv.py. Draws random parameters, solves them in batches, checks every
+row is a Nash equilibrium (exact best responses or the local stencil) in the same batch, and writes
+one CSV with the efforts and the check columns; no intermediate CSV is written.
+
+  python run_equilibrium_pipeline.py --rows 5000000 --workers 8 --out /data/validated.csv
+  python run_equilibrium_pipeline.py --rows 100 --min-per-mask 5 --verify local --out /tmp/small.csv
+
+Module:
+  /Users/tonymolino/Dropbox/Mac/Desktop/PyProjects/Value_Divergence/Value_Divergence_Code/src/Equil_finder/pipeline.py
+"""
+
+import argparse
+import sys
+
+# --- Make src importable (NO BLANK PATHS) ---
+SRC_DIR = "/Users/tonymolino/Dropbox/Mac/Desktop/PyProjects/Value_Divergence/Value_Divergence_Code/src"
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+from Equil_finder.pipeline import run_equilibrium_pipeline  # noqa: E402
+from optimize_a2 import ConsoleProgress  # noqa: E402
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Streaming generate -> solve -> verify pipeline.")
+    ap.add_argument("--out", required=True, help="output CSV")
+    ap.add_argument("--rows", type=int, required=True)
+    ap.add_argument("--seed", type=int, default=424242)
+    ap.add_argument("--batch-rows", type=int, default=100_000)
+    ap.add_argument("--workers", type=int, default=1)
+    ap.add_argument("--min-per-mask", type=int, default=0, help="rows of every mask at the start of each batch")
+    ap.add_argument("--verify", choices=("exact", "local", "none"), default="exact")
+    args = ap.parse_args()
+
+    summary = run_equilibrium_pipeline(
+        args.out, args.rows, seed=args.seed, batch_rows=args.batch_rows, workers=args.workers,
+        min_per_mask_per_batch=args.min_per_mask, verify=args.verify, progress=ConsoleProgress(),
+    )
+    print(f"Wrote {summary['n_rows']} rows ({summary['n_verified']} verified) to:\n  {args.out}")
+    print("Rows per mask:", summary["mask_counts"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Sharded (r1, r2) opposites-attract sweep: runs one deterministic, load-balanced shard of the grid
+per host, and validates and merges the finished shards into the usual summary / raw CSVs.
+
+Every host points --out at the same shared folder:
+  python run_sweep_shard.py --shard 0/8 --out /shared/sweep      (host 0)
+  python run_sweep_shard.py --shard 1/8 --out /shared/sweep      (host 1)
+  ...
+  python run_sweep_shard.py --merge 8   --out /shared/sweep      (once all 8 are done)
+
+All hosts must use the same grid flags. Re-running a shard resumes it from its checkpoint.
+The merge writes the same summary / raw CSVs as save_summary_csv / save_raw_curves_csv.
+
+Package: /Users/tonymolino/Dropbox/Mac/Desktop/PyProjects/Value_Divergence/Value_Divergence_Code/src/make_optimal_a2_map
+"""
+
+import argparse
+import os
+import sys
+
+# --- Make src importable (NO BLANK PATHS) ---
+SRC_DIR = "/Users/tonymolino/Dropbox/Mac/Desktop/PyProjects/Value_Divergence/Value_Divergence_Code/src"
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+from make_optimal_a2_map import parse_shard, run_sweep_shard, merge_sweep_shards  # noqa: E402
+from optimize_a2 import ConsoleProgress  # noqa: E402
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Sharded (r1, r2) opposites-attract sweep.")
+    mode = ap.add_mutually_exclusive_group(required=True)
+    mode.add_argument("--shard", help="run shard i of N, written as i/N (0-based)")
+    mode.add_argument("--merge", type=int, metavar="N", help="validate and merge N finished shards")
+    ap.add_argument("--out", required=True, help="shared output folder")
+    ap.add_argument("--r1", nargs=3, type=float, default=[0.5, 2.0, 16], metavar=("MIN", "MAX", "STEPS"))
+    ap.add_argument("--r2", nargs=3, type=float, default=[0.5, 2.0, 16], metavar=("MIN", "MAX", "STEPS"))
+    ap.add_argument("--a1", nargs=3, type=float, default=[0.01, 0.99, 101], metavar=("MIN", "MAX", "STEPS"))
+    ap.add_argument("--c", type=float, default=1.0)
+    ap.add_argument("--workers", type=int, default=1, help="processes per host")
+    ap.add_argument("--no-raw", action="store_true", help="skip the per-a1 raw CSV")
+    args = ap.parse_args()
+
+    if args.merge is not None:
+        summary, raw = merge_sweep_shards(
+            out_dir=args.out, n_shards=args.merge,
+            summary_path=os.path.join(args.out, "opposites_attract_grid_summary.csv"),
+            raw_path=None if args.no_raw else os.path.join(args.out, "opposites_attract_grid_raw.csv"),
+        )
+        print("Merged summary:", summary)
+        if raw:
+            print("Merged raw:", raw)
+        return
+
+    shard_index, n_shards = parse_shard(args.shard)
+    summary, raw = run_sweep_shard(
+        shard_index=shard_index, n_shards=n_shards, out_dir=args.out, write_raw=not args.no_raw,
+        r1_min=args.r1[0], r1_max=args.r1[1], r1_steps=int(args.r1[2]),
+        r2_min=args.r2[0], r2_max=args.r2[1], r2_steps=int(args.r2[2]),
+        a1_min=args.a1[0], a1_max=args.a1[1], a1_steps=int(args.a1[2]),
+        c=args.c, workers=args.workers, progress=ConsoleProgress(),
+    )
+    print(f"Shard {shard_index}/{n_shards} summary:", summary)
+    if raw:
+        print(f"Shard {shard_index}/{n_shards} raw:", raw)
+
+
+if __name__ == "__main__":
+    main()
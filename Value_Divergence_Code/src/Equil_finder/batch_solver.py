@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""
+Vectorized version of solve_two_task_cobb_douglas_equilibrium for many parameter vectors at once.
+
+Same Table-1 case selection (mask_sampler.table1_pass) and the same closed-form efforts per
+mask as Finding_Equilibrium_1._solve_for_mask, evaluated with numpy over whole arrays.
+For each row it reports the *primary* mask, i.e. the first passing mask in sorted order
+(the row the dataset scripts record when several masks match), the efforts under that mask,
+and how many masks matched. Rows with no feasible mask get mask code -1 and NaN efforts.
+
+No diagnostics / candidates are built; use the scalar solver to inspect a single point.
+"""
+
+from __future__ import annotations
+
+from typing import Dict
+
+from .mask_sampler import MASKS, PARAM_NAMES, table1_pass
+
+# masks in sorted order: the primary mask of a multi-match row is the first passing one here
+_PRIMARY_ORDER = tuple(sorted(MASKS))
+
+
+def _efforts_by_mask(a1, a2, c1, c2, p1x, p1y, p2x, p2y) -> Dict:
+    """
+    {mask: (x1, y1, x2, y2)} for every row, as if that mask were selected. Only arithmetic
+    and ** are used, so any number type works (optimize_a2.sensitivity passes hyper-duals).
+    """
+    r1 = (a1 * p1y) / ((1.0 - a1) * p1x)
+    r2 = (a2 * p2y) / ((1.0 - a2) * p2x)
+    KXY = (a2 * c1 * (p2y ** 2.0)) / ((1.0 - a1) * c2 * (p1x ** 2.0))
+    KYX = (a1 * c2 * (p1y ** 2.0)) / ((1.0 - a2) * c1 * (p2x ** 2.0))
+    r_star_XY = KXY ** (1.0 / (2.0 + a1 - a2))
+    r_star_YX = KYX ** (1.0 / (2.0 + a2 - a1))
+    zero = 0.0 * a1
+    out = {}
+
+    # (B,X)
+    r = r1
+    s1 = ((1.0 - a1) * p1x / c1) * (r ** a1)
+    s2 = ((1.0 - a2) * p2x / c2) * (r ** a2)
+    y1 = (r * (p1x * s1 + p2x * s2)) / (p1y + r * p1x)
+    out["B,X"] = (s1 - y1, y1, s2, zero)
+
+    # (X,B)
+    r = r2
+    s2 = ((1.0 - a2) * p2x / c2) * (r ** a2)
+    s1 = ((1.0 - a1) * p1x / c1) * (r ** a1)
+    y2 = (r * (p1x * s1 + p2x * s2)) / (p2y + r * p2x)
+    out["X,B"] = (s1, zero, s2 - y2, y2)
+
+    # (B,Y)
+    r = r1
+    s1 = ((1.0 - a1) * p1x / c1) * (r ** a1)
+    s2 = (a2 * p2y / c2) * (r ** (a2 - 1.0))
+    y1 = (r * p1x * s1 - p2y * s2) / (p1y + r * p1x)
+    out["B,Y"] = (s1 - y1, y1, zero, s2)
+
+    # (Y,B)
+    r = r2
+    s2 = ((1.0 - a2) * p2x / c2) * (r ** a2)
+    s1 = (a1 * p1y / c1) * (r ** (a1 - 1.0))
+    y2 = (r * p2x * s2 - p1y * s1) / (p2y + r * p2x)
+    out["Y,B"] = (zero, s1, s2 - y2, y2)
+
+    # (X,Y)
+    r = r_star_XY
+    out["X,Y"] = (((1.0 - a1) * p1x / c1) * (r ** a1), zero, zero, (a2 * p2y / c2) * (r ** (a2 - 1.0)))
+
+    # (Y,X)
+    r = r_star_YX
+    out["Y,X"] = (zero, (a1 * p1y / c1) * (r ** (a1 - 1.0)), ((1.0 - a2) * p2x / c2) * (r ** a2), zero)
+
+    # (B,B): equal fraction to X
+    r = r1
+    s1 = ((1.0 - a1) * p1x / c1) * (r ** a1)
+    s2 = ((1.0 - a2) * p2x / c2) * (r ** a2)
+    SX = p1x * s1 + p2x * s2
+    SY = p1y * s1 + p2y * s2
+    lam = SY / (SY + r * SX)
+    out["B,B"] = (lam * s1, (1.0 - lam) * s1, lam * s2, (1.0 - lam) * s2)
+    return out
+
+
+def solve_equilibrium_batch(params: Dict, tol: float = 1e-10) -> Dict:
+    """
+    params: {name: array} for a1, a2, c1, c2, p1x, p1y, p2x, p2y (equal lengths).
+    Returns {"x1", "y1", "x2", "y2": float arrays, "mask": int8 code into MASKS (-1: none),
+             "n_masks": int8 number of passing masks}.
+    """
+    import numpy as np
+
+    arrs = [np.asarray(params[k], dtype=float) for k in PARAM_NAMES]
+    passing = table1_pass(dict(zip(PARAM_NAMES, arrs)), tol)
+    n_masks = np.sum([passing[m] for m in MASKS], axis=0).astype(np.int8)
+
+    with np.errstate(divide="ignore", over="ignore", invalid="ignore"):
+        efforts = _efforts_by_mask(*arrs)
+    n = len(arrs[0])
+    x = {k: np.full(n, np.nan) for k in ("x1", "y1", "x2", "y2")}
+    code = np.full(n, -1, dtype=np.int8)
+    unset = np.ones(n, dtype=bool)
+    for m in _PRIMARY_ORDER:
+        pick = unset & passing[m]
+        for k, col in zip(("x1", "y1", "x2", "y2"), efforts[m]):
+            x[k][pick] = col[pick]
+        code[pick] = MASKS.index(m)
+        unset &= ~pick
+    return dict(x, mask=code, n_masks=n_masks)
@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+"""
+Exact best responses and KKT residuals for the two-task Cobb–Douglas team game, vectorized.
+
+Player i (a = a_i, c = c_i, own efforts x, y >= 0, opponent held fixed) maximizes
+    U_i = X^(1-a) Y^a - (c/2)(x + y)²,   X = p1x x1 + p2x x2,   Y = p1y y1 + p2y y2.
+X^(1-a) Y^a is concave (degree-1 homogeneous Cobb–Douglas) and X, Y are linear in own
+effort, so U_i is concave on the orthant: a KKT point is the global best response, and
+the best response is the best of
+  - the interior KKT point: Y/X = r_i (r1 = a1 p1y / ((1-a1) p1x), likewise r2) and
+    c (x + y) = (1-a) p_ix r_i^a, kept only where both efforts are >= 0 (closed form);
+  - the best point on each face (only x, or only y): a 1-D concave problem
+    max_t K (B + p t)^e - (c/2) t², solved to full double precision by Newton steps on its
+    decreasing derivative, safeguarded by bisection inside [0, (e p^e K / c)^(1/(2-e))];
+  - the corner x = y = 0.
+No step size is involved, so deviations of any size are covered and boundary rows are
+handled exactly (unlike the ±delta stencil of local_nash).
+
+verify_equilibrium_batch reports per row the best responses, the largest profitable
+deviation (U_i at the best response minus U_i at the given efforts) and the KKT natural
+residual max |min(v, -∂U_i/∂v)| over own variables v; verify_equilibrium_csv streams a CSV
+through it in chunks like check_equilibrium_csv.
+"""
+
+from __future__ import annotations
+
+import csv
+from typing import Dict, List, Tuple
+
+from .local_nash import REQUIRED_COLS, _stream_csv
+
+OUT_COLS = REQUIRED_COLS + [
+    "BR_x1", "BR_y1", "BR_x2", "BR_y2", "MaxGain_P1", "MaxGain_P2", "KKT_P1", "KKT_P2",
+    "IsBR_P1", "IsBR_P2", "IsNash",
+]
+_MAX_ITERS = 200
+
+
+def _split(cols: Dict, player: int):
+    """(a, c, own p_x, own p_y, opponent's X and Y contributions) for player 1 or 2."""
+    o = 3 - player
+    return (cols[f"a{player}"], cols[f"c{player}"], cols[f"p{player}x"], cols[f"p{player}y"],
+            cols[f"p{o}x"] * cols[f"x{o}"], cols[f"p{o}y"] * cols[f"y{o}"])
+
+
+def _utility(X, Y, a, c, s):
+    import numpy as np
+
+    with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+        return (X ** (1.0 - a)) * (Y ** a) - 0.5 * c * s ** 2
+
+
+def _face_max(K, B, p, e, c):
+    """argmax_{t >= 0} K (B + p t)^e - (c/2) t² for arrays (K, B >= 0, 0 < e < 1)."""
+    import numpy as np
+
+    with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+        lo = np.zeros_like(K)
+        hi = (e * p ** e * K / c) ** (1.0 / (2.0 - e))
+        hi = np.where(np.isfinite(hi), hi, 0.0)
+        # g (the derivative) is convex and decreasing in t, so Newton from the left stays left of
+        # the root and converges monotonically; [lo, hi] still brackets it (bisection fallback).
+        # With B = 0 the upper bracket end is the exact root.
+        t = np.where(B > 0.0, lo, hi)
+        for _ in range(_MAX_ITERS):
+            g = e * p * K * (B + p * t) ** (e - 1.0) - c * t
+            up = g > 0.0
+            lo = np.where(up, t, lo)
+            hi = np.where(up, hi, t)
+            dg = e * (e - 1.0) * p * p * K * (B + p * t) ** (e - 2.0) - c
+            t_new = t - g / dg
+            t_new = np.where((t_new >= lo) & (t_new <= hi), t_new, 0.5 * (lo + hi))
+            done = (g == 0.0) | (np.abs(t_new - t) <= 2e-15 * t) | (hi - lo <= 2e-15 * hi)
+            t = t_new
+            if np.all(done):
+                break
+    return t
+
+
+def best_response_batch(cols: Dict, player: int) -> Dict:
+    """
+    Player's exact best response to the opponent's efforts in cols (column arrays of
+    REQUIRED_COLS): {"x", "y", "u"} arrays (u = utility at the best response).
+    """
+    import numpy as np
+
+    a, c, px, py, Xo, Yo = _split(cols, player)
+    zero = np.zeros_like(a)
+    with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+        r = (a * py) / ((1.0 - a) * px)
+        s = ((1.0 - a) * px / c) * r ** a
+        y_in = (r * (px * s + Xo) - Yo) / (py + r * px)
+        x_in = s - y_in
+        interior = (x_in >= 0.0) & (y_in >= 0.0)
+
+        x_face = _face_max(Yo ** a, Xo, px, 1.0 - a, c)
+        y_face = _face_max(Xo ** (1.0 - a), Yo, py, a, c)
+
+    cands = [
+        (np.where(interior, x_in, np.nan), np.where(interior, y_in, np.nan)),
+        (x_face, zero),
+        (zero, y_face),
+        (zero, zero),
+    ]
+    best_x, best_y = zero.copy(), zero.copy()
+    best_u = np.full(len(a), -np.inf)
+    for x, y in cands:
+        u = _utility(Xo + px * x, Yo + py * y, a, c, x + y)
+        better = u > best_u
+        best_x = np.where(better, x, best_x)
+        best_y = np.where(better, y, best_y)
+        best_u = np.where(better, u, best_u)
+    return {"x": best_x, "y": best_y, "u": best_u}
+
+
+def kkt_residual_batch(cols: Dict, player: int):
+    """
+    KKT natural residual max(|min(x, -∂U/∂x)|, |min(y, -∂U/∂y)|) at the player's given
+    efforts: 0 exactly at a best response; inf where a marginal product is unbounded.
+    """
+    import numpy as np
+
+    a, c, px, py, Xo, Yo = _split(cols, player)
+    x, y = cols[f"x{player}"], cols[f"y{player}"]
+    X, Y = Xo + px * x, Yo + py * y
+    with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+        gx = (1.0 - a) * px * (Y / X) ** a - c * (x + y)
+        gy = a * py * (X / Y) ** (1.0 - a) - c * (x + y)
+        res = np.maximum(np.abs(np.minimum(x, -gx)), np.abs(np.minimum(y, -gy)))
+    return np.where((x < 0.0) | (y < 0.0), np.inf, res)
+
+
+def verify_equilibrium_batch(cols: Dict, tol: float = 1e-10) -> Dict:
+    """
+    Exact equilibrium check for column arrays of REQUIRED_COLS: best responses BR_*,
+    MaxGain_P{1,2} (largest profitable deviation, >= 0 up to rounding), KKT_P{1,2}, and
+    IsBR_P{1,2} / IsNash (MaxGain <= tol · max(1, |U at the best response|)).
+    Rows with a negative effort (either player) get MaxGain = inf; NaN efforts give NaN.
+    """
+    import numpy as np
+
+    out: Dict = {}
+    infeasible = np.any([cols[k] < 0.0 for k in ("x1", "y1", "x2", "y2")], axis=0)
+    for p in (1, 2):
+        br = best_response_batch(cols, p)
+        a, c, px, py, Xo, Yo = _split(cols, p)
+        x, y = cols[f"x{p}"], cols[f"y{p}"]
+        u_now = _utility(Xo + px * x, Yo + py * y, a, c, x + y)
+        gain = np.where(infeasible, np.inf, br["u"] - u_now)
+        out[f"BR_x{p}"], out[f"BR_y{p}"] = br["x"], br["y"]
+        out[f"MaxGain_P{p}"] = gain
+        out[f"KKT_P{p}"] = kkt_residual_batch(cols, p)
+        with np.errstate(invalid="ignore"):
+            out[f"IsBR_P{p}"] = gain <= tol * np.maximum(1.0, np.abs(br["u"]))
+    out["IsNash"] = out["IsBR_P1"] & out["IsBR_P2"]
+    return out
+
+
+def _verify_chunk(rows: List[List[str]], tol: float) -> Tuple[int, str]:
+    """Worker entry point: string rows (REQUIRED_COLS order) -> (n_rows, output CSV text)."""
+    import io
+
+    import numpy as np
+
+    data = np.asarray(rows, dtype=float).reshape(len(rows), len(REQUIRED_COLS))
+    res = verify_equilibrium_batch({k: data[:, i] for i, k in enumerate(REQUIRED_COLS)}, tol)
+    numeric = np.column_stack([data] + [res[k] for k in OUT_COLS[len(REQUIRED_COLS):-3]]).tolist()
+    flags = zip(*[["Yes" if b else "No" for b in res[k]] for k in OUT_COLS[-3:]])
+    buf = io.StringIO(newline="")
+    csv.writer(buf).writerows(vals + list(f) for vals, f in zip(numeric, flags))
+    return len(rows), buf.getvalue()
+
+
+def verify_equilibrium_csv(
+    input_csv: str,
+    output_csv: str,
+    *,
+    tol: float = 1e-10,
+    chunk_rows: int = 200_000,
+    workers: int = 1,
+) -> int:
+    """
+    Exact best-response check of every row of input_csv (needs REQUIRED_COLS), written to
+    output_csv with OUT_COLS. Chunked / parallel exactly like check_equilibrium_csv.
+    Returns the number of rows written.
+    """
+    return _stream_csv(input_csv, output_csv, OUT_COLS, _verify_chunk, tol, chunk_rows=chunk_rows, workers=workers)
@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+"""
+Large random equilibrium datasets: parallel, chunked, reproducible, resumable.
+
+generate_equilibrium_dataset(out_dir, n_rows=..., seed=...) writes
+    chunk-00000.<npz|csv>, chunk-00001.<npz|csv>, ...   chunk_rows rows each (last one shorter)
+    manifest.json                                       parameters, chunk list, completion flag
+Columns: a1, a2, c1, c2, p1x, p1y, p2x, p2y, x1, y1, x2, y2, mask (primary mask, see
+batch_solver), MultipleMatches ("Yes"/"No" in CSV, bool in npz).
+
+Reproducibility: chunk k draws from its own stream, SeedSequence(seed).spawn(n_chunks)[k]
+(numpy's independent child streams). The data therefore depend only on (seed, n_rows,
+chunk_rows, bounds, quotas), never on the worker count or on which chunks were resumed.
+Each chunk draws parameters in vectorized batches (optional per-mask quotas via
+mask_sampler, the rest uniform inside the bounds with infeasible draws screened out) and solves
+them with solve_equilibrium_batch. Chunks are written tmp + rename, so an interrupted run
+resumes by skipping the chunk files already listed in the manifest.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+from .batch_solver import solve_equilibrium_batch
+from .mask_sampler import MASKS, PARAM_NAMES, sample_mask_params, table1_pass
+
+DEFAULT_BOUNDS: Dict[str, Tuple[float, float]] = {
+    "a1":  (0.05, 0.95),
+    "a2":  (0.05, 0.95),
+    "c1":  (0.50, 2.00),
+    "c2":  (0.50, 2.00),
+    "p1x": (0.50, 2.00),
+    "p1y": (0.50, 2.00),
+    "p2x": (0.50, 2.00),
+    "p2y": (0.50, 2.00),
+}
+COLUMNS = list(PARAM_NAMES) + ["x1", "y1", "x2", "y2", "mask", "MultipleMatches"]
+
+
+def _chunk_rng(seed: int, n_chunks: int, k: int):
+    import numpy as np
+
+    return np.random.default_rng(np.random.SeedSequence(int(seed)).spawn(int(n_chunks))[k])
+
+
+def _chunk_name(k: int, fmt: str) -> str:
+    return f"chunk-{k:05d}.{fmt}"
+
+
+def _draw_feasible(rng, n: int, bounds, tol: float) -> Dict:
+    """n uniform draws inside bounds that pass at least one Table-1 test (vectorized batches)."""
+    import numpy as np
+
+    eps = 1e-12
+    parts: List[Dict] = []
+    have = 0
+    while have < n:
+        m = max(1024, 2 * (n - have))
+        batch = {k: rng.uniform(bounds[k][0] + eps, bounds[k][1] - eps, size=m) for k in PARAM_NAMES}
+        ok = np.any(np.stack(list(table1_pass(batch, tol).values())), axis=0)
+        parts.append({k: v[ok] for k, v in batch.items()})
+        have += int(ok.sum())
+    return {k: np.concatenate([p[k] for p in parts])[:n] for k in PARAM_NAMES}
+
+
+def _draw_and_solve(k: int, n_chunks: int, n: int, cfg: Dict) -> Dict:
+    """Columns (COLUMNS, mask as int8 code, MultipleMatches as bool) of the n rows of chunk k."""
+    import numpy as np
+
+    rng = _chunk_rng(cfg["seed"], n_chunks, k)
+    bounds = {name: tuple(b) for name, b in cfg["bounds"].items()}
+    parts = []
+    n_quota = 0
+    for mask in MASKS:
+        q = min(int(cfg["min_per_mask_per_chunk"]), n - n_quota)
+        if q > 0:
+            parts.append(sample_mask_params(mask, q, bounds, rng=rng, method=cfg["method"], tol=cfg["tol"]))
+            n_quota += q
+    if n - n_quota > 0:
+        parts.append(_draw_feasible(rng, n - n_quota, bounds, cfg["tol"]))
+    params = {name: np.concatenate([p[name] for p in parts]) for name in PARAM_NAMES}
+    sol = solve_equilibrium_batch(params, cfg["tol"])
+
+    cols = dict(params)
+    cols.update({name: sol[name] for name in ("x1", "y1", "x2", "y2")})
+    cols["mask"] = sol["mask"]
+    cols["MultipleMatches"] = sol["n_masks"] > 1
+    return cols
+
+
+def _make_chunk(out_dir: str, k: int, n_chunks: int, n: int, cfg: Dict) -> Dict:
+    """Worker entry point: draw, solve and write chunk k; returns its manifest entry."""
+    import numpy as np
+
+    cols = _draw_and_solve(k, n_chunks, n, cfg)
+    name = _chunk_name(k, cfg["fmt"])
+    path = os.path.join(out_dir, name)
+    tmp = path + ".tmp"
+    if cfg["fmt"] == "csv":
+        import csv
+
+        mask_names = np.array(list(MASKS) + [""], dtype=object)  # code -1 -> ""
+        with open(tmp, "w", newline="") as f:
+            w = csv.writer(f)
+            w.writerow(COLUMNS)
+            numeric = [cols[c].tolist() for c in COLUMNS[:-2]]
+            masks = mask_names[cols["mask"]].tolist()
+            multi = ["Yes" if v else "No" for v in cols["MultipleMatches"]]
+            w.writerows(zip(*numeric, masks, multi))
+    else:
+        with open(tmp, "wb") as f:
+            np.savez(f, **cols)
+    os.replace(tmp, path)
+    return {"index": k, "file": name, "n_rows": int(n), "n_no_mask": int((cols["mask"] < 0).sum()),
+            "mask_counts": {m: int((cols["mask"] == i).sum()) for i, m in enumerate(MASKS)}}
+
+
+def _write_manifest(path: str, manifest: Dict) -> None:
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(dict(manifest, updated=time.strftime("%Y-%m-%dT%H:%M:%S")), f, indent=2, sort_keys=True)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def generate_equilibrium_dataset(
+    out_dir: str,
+    *,
+    n_rows: int,
+    seed: int = 424242,
+    bounds: Optional[Dict[str, Tuple[float, float]]] = None,
+    chunk_rows: int = 1_000_000,
+    fmt: str = "npz",
+    workers: int = 1,
+    min_per_mask_per_chunk: int = 0,
+    method: str = "construct",
+    tol: float = 1e-10,
+    resume: bool = True,
+    progress=None,
+) -> Dict:
+    """
+    Generate n_rows solved random parameter vectors into out_dir (see module docstring).
+
+    fmt: "npz" (binary columns) or "csv". min_per_mask_per_chunk > 0 puts that many rows of
+    every mask at the start of each chunk (drawn with mask_sampler, `method`).
+    workers > 1 builds chunks in a process pool; the output is identical for any worker count.
+    progress: optimize_a2.telemetry observer(s); one unit = one row, failures = rows without a mask.
+    Returns the manifest dict. Resuming with different parameters raises ValueError.
+    """
+    if fmt not in ("npz", "csv"):
+        raise ValueError("fmt must be 'npz' or 'csv'.")
+    if n_rows < 1 or chunk_rows < 1:
+        raise ValueError("Require n_rows >= 1 and chunk_rows >= 1.")
+    cfg = {
+        "n_rows": int(n_rows), "seed": int(seed), "chunk_rows": int(chunk_rows), "fmt": fmt,
+        "bounds": {k: list(v) for k, v in (bounds or DEFAULT_BOUNDS).items()},
+        "min_per_mask_per_chunk": int(min_per_mask_per_chunk), "method": method, "tol": float(tol),
+    }
+    n_chunks = -(-int(n_rows) // int(chunk_rows))
+    sizes = [min(int(chunk_rows), int(n_rows) - k * int(chunk_rows)) for k in range(n_chunks)]
+
+    os.makedirs(out_dir, exist_ok=True)
+    manifest_path = os.path.join(out_dir, "manifest.json")
+    done: Dict[int, Dict] = {}
+    if resume and os.path.exists(manifest_path):
+        with open(manifest_path, "r") as f:
+            old = json.load(f)
+        if old.get("params") != cfg:
+            raise ValueError(f"{out_dir} holds a dataset with different parameters; "
+                             "use another out_dir or resume=False.")
+        done = {ch["index"]: ch for ch in old.get("chunks", [])
+                if os.path.exists(os.path.join(out_dir, ch["file"]))}
+
+    def save() -> Dict:
+        chunks = [done[k] for k in sorted(done)]
+        manifest = {"params": cfg, "columns": COLUMNS, "masks": list(MASKS), "n_chunks": n_chunks,
+                    "chunks": chunks, "n_rows_done": sum(ch["n_rows"] for ch in chunks),
+                    "complete": len(done) == n_chunks}
+        _write_manifest(manifest_path, manifest)
+        return manifest
+
+    from optimize_a2.telemetry import ProgressTracker
+
+    todo = [k for k in range(n_chunks) if k not in done]
+    tracker = ProgressTracker(progress, label="dataset")
+    tracker.start(sum(sizes[k] for k in todo))
+    manifest = save()
+
+    def finished(entry: Dict) -> None:
+        nonlocal manifest
+        done[entry["index"]] = entry
+        manifest = save()
+        tracker.update(units=entry["n_rows"], failures=entry["n_no_mask"])
+
+    if int(workers) <= 1:
+        for k in todo:
+            finished(_make_chunk(out_dir, k, n_chunks, sizes[k], cfg))
+    else:
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        with ProcessPoolExecutor(max_workers=int(workers)) as pool:
+            futures = [pool.submit(_make_chunk, out_dir, k, n_chunks, sizes[k], cfg) for k in todo]
+            for fut in as_completed(futures):
+                finished(fut.result())
+    tracker.finish()
+    return manifest
+
+
+def load_equilibrium_dataset(out_dir: str) -> Dict:
+    """Concatenate all chunks of a generated dataset into {column: ndarray} (npz or csv)."""
+    import numpy as np
+
+    with open(os.path.join(out_dir, "manifest.json"), "r") as f:
+        manifest = json.load(f)
+    parts = []
+    for ch in manifest["chunks"]:
+        path = os.path.join(out_dir, ch["file"])
+        if path.endswith(".npz"):
+            with np.load(path) as z:
+                parts.append({k: z[k] for k in z.files})
+        else:
+            import csv
+
+            with open(path, "r", newline="") as f:
+                rows = list(csv.reader(f))
+            header, body = rows[0], rows[1:]
+            cols = {h: [r[i] for r in body] for i, h in enumerate(header)}
+            part = {h: np.asarray(cols[h], dtype=float) for h in header[:-2]}
+            part["mask"] = np.asarray([MASKS.index(m) if m else -1 for m in cols["mask"]], dtype=np.int8)
+            part["MultipleMatches"] = np.asarray([v == "Yes" for v in cols["MultipleMatches"]])
+            parts.append(part)
+    if not parts:
+        return {}
+    return {k: np.concatenate([p[k] for p in parts]) for k in parts[0]}
@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+"""
+Vectorized local-Nash check for tables of (parameters, efforts), chunked and optionally parallel.
+
+Same test as Scripts/Checking Equilibrium/Checking_Equil_From_Csv.py: a player passes
+(IsBR) if no move of its own variables by delta · s, s in {-1, 0, +1}^k \\ {0}, raises its
+utility by more than tol, opponent held fixed. A move that takes an own variable below
+-1e-15 is skipped; one that lands in [-1e-15, 0) is clamped to 0. Utilities are -inf where
+X <= 0 or Y <= 0, exactly as U1 / U2 there.
+
+Here every stencil move is one array operation over all rows of a chunk, instead of a dict
+copy plus a scalar utility call per row. check_local_best_response_batch takes any
+vectorized payoff and any number of own variables; check_local_nash_batch applies it to the
+two-player game; check_equilibrium_csv streams a CSV through it in chunks (workers > 1
+spreads chunks over processes, output order unchanged) and writes the same
+IsBR_P1 / IsBR_P2 / IsLocalNash columns as the scalar script.
+"""
+
+from __future__ import annotations
+
+import csv
+import itertools
+import os
+from collections import deque
+from typing import Callable, Dict, Iterator, List, Sequence, Tuple
+
+REQUIRED_COLS = ["a1", "a2", "c1", "c2", "p1x", "p1y", "p2x", "p2y", "x1", "y1", "x2", "y2"]
+OWN_VARS = {1: ("x1", "y1"), 2: ("x2", "y2")}
+_NEG_TOL = 1e-15
+
+
+def utility_batch(cols: Dict, player: int):
+    """U1 (player=1) or U2 (player=2) of the Cobb–Douglas team game, for arrays of rows."""
+    import numpy as np
+
+    X = cols["p1x"] * cols["x1"] + cols["p2x"] * cols["x2"]
+    Y = cols["p1y"] * cols["y1"] + cols["p2y"] * cols["y2"]
+    a, c = cols[f"a{player}"], cols[f"c{player}"]
+    own = cols[f"x{player}"] + cols[f"y{player}"]
+    with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+        u = (X ** (1.0 - a)) * (Y ** a) - 0.5 * c * own ** 2
+    # (X <= 0) is False for NaN, so NaN rows stay NaN (and never count as profitable), as in the scalar U
+    return np.where((X <= 0.0) | (Y <= 0.0), -np.inf, u)
+
+
+def stencil(k: int) -> List[Tuple[int, ...]]:
+    """All non-zero vectors of {-1, 0, +1}^k, in the scalar checker's order."""
+    if k < 1:
+        raise ValueError("Need at least one own variable.")
+    return [s for s in itertools.product((-1, 0, 1), repeat=k) if any(s)]
+
+
+def check_local_best_response_batch(
+    payoff: Callable[[Dict], "object"],
+    cols: Dict,
+    own_vars: Sequence[str],
+    delta: float = 1e-4,
+    tol: float = 1e-10,
+):
+    """
+    Bool array: True where no feasible stencil move of own_vars (see module docstring)
+    raises payoff(cols) by more than tol. payoff maps a column dict to an array of utilities.
+    """
+    import numpy as np
+
+    u0 = payoff(cols)
+    is_br = np.ones(len(u0), dtype=bool)
+    base = {name: cols[name] for name in own_vars}
+    for steps in stencil(len(own_vars)):
+        moved = dict(cols)
+        feasible = np.ones(len(u0), dtype=bool)
+        for name, s in zip(own_vars, steps):
+            v = base[name] + delta * float(s)
+            feasible &= ~(v < -_NEG_TOL)
+            moved[name] = np.where(v < 0.0, 0.0, v)
+        with np.errstate(invalid="ignore"):
+            gain = payoff(moved) - u0
+        is_br &= ~(feasible & (gain > tol))
+    return is_br
+
+
+def check_local_nash_batch(cols: Dict, delta: float = 1e-4, tol: float = 1e-10) -> Dict:
+    """{"IsBR_P1", "IsBR_P2", "IsLocalNash": bool arrays} for column arrays of REQUIRED_COLS."""
+    out = {
+        f"IsBR_P{p}": check_local_best_response_batch(
+            lambda v, p=p: utility_batch(v, p), cols, OWN_VARS[p], delta, tol)
+        for p in (1, 2)
+    }
+    out["IsLocalNash"] = out["IsBR_P1"] & out["IsBR_P2"]
+    return out
+
+
+def _check_chunk(rows: List[List[str]], delta: float, tol: float) -> Tuple[int, str]:
+    """Worker entry point: string rows (REQUIRED_COLS order) -> (n_rows, output CSV text)."""
+    import io
+
+    import numpy as np
+
+    data = np.asarray(rows, dtype=float).reshape(len(rows), len(REQUIRED_COLS))
+    cols = {k: data[:, i] for i, k in enumerate(REQUIRED_COLS)}
+    flags = check_local_nash_batch(cols, delta, tol)
+    yes_no = [["Yes" if b else "No" for b in flags[k]] for k in ("IsBR_P1", "IsBR_P2", "IsLocalNash")]
+    buf = io.StringIO(newline="")
+    csv.writer(buf).writerows(vals + list(f) for vals, f in zip(data.tolist(), zip(*yes_no)))
+    return len(rows), buf.getvalue()
+
+
+def _read_chunks(path: str, chunk_rows: int) -> Iterator[List[List[str]]]:
+    with open(path, "r", newline="", encoding="utf-8") as fin:
+        reader = csv.reader(fin)
+        header = next(reader, None) or []
+        missing = [c for c in REQUIRED_COLS if c not in header]
+        if missing:
+            raise KeyError(f"Input CSV missing required column: {missing[0]}")
+        idx = [header.index(c) for c in REQUIRED_COLS]
+        while True:
+            block = [[r[i] for i in idx] for r in itertools.islice(reader, chunk_rows)]
+            if not block:
+                return
+            yield block
+
+
+def _stream_csv(
+    input_csv: str,
+    output_csv: str,
+    header: Sequence[str],
+    chunk_fn: Callable[..., Tuple[int, str]],
+    *chunk_args,
+    chunk_rows: int,
+    workers: int,
+) -> int:
+    """
+    Shared driver of the CSV checkers: write `header`, then chunk_fn(block, *chunk_args) -> (n_rows,
+    CSV text) for every chunk of input_csv, in input order. workers > 1 keeps up to 2·workers
+    chunks in flight in a process pool (chunk_fn must be a module-level function). Returns the
+    number of rows written.
+    """
+    out_dir = os.path.dirname(output_csv)
+    if out_dir:
+        os.makedirs(out_dir, exist_ok=True)
+    wrote = 0
+    with open(output_csv, "w", newline="", encoding="utf-8") as fout:
+        csv.writer(fout).writerow(header)
+        chunks = _read_chunks(input_csv, int(chunk_rows))
+
+        def emit(result: Tuple[int, str]) -> None:
+            nonlocal wrote
+            fout.write(result[1])
+            wrote += result[0]
+
+        if int(workers) <= 1:
+            for block in chunks:
+                emit(chunk_fn(block, *chunk_args))
+            return wrote
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=int(workers)) as pool:
+            pending: deque = deque()
+            for block in chunks:
+                pending.append(pool.submit(chunk_fn, block, *chunk_args))
+                while len(pending) >= 2 * int(workers):
+                    emit(pending.popleft().result())
+            while pending:
+                emit(pending.popleft().result())
+    return wrote
+
+
+def check_equilibrium_csv(
+    input_csv: str,
+    output_csv: str,
+    *,
+    delta: float = 1e-4,
+    tol: float = 1e-10,
+    chunk_rows: int = 200_000,
+    workers: int = 1,
+) -> int:
+    """
+    Local-Nash check of every row of input_csv (needs REQUIRED_COLS, any order, extra columns
+    ignored), written to output_csv as REQUIRED_COLS + IsBR_P1, IsBR_P2, IsLocalNash (Yes/No).
+    Reads chunk_rows rows at a time; workers > 1 checks up to 2·workers chunks concurrently in
+    a process pool. Returns the number of rows written.
+    """
+    return _stream_csv(input_csv, output_csv, REQUIRED_COLS + ["IsBR_P1", "IsBR_P2", "IsLocalNash"],
+                       _check_chunk, delta, tol, chunk_rows=chunk_rows, workers=workers)
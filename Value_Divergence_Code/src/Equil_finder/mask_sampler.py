@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+"""
+Draw parameter vectors (a1, a2, c1, c2, p1x, p1y, p2x, p2y) that land in a requested mask.
+
+The Table-1 tests in Finding_Equilibrium_1.py depend on p2y only through
+    r2 = k·p2y,   k = a2 / ((1 − a2) p2x),
+    KXY = D·p2y², D = a2 c1 / ((1 − a1) c2 p1x²),
+and the (X,B) capacity bound, which is linear in p2y. With the other seven parameters fixed,
+every mask's inequalities therefore reduce to an interval of p2y (a single point for the
+knife-edge (B,B): r2 = r1). sample_mask_params draws the other seven uniformly inside the
+bounds, in batches, intersects the mask's p2y interval with the p2y bounds, and draws p2y
+uniformly inside it. Rows with an empty interval are dropped; every kept row is re-checked
+with the vectorized Table-1 tests (table1_pass), so the output always satisfies them.
+
+Note this is not the uniform distribution restricted to the mask region: p2y is uniform
+inside its feasible interval for each draw of the others. method="reject" gives that
+distribution instead (vectorized batch rejection on all eight parameters) at higher cost.
+method="auto" (the default) constructs, and falls back to rejection batches for the rest of the
+draws if a constructive batch yields no row that passes the re-check.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Optional, Tuple
+
+PARAM_NAMES = ("a1", "a2", "c1", "c2", "p1x", "p1y", "p2x", "p2y")
+MASKS = ("B,X", "X,B", "B,Y", "Y,B", "X,Y", "Y,X", "B,B")
+
+
+def table1_pass(params: Dict, tol: float = 1e-10) -> Dict:
+    """
+    Vectorized Table-1 feasibility tests of solve_two_task_cobb_douglas_equilibrium:
+    params maps each of PARAM_NAMES to equal-length arrays; returns {mask: bool array}.
+    Same formulas and tolerance rules as the scalar solver.
+    """
+    import numpy as np
+
+    a1, a2, c1, c2, p1x, p1y, p2x, p2y = (np.asarray(params[k], dtype=float) for k in PARAM_NAMES)
+    r1 = (a1 * p1y) / ((1.0 - a1) * p1x)
+    r2 = (a2 * p2y) / ((1.0 - a2) * p2x)
+    KXY = (a2 * c1 * (p2y ** 2.0)) / ((1.0 - a1) * c2 * (p1x ** 2.0))
+    KYX = (a1 * c2 * (p1y ** 2.0)) / ((1.0 - a2) * c1 * (p2x ** 2.0))
+    exp_XY = 2.0 + a1 - a2
+    exp_YX = 2.0 + a2 - a1
+    r_star_XY = KXY ** (1.0 / exp_XY)
+    r_star_YX = KYX ** (1.0 / exp_YX)
+
+    def geq(A, B):
+        return A >= B - tol
+
+    def leq(A, B):
+        return A <= B + tol
+
+    RHS_c2 = ((1.0 - a1) * p1y * p1x * c2) / ((1.0 - a2) * (p2x ** 2.0) * c1)
+    RHS_c2_XB = ((1.0 - a2) * p2y * p2x * c1) / ((1.0 - a1) * (p1x ** 2.0) * c2)
+    return {
+        "B,X": geq(r1, r2) & leq(r1 ** (1.0 + a2 - a1), RHS_c2),
+        "X,B": geq(r2, r1) & leq(r2 ** (1.0 + a1 - a2), RHS_c2_XB),
+        "B,Y": leq(r1, r2) & geq(r1 ** (2.0 + a1 - a2), KXY),
+        "Y,B": leq(r2, r1) & geq(r2 ** (2.0 + a2 - a1), KYX),
+        "X,Y": geq(r_star_XY, r1) & leq(r_star_XY, r2),
+        "Y,X": geq(r_star_YX, r2) & leq(r_star_YX, r1),
+        "B,B": np.abs(r1 - r2) <= tol,
+    }
+
+
+def _uniform(rng, bounds: Dict[str, Tuple[float, float]], names, n: int) -> Dict:
+    eps = 1e-12
+    return {k: rng.uniform(bounds[k][0] + eps, bounds[k][1] - eps, size=n) for k in names}
+
+
+def _p2y_interval(mask: str, p: Dict):
+    """
+    Feasible p2y interval [lo, hi] for `mask` given the other seven parameters (arrays).
+    Empty where lo > hi; for (B,B), lo == hi.
+    """
+    import numpy as np
+
+    a1, a2, c1, c2, p1x, p1y, p2x = (p[k] for k in PARAM_NAMES[:7])
+    n = len(a1)
+    lo = np.zeros(n)
+    hi = np.full(n, np.inf)
+    r1 = (a1 * p1y) / ((1.0 - a1) * p1x)
+    k = a2 / ((1.0 - a2) * p2x)           # r2 = k · p2y
+    D = a2 * c1 / ((1.0 - a1) * c2 * p1x ** 2.0)  # KXY = D · p2y²
+    KYX = (a1 * c2 * (p1y ** 2.0)) / ((1.0 - a2) * c1 * (p2x ** 2.0))
+    t_eq = r1 / k                           # p2y where r2 == r1
+
+    def upper_where(cond, value):
+        np.minimum(hi, np.where(cond, value, np.inf), out=hi)
+
+    def lower_where(cond, value):
+        np.maximum(lo, np.where(cond, value, 0.0), out=lo)
+
+    def never(cond):
+        lo[cond] = np.inf
+
+    true = np.ones(n, dtype=bool)
+    with np.errstate(divide="ignore", over="ignore", invalid="ignore"):
+        if mask == "B,X":
+            upper_where(true, t_eq)
+            RHS = ((1.0 - a1) * p1y * p1x * c2) / ((1.0 - a2) * (p2x ** 2.0) * c1)
+            never(r1 ** (1.0 + a2 - a1) > RHS)
+        elif mask == "X,B":
+            lower_where(true, t_eq)
+            # (k t)^e <= C t  <=>  k^e t^(e-1) <= C
+            e = 1.0 + a1 - a2
+            C = (1.0 - a2) * p2x * c1 / ((1.0 - a1) * (p1x ** 2.0) * c2)
+            bound = (C / k ** e) ** (1.0 / (e - 1.0))
+            upper_where(e > 1.0, bound)
+            lower_where(e < 1.0, bound)
+            never((e == 1.0) & (k > C))
+        elif mask == "B,Y":
+            lower_where(true, t_eq)
+            upper_where(true, np.sqrt(r1 ** (2.0 + a1 - a2) / D))
+        elif mask == "Y,B":
+            upper_where(true, t_eq)
+            lower_where(true, KYX ** (1.0 / (2.0 + a2 - a1)) / k)
+        elif mask == "X,Y":
+            # r* = (D t²)^(1/e) >= r1  and  r* <= k t  <=>  D t^(2-e) <= k^e
+            e = 2.0 + a1 - a2
+            lower_where(true, np.sqrt(r1 ** e / D))
+            g = 2.0 - e
+            bound = (k ** e / D) ** (1.0 / g)
+            upper_where(g > 0.0, bound)
+            lower_where(g < 0.0, bound)
+            never((g == 0.0) & (D > k ** e))
+        elif mask == "Y,X":
+            r_star = KYX ** (1.0 / (2.0 + a2 - a1))
+            upper_where(true, r_star / k)
+            never(r_star > r1)
+        elif mask == "B,B":
+            lower_where(true, t_eq)
+            upper_where(true, t_eq)
+        else:
+            raise ValueError(f"Unknown mask {mask!r}; expected one of {MASKS}.")
+    return lo, hi
+
+
+def _constructive_batch(mask: str, n: int, bounds, rng, tol: float) -> Dict:
+    import numpy as np
+
+    p = _uniform(rng, bounds, PARAM_NAMES[:7], n)
+    lo, hi = _p2y_interval(mask, p)
+    eps = 1e-12
+    lo = np.maximum(lo, bounds["p2y"][0] + eps)
+    hi = np.minimum(hi, bounds["p2y"][1] - eps)
+    ok = lo <= hi if mask == "B,B" else lo < hi
+    p = {k: v[ok] for k, v in p.items()}
+    p["p2y"] = lo[ok] + rng.random(int(ok.sum())) * (hi[ok] - lo[ok])
+    return p
+
+
+def _reject_batch(mask: str, n: int, bounds, rng, tol: float) -> Dict:
+    return _uniform(rng, bounds, PARAM_NAMES, n)
+
+
+def sample_mask_params(
+    mask: str,
+    n: int,
+    bounds: Dict[str, Tuple[float, float]],
+    *,
+    rng=None,
+    method: str = "auto",
+    batch_size: int = 4096,
+    max_batches: int = 1000,
+    tol: float = 1e-10,
+) -> Dict:
+    """
+    n parameter vectors inside `bounds` ({name: (lo, hi)} for PARAM_NAMES) that pass the
+    Table-1 test of `mask`, as {name: ndarray of length n}.
+
+    method: "construct" (invert the inequalities for p2y, see module docstring), "reject"
+    (vectorized batch rejection) or "auto" (construct, switching to rejection once a
+    constructive batch yields nothing). Works in batches of batch_size draws; raises RuntimeError
+    after max_batches batches if the region is (nearly) empty inside the bounds.
+    rng: numpy Generator or seed.
+    """
+    import numpy as np
+
+    if mask not in MASKS:
+        raise ValueError(f"Unknown mask {mask!r}; expected one of {MASKS}.")
+    if method not in ("auto", "construct", "reject"):
+        raise ValueError("method must be 'auto', 'construct' or 'reject'.")
+    rng = rng if isinstance(rng, np.random.Generator) else np.random.default_rng(rng)
+    draw = _reject_batch if method == "reject" else _constructive_batch
+
+    parts = []
+    have = 0
+    for _ in range(int(max_batches)):
+        if have >= n:
+            break
+        p = draw(mask, int(batch_size), bounds, rng, tol)
+        keep = table1_pass(p, tol)[mask]
+        p = {k: v[keep] for k, v in p.items()}
+        parts.append(p)
+        have += int(keep.sum())
+        if method == "auto" and not keep.any():
+            draw = _reject_batch
+    if have < n:
+        raise RuntimeError(f"Only {have} of {n} draws for mask {mask} after {max_batches} batches of {batch_size}.")
+    return {k: np.concatenate([p[k] for p in parts])[:n] for k in PARAM_NAMES}
+
+
+def acceptance_rate(mask: str, bounds, *, method: str = "construct", n: int = 20000, rng: Optional[int] = 0,
+                    tol: float = 1e-10) -> float:
+    """Fraction of one batch of n draws that lands in `mask` (for choosing method / batch_size)."""
+    import numpy as np
+
+    rng = rng if isinstance(rng, np.random.Generator) else np.random.default_rng(rng)
+    draw = _reject_batch if method == "reject" else _constructive_batch
+    p = draw(mask, int(n), bounds, rng, tol)
+    return float(table1_pass(p, tol)[mask].sum()) / float(n)
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""
+Probability mass of each equilibrium regime inside a parameter box, by randomized quasi-Monte Carlo.
+
+estimate_mask_volumes(bounds, n) draws n points uniformly in the box (Sobol' with a random
+digital shift, Halton with a random rotation, or plain random points; param_sweep.sampling),
+applies the vectorized Table-1 tests (mask_sampler.table1_pass) and reports the share of
+the box where
+  - each mask's test passes ("membership"; masks can overlap),
+  - each mask is the primary one (first passing mask in sorted order, as batch_solver and
+    the dataset scripts record it; these shares partition the feasible region),
+  - several masks pass ("multi"), no mask passes ("none").
+(B,B) is the knife-edge |r1 − r2| <= tol, so its share scales with tol.
+
+Error bars: the n points are split into `replicates` independent randomizations (each with its
+own shift / rotation / stream from SeedSequence(seed).spawn). Each replicate gives an unbiased
+estimate; the result is their mean with standard error std / sqrt(replicates).
+Work runs in batches of batch_size points, spread over `workers` processes, with
+O(batch_size) memory per worker.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Optional, Sequence, Tuple
+
+from .mask_sampler import MASKS, PARAM_NAMES, table1_pass
+
+_PRIMARY_ORDER = tuple(sorted(MASKS))
+_CATEGORIES = ["member:" + m for m in MASKS] + ["primary:" + m for m in MASKS] + ["multi", "none"]
+
+
+def _replicate_seed(seed: int, replicates: int, r: int) -> int:
+    import numpy as np
+
+    return int(np.random.SeedSequence(int(seed)).spawn(int(replicates))[r].generate_state(1)[0])
+
+
+def _volume_batch(method: str, r_seed: int, skip: int, n: int, bounds: Dict, log: Sequence[str],
+                  tol: float):
+    """Worker entry point: counts per _CATEGORIES for points skip .. skip + n − 1 of one replicate."""
+    import numpy as np
+
+    from param_sweep.sampling import unit_samples
+
+    if method == "random":
+        rng = np.random.default_rng(np.random.SeedSequence(r_seed, spawn_key=(skip,)))
+        u = rng.random((n, len(PARAM_NAMES)))
+    else:
+        u = unit_samples(method, n, len(PARAM_NAMES), r_seed, skip=skip)
+    cols = {}
+    for j, name in enumerate(PARAM_NAMES):
+        lo, hi = bounds[name]
+        if name in log:
+            cols[name] = np.exp(np.log(lo) + u[:, j] * (np.log(hi) - np.log(lo)))
+        else:
+            cols[name] = lo + u[:, j] * (hi - lo)
+    del u
+    with np.errstate(divide="ignore", over="ignore", invalid="ignore"):
+        passing = table1_pass(cols, tol)
+    counts = [int(passing[m].sum()) for m in MASKS]
+    unset = np.ones(n, dtype=bool)
+    primary = {}
+    for m in _PRIMARY_ORDER:
+        pick = unset & passing[m]
+        primary[m] = int(pick.sum())
+        unset &= ~pick
+    n_pass = np.sum([passing[m] for m in MASKS], axis=0)
+    counts += [primary[m] for m in MASKS] + [int((n_pass >= 2).sum()), int((n_pass == 0).sum())]
+    return np.asarray(counts, dtype=np.int64)
+
+
+def estimate_mask_volumes(
+    bounds: Optional[Dict[str, Tuple[float, float]]] = None,
+    n: int = 1 << 24,
+    *,
+    method: str = "sobol",
+    replicates: int = 8,
+    seed: int = 0,
+    batch_size: int = 1 << 20,
+    workers: int = 1,
+    log: Sequence[str] = (),
+    tol: float = 1e-10,
+    progress=None,
+) -> Dict:
+    """
+    Share of the box `bounds` ({name: (lo, hi)} for PARAM_NAMES; default: dataset.DEFAULT_BOUNDS,
+    the generator scripts' box) in each regime (see module docstring). Parameters in `log` are
+    sampled uniformly in log. n is rounded up to replicates · batches · batch_size; use powers
+    of two for Sobol'. progress: optimize_a2.telemetry observer(s); one unit = one point.
+
+    Returns {"membership": {mask: (share, stderr)}, "primary": {mask: (share, stderr)},
+             "multi": (share, stderr), "none": (share, stderr), "n_points", "replicates", "method"}.
+    """
+    import numpy as np
+
+    from .dataset import DEFAULT_BOUNDS
+
+    if method not in ("sobol", "halton", "random"):
+        raise ValueError("method must be 'sobol', 'halton' or 'random'.")
+    if int(replicates) < 2:
+        raise ValueError("Need replicates >= 2 for an error bar.")
+    bounds = {k: (float(v[0]), float(v[1])) for k, v in (bounds or DEFAULT_BOUNDS).items()}
+    missing = [k for k in PARAM_NAMES if k not in bounds]
+    if missing:
+        raise ValueError(f"bounds missing {missing}.")
+    per_rep = -(-int(n) // int(replicates))
+    batch = min(int(batch_size), per_rep)
+    n_batches = -(-per_rep // batch)
+    per_rep = n_batches * batch
+
+    from optimize_a2.telemetry import ProgressTracker
+
+    tasks = [(r, _replicate_seed(seed, replicates, r), b * batch)
+             for r in range(int(replicates)) for b in range(n_batches)]
+    totals = np.zeros((int(replicates), len(_CATEGORIES)), dtype=np.int64)
+    tracker = ProgressTracker(progress, label="mask volumes")
+    tracker.start(len(tasks) * batch)
+    if int(workers) <= 1:
+        for r, r_seed, skip in tasks:
+            totals[r] += _volume_batch(method, r_seed, skip, batch, bounds, tuple(log), tol)
+            tracker.update(units=batch)
+    else:
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        with ProcessPoolExecutor(max_workers=int(workers)) as pool:
+            futures = {pool.submit(_volume_batch, method, r_seed, skip, batch, bounds, tuple(log), tol): r
+                       for r, r_seed, skip in tasks}
+            for fut in as_completed(futures):
+                totals[futures[fut]] += fut.result()
+                tracker.update(units=batch)
+    tracker.finish()
+
+    shares = totals / float(per_rep)
+    est = shares.mean(axis=0)
+    se = shares.std(axis=0, ddof=1) / np.sqrt(int(replicates))
+    out = {dict_key: {} for dict_key in ("membership", "primary")}
+    for j, cat in enumerate(_CATEGORIES):
+        val = (float(est[j]), float(se[j]))
+        if cat.startswith("member:"):
+            out["membership"][cat[7:]] = val
+        elif cat.startswith("primary:"):
+            out["primary"][cat[8:]] = val
+        else:
+            out[cat] = val
+    out.update(n_points=int(replicates) * per_rep, replicates=int(replicates), method=method)
+    return out
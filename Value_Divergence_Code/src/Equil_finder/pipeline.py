@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+"""
+Generate -> solve -> verify in one streaming pass, with no intermediate CSV.
+
+Replaces "calling_equil_finder_100_equils.py writes a CSV, Checking_Equil_From_Csv.py reads it
+back": each batch is drawn (dataset._draw_and_solve: own SeedSequence child stream,
+optional per-mask quotas), solved with solve_equilibrium_batch and verified with
+verify_equilibrium_batch (verify="exact") or check_local_nash_batch (verify="local") while
+still in float64 arrays; only the annotated records leave the worker.
+
+iter_equilibrium_pipeline yields batches as column dicts, in batch order. At most
+max_in_flight batches are queued or running and the next batch is only submitted when the
+consumer pulls one, so memory stays bounded by max_in_flight · batch_rows rows whatever
+n_rows is. run_equilibrium_pipeline streams the same records into one CSV (formatted inside
+the workers) and returns counts. The rows are identical for any worker count and match
+generate_equilibrium_dataset with chunk_rows = batch_rows and the same seed.
+"""
+
+from __future__ import annotations
+
+import csv
+import os
+from collections import deque
+from typing import Dict, Iterator, Optional, Tuple
+
+from .best_response import verify_equilibrium_batch
+from .dataset import COLUMNS, DEFAULT_BOUNDS, _draw_and_solve
+from .local_nash import check_local_nash_batch
+from .mask_sampler import MASKS
+
+VERIFY_COLS = {
+    "exact": ["MaxGain_P1", "MaxGain_P2", "KKT_P1", "KKT_P2", "IsBR_P1", "IsBR_P2", "IsNash"],
+    "local": ["IsBR_P1", "IsBR_P2", "IsLocalNash"],
+    "none": [],
+}
+_FLAG_COLS = {"IsBR_P1", "IsBR_P2", "IsNash", "IsLocalNash"}
+
+
+def _pipeline_batch(k: int, n_batches: int, n: int, cfg: Dict, as_csv: bool):
+    """
+    Worker entry point: draw, solve and verify batch k. Returns its column dict, or
+    (n_rows, n_verified, mask counts, CSV text) when as_csv.
+    """
+    import numpy as np
+
+    cols = _draw_and_solve(k, n_batches, n, cfg)
+    if cfg["verify"] == "exact":
+        res = verify_equilibrium_batch(cols, cfg["verify_tol"])
+    elif cfg["verify"] == "local":
+        res = check_local_nash_batch(cols, cfg["delta"], cfg["verify_tol"])
+    else:
+        res = {}
+    cols.update({name: res[name] for name in VERIFY_COLS[cfg["verify"]]})
+    if not as_csv:
+        return cols
+
+    import io
+
+    flag = {"exact": "IsNash", "local": "IsLocalNash"}.get(cfg["verify"])
+    n_ok = int(cols[flag].sum()) if flag else n
+    counts = {m: int((cols["mask"] == i).sum()) for i, m in enumerate(MASKS)}
+    header = _csv_header(cfg["verify"])
+    mask_names = np.array(list(MASKS) + [""], dtype=object)  # code -1 -> ""
+    out = []
+    for name in header:
+        v = cols[name]
+        if name == "mask":
+            out.append(mask_names[v].tolist())
+        elif name in _FLAG_COLS or name == "MultipleMatches":
+            out.append(["Yes" if b else "No" for b in v])
+        else:
+            out.append(v.tolist())
+    buf = io.StringIO(newline="")
+    csv.writer(buf).writerows(zip(*out))
+    return n, n_ok, counts, buf.getvalue()
+
+
+def _csv_header(verify: str):
+    return COLUMNS + VERIFY_COLS[verify]
+
+
+def _stream(n_rows: int, cfg: Dict, batch_rows: int, workers: int, max_in_flight: Optional[int],
+            as_csv: bool) -> Iterator:
+    n_batches = -(-int(n_rows) // int(batch_rows))
+    sizes = [min(int(batch_rows), int(n_rows) - k * int(batch_rows)) for k in range(n_batches)]
+    if int(workers) <= 1:
+        for k in range(n_batches):
+            yield _pipeline_batch(k, n_batches, sizes[k], cfg, as_csv)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    limit = max(1, int(max_in_flight or 2 * int(workers)))
+    with ProcessPoolExecutor(max_workers=int(workers)) as pool:
+        pending: deque = deque()
+        for k in range(n_batches):
+            pending.append(pool.submit(_pipeline_batch, k, n_batches, sizes[k], cfg, as_csv))
+            if len(pending) >= limit:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _pipeline_cfg(seed, bounds, min_per_mask_per_batch, method, tol, verify, verify_tol, delta) -> Dict:
+    if verify not in VERIFY_COLS:
+        raise ValueError(f"verify must be one of {tuple(VERIFY_COLS)}.")
+    return {
+        "seed": int(seed), "bounds": {k: list(v) for k, v in (bounds or DEFAULT_BOUNDS).items()},
+        "min_per_mask_per_chunk": int(min_per_mask_per_batch), "method": method, "tol": float(tol),
+        "verify": verify, "verify_tol": float(verify_tol), "delta": float(delta),
+    }
+
+
+def iter_equilibrium_pipeline(
+    n_rows: int,
+    *,
+    seed: int = 424242,
+    bounds: Optional[Dict[str, Tuple[float, float]]] = None,
+    batch_rows: int = 100_000,
+    workers: int = 1,
+    max_in_flight: Optional[int] = None,
+    min_per_mask_per_batch: int = 0,
+    method: str = "construct",
+    tol: float = 1e-10,
+    verify: str = "exact",
+    verify_tol: float = 1e-10,
+    delta: float = 1e-4,
+) -> Iterator[Dict]:
+    """
+    Yield batches of drawn, solved and verified rows as {column: ndarray}, in order.
+    Columns: COLUMNS (mask as int8 code into MASKS) + VERIFY_COLS[verify].
+    max_in_flight: batches queued or running at once (default 2 · workers).
+    verify_tol / delta: tolerance of the chosen verifier / stencil step for "local".
+    """
+    if n_rows < 1 or batch_rows < 1:
+        raise ValueError("Require n_rows >= 1 and batch_rows >= 1.")
+    cfg = _pipeline_cfg(seed, bounds, min_per_mask_per_batch, method, tol, verify, verify_tol, delta)
+    yield from _stream(n_rows, cfg, batch_rows, workers, max_in_flight, as_csv=False)
+
+
+def run_equilibrium_pipeline(
+    output_csv: str,
+    n_rows: int,
+    *,
+    seed: int = 424242,
+    bounds: Optional[Dict[str, Tuple[float, float]]] = None,
+    batch_rows: int = 100_000,
+    workers: int = 1,
+    max_in_flight: Optional[int] = None,
+    min_per_mask_per_batch: int = 0,
+    method: str = "construct",
+    tol: float = 1e-10,
+    verify: str = "exact",
+    verify_tol: float = 1e-10,
+    delta: float = 1e-4,
+    progress=None,
+) -> Dict:
+    """
+    Stream n_rows drawn, solved and verified rows into output_csv (header COLUMNS +
+    VERIFY_COLS[verify]; masks by name, booleans as Yes/No). Arguments as in
+    iter_equilibrium_pipeline; progress: optimize_a2.telemetry observer(s), one unit = one
+    row, failures = rows that fail verification.
+    Returns {"n_rows", "n_verified", "mask_counts", "output_csv"}.
+    """
+    if n_rows < 1 or batch_rows < 1:
+        raise ValueError("Require n_rows >= 1 and batch_rows >= 1.")
+    cfg = _pipeline_cfg(seed, bounds, min_per_mask_per_batch, method, tol, verify, verify_tol, delta)
+    from optimize_a2.telemetry import ProgressTracker
+
+    out_dir = os.path.dirname(output_csv)
+    if out_dir:
+        os.makedirs(out_dir, exist_ok=True)
+    tracker = ProgressTracker(progress, label="pipeline")
+    tracker.start(int(n_rows))
+    summary: Dict = {"n_rows": 0, "n_verified": 0, "mask_counts": {m: 0 for m in MASKS}, "output_csv": output_csv}
+    tmp = output_csv + ".tmp"
+    with open(tmp, "w", newline="", encoding="utf-8") as fout:
+        csv.writer(fout).writerow(_csv_header(verify))
+        for n, n_ok, counts, text in _stream(n_rows, cfg, batch_rows, workers, max_in_flight, as_csv=True):
+            fout.write(text)
+            summary["n_rows"] += n
+            summary["n_verified"] += n_ok
+            for m, c in counts.items():
+                summary["mask_counts"][m] += c
+            tracker.update(units=n, failures=n - n_ok)
+    os.replace(tmp, output_csv)
+    tracker.finish()
+    return summary
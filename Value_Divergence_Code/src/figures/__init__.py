@@ -0,0 +1,17 @@
+"""
+figures
+
+Rendering stage for stored results: FigureSpec describes one PNG (kind, arrays, labels) and
+render_figures draws a batch of them in worker processes with the Agg canvas (no pyplot
+state), skipping every figure whose inputs hash to the same value as the last render.
+"""
+
+from .render import FIGURE_KINDS, FigureSpec, figure_hash, render_figure, render_figures
+
+__all__ = [
+    "FIGURE_KINDS",
+    "FigureSpec",
+    "figure_hash",
+    "render_figure",
+    "render_figures",
+]
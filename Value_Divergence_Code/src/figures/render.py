@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+"""
+Parallel, incremental PNG rendering from stored result arrays.
+
+A FigureSpec is plain data: the output path, a kind from FIGURE_KINDS, numpy-convertible
+arrays and JSON-able labels / style options. Drawing uses matplotlib.figure.Figure with
+the Agg canvas directly, so no pyplot global state is touched and specs can be rendered
+in any process. Each PNG is written to a temporary file and renamed into place, and the hash
+of the spec's inputs (kind, arrays, options, dpi, matplotlib version) is recorded under the
+PNG's file name in one "figures.sha256.json" manifest per output directory. render_figures
+skips figures whose PNG exists and whose recorded hash matches, so re-running a plotting
+stage only redraws the figures whose inputs changed.
+
+Kinds:
+  "lines":   data {"x": (n,), "y": (n,) or (k, n)}; options labels (one per curve, adds a
+             legend), xlabel, ylabel, title, marker, linestyle, grid.
+  "heatmap": data {"x": column axis, "y": row axis, "Z": (len(y), len(x))}; options xlabel,
+             ylabel, title, cbar_label. Drawn with imshow over the axes' min..max extent.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from typing import Dict, List, Sequence
+
+FIGURE_KINDS = ("lines", "heatmap")
+_RENDER_VERSION = 1  # bump when the drawing code changes, to invalidate every recorded hash
+MANIFEST_NAME = "figures.sha256.json"
+
+
+@dataclass
+class FigureSpec:
+    path: str
+    kind: str
+    data: Dict = field(default_factory=dict)
+    options: Dict = field(default_factory=dict)
+    dpi: int = 200
+
+
+def figure_hash(spec: FigureSpec) -> str:
+    """sha256 of everything that determines the PNG's pixels."""
+    import matplotlib
+    import numpy as np
+
+    h = hashlib.sha256()
+    head = {"v": _RENDER_VERSION, "mpl": matplotlib.__version__, "kind": spec.kind,
+            "dpi": int(spec.dpi), "options": spec.options}
+    h.update(json.dumps(head, sort_keys=True, default=str).encode("utf-8"))
+    for key in sorted(spec.data):
+        arr = np.ascontiguousarray(np.asarray(spec.data[key], dtype=float))
+        h.update(f"|{key}|{arr.shape}|".encode("utf-8"))
+        h.update(arr.tobytes())
+    return h.hexdigest()
+
+
+def _manifest_path(out_dir: str) -> str:
+    return os.path.join(out_dir, MANIFEST_NAME)
+
+
+def _load_hashes(out_dir: str) -> Dict[str, str]:
+    """{PNG file name: input hash} recorded in out_dir ({} if none or unreadable)."""
+    try:
+        with open(_manifest_path(out_dir), "r", encoding="utf-8") as f:
+            hashes = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return hashes if isinstance(hashes, dict) else {}
+
+
+def _record_hash(out_dir: str, hashes: Dict[str, str], path: str, digest: str) -> None:
+    """Set hashes[basename(path)] = digest and rewrite out_dir's manifest atomically."""
+    hashes[os.path.basename(path)] = digest
+    tmp = _manifest_path(out_dir) + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(hashes, f, indent=1, sort_keys=True)
+    os.replace(tmp, _manifest_path(out_dir))
+
+
+def _is_current(spec: FigureSpec, digest: str, hashes: Dict[str, str]) -> bool:
+    return hashes.get(os.path.basename(spec.path)) == digest and os.path.exists(spec.path)
+
+
+def _draw_lines(fig, spec: FigureSpec) -> None:
+    import numpy as np
+
+    opt = spec.options
+    ax = fig.add_subplot()
+    x = np.asarray(spec.data["x"], dtype=float)
+    ys = np.atleast_2d(np.asarray(spec.data["y"], dtype=float))
+    labels = opt.get("labels") or [None] * len(ys)
+    style = {k: opt[k] for k in ("marker", "linestyle") if k in opt}
+    for y, label in zip(ys, labels):
+        ax.plot(x, y, label=label, **style)
+    ax.set_xlabel(opt.get("xlabel", ""))
+    ax.set_ylabel(opt.get("ylabel", ""))
+    ax.set_title(opt.get("title", ""))
+    if opt.get("grid", True):
+        ax.grid(True)
+    if opt.get("labels"):
+        ax.legend()
+
+
+def _draw_heatmap(fig, spec: FigureSpec) -> None:
+    import numpy as np
+
+    opt = spec.options
+    ax = fig.add_subplot()
+    x = np.asarray(spec.data["x"], dtype=float)
+    y = np.asarray(spec.data["y"], dtype=float)
+    im = ax.imshow(np.asarray(spec.data["Z"], dtype=float), origin="lower", aspect="auto",
+                   extent=[x.min(), x.max(), y.min(), y.max()])
+    fig.colorbar(im, ax=ax, label=opt.get("cbar_label", ""))
+    ax.set_xlabel(opt.get("xlabel", ""))
+    ax.set_ylabel(opt.get("ylabel", ""))
+    ax.set_title(opt.get("title", ""))
+
+
+_DRAW = {"lines": _draw_lines, "heatmap": _draw_heatmap}
+
+
+def _render(spec: FigureSpec) -> str:
+    """Worker entry point: draw spec on an Agg canvas and write the PNG atomically."""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    out_dir = os.path.dirname(spec.path)
+    if out_dir:
+        os.makedirs(out_dir, exist_ok=True)
+    fig = Figure()
+    FigureCanvasAgg(fig)
+    _DRAW[spec.kind](fig, spec)
+    fig.tight_layout()
+    tmp = spec.path + ".tmp"
+    fig.savefig(tmp, dpi=int(spec.dpi), format="png")
+    os.replace(tmp, spec.path)
+    return spec.path
+
+
+def _check(spec: FigureSpec) -> None:
+    if spec.kind not in FIGURE_KINDS:
+        raise ValueError(f"kind must be one of {FIGURE_KINDS}, got {spec.kind!r}.")
+
+
+def render_figure(spec: FigureSpec, *, force: bool = False) -> bool:
+    """Render one figure in this process unless its inputs are unchanged; True if drawn."""
+    _check(spec)
+    digest = figure_hash(spec)
+    out_dir = os.path.dirname(os.path.abspath(spec.path))
+    hashes = _load_hashes(out_dir)
+    if not force and _is_current(spec, digest, hashes):
+        return False
+    _render(spec)
+    _record_hash(out_dir, hashes, spec.path, digest)
+    return True
+
+
+def render_figures(
+    specs: Sequence[FigureSpec],
+    *,
+    workers: int = 1,
+    force: bool = False,
+    progress=None,
+) -> Dict[str, List[str]]:
+    """
+    Render a batch of figures, `workers` at a time in a process pool (hashing and the skip
+    test run here, so unchanged figures never reach a worker, and only this process writes
+    the hash manifests). force=True redraws all.
+    progress: optimize_a2.telemetry observer(s); one unit = one figure.
+    Returns {"rendered": [paths], "skipped": [paths]}.
+    """
+    specs = list(specs)
+    for spec in specs:
+        _check(spec)
+    paths = [os.path.abspath(s.path) for s in specs]
+    if len(set(paths)) != len(paths):
+        raise ValueError("Two figure specs write the same path.")
+
+    from optimize_a2.telemetry import ProgressTracker
+
+    out: Dict[str, List[str]] = {"rendered": [], "skipped": []}
+    hashes: Dict[str, Dict[str, str]] = {}  # output dir -> its manifest
+    todo = []
+    for spec, path in zip(specs, paths):
+        out_dir = os.path.dirname(path)
+        if out_dir not in hashes:
+            hashes[out_dir] = _load_hashes(out_dir)
+        digest = figure_hash(spec)
+        if not force and _is_current(spec, digest, hashes[out_dir]):
+            out["skipped"].append(spec.path)
+        else:
+            todo.append((spec, out_dir, digest))
+
+    def done(spec: FigureSpec, out_dir: str, digest: str) -> None:
+        _record_hash(out_dir, hashes[out_dir], spec.path, digest)
+        out["rendered"].append(spec.path)
+        tracker.update(units=1)
+
+    tracker = ProgressTracker(progress, label="figures")
+    tracker.start(len(todo))
+    if int(workers) <= 1 or len(todo) <= 1:
+        for spec, out_dir, digest in todo:
+            _render(spec)
+            done(spec, out_dir, digest)
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=min(int(workers), len(todo))) as pool:
+            for (spec, out_dir, digest), _ in zip(todo, pool.map(_render, [t[0] for t in todo])):
+                done(spec, out_dir, digest)
+    tracker.finish()
+    return out
@@ -8,15 +8,31 @@ repeatedly calling Tony's optimizer (which calls the canonical equilibrium solve
 from .core import (
     A1A2Point,
     make_a1_grid,
+    iter_a1_vs_opt_a2,
     compute_a1_vs_opt_a2,
+    compute_a1_vs_opt_a2_adaptive,
     plot_and_save,
     run_and_save,
+    stream_and_save,
+    load_points_csv,
+)
+from .surrogate import (
+    A2StarSurrogate,
+    build_a2_star_surrogate,
+    load_or_build_surrogate,
 )
 
 __all__ = [
     "A1A2Point",
     "make_a1_grid",
+    "iter_a1_vs_opt_a2",
     "compute_a1_vs_opt_a2",
+    "compute_a1_vs_opt_a2_adaptive",
     "plot_and_save",
     "run_and_save",
+    "stream_and_save",
+    "load_points_csv",
+    "A2StarSurrogate",
+    "build_a2_star_surrogate",
+    "load_or_build_surrogate",
 ]
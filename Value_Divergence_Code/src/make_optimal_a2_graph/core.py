@@ -13,7 +13,10 @@ import csv
 import math
 import os
 from dataclasses import dataclass
-from typing import Iterable, List, Sequence, Tuple
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from optimize_a2.checkpoint import drop_torn_tail, ensure_dir, flush, read_manifest, write_manifest
 
 
 # ---------- ABSOLUTE PATHS (as requested) ----------
@@ -27,12 +30,14 @@ _DEFAULT_OUTPUT_DIR = (
 )
 
 
-def _import_optimizer_strict():
+@lru_cache(maxsize=None)
+def _import_optimizer_module_strict():
     """
-    Import optimize_a2_for_player1 from the optimize_a2 package and assert that the
+    Import the optimize_a2.optimize_a2 module and assert that the
     module file is exactly _OPTIMIZER_EXPECTED_FILE.
 
     This uses a normal import (no manual exec) so decorators (e.g., @dataclass) are safe.
+    Runs once per process (cached): sys.path is only touched on the first call.
     """
     import sys
     import importlib
@@ -57,6 +62,15 @@ def _import_optimizer_strict():
     if not hasattr(mod, "optimize_a2_for_player1"):
         raise ImportError("optimize_a2_for_player1 not found in optimize_a2.optimize_a2")
 
+    return mod, mod_file
+
+
+def _import_optimizer_strict():
+    """
+    Import optimize_a2_for_player1 from the optimize_a2 package and assert that the
+    module file is exactly _OPTIMIZER_EXPECTED_FILE.
+    """
+    mod, mod_file = _import_optimizer_module_strict()
     return mod.optimize_a2_for_player1, mod_file
 
 
@@ -66,6 +80,8 @@ class A1A2Point:
     a1: float
     a2_star: float
     u1_at_best: float
+    chosen_mask: str = ""
+    n_solver_calls: int = 0
 
 
 # ---------- HELPERS ----------
@@ -86,17 +102,37 @@ def make_a1_grid(min_a1: float, max_a1: float, n: int) -> List[float]:
     return [min_a1 + i * step for i in range(n)]
 
 
-def _ensure_dir(path: str) -> None:
-    os.makedirs(path, exist_ok=True)
+_CSV_HEADER = ["a1", "a2_star", "U1_at_best"]
+
+
+def _csv_row(pt: A1A2Point) -> List[str]:
+    return [f"{pt.a1:.10f}", f"{pt.a2_star:.10f}", f"{pt.u1_at_best:.10f}"]
 
 
 def _save_csv(points: Sequence[A1A2Point], csv_path: str) -> None:
-    _ensure_dir(os.path.dirname(csv_path))
+    ensure_dir(os.path.dirname(csv_path))
     with open(csv_path, "w", newline="") as f:
         w = csv.writer(f)
-        w.writerow(["a1", "a2_star", "U1_at_best"])
+        w.writerow(_CSV_HEADER)
         for pt in points:
-            w.writerow([f"{pt.a1:.10f}", f"{pt.a2_star:.10f}", f"{pt.u1_at_best:.10f}"])
+            w.writerow(_csv_row(pt))
+
+
+def load_points_csv(csv_path: str) -> List[A1A2Point]:
+    """
+    Read a CSV written by run_and_save / stream_and_save back into A1A2Points.
+    Malformed rows (e.g. a line torn by a crash mid-write) are skipped.
+    """
+    points: List[A1A2Point] = []
+    with open(csv_path, "r", newline="") as f:
+        for row in csv.DictReader(f):
+            try:
+                points.append(A1A2Point(
+                    a1=float(row["a1"]), a2_star=float(row["a2_star"]), u1_at_best=float(row["U1_at_best"]),
+                ))
+            except (KeyError, TypeError, ValueError):
+                continue
+    return points
 
 
 def _fmt_val(v: float) -> str:
@@ -129,7 +165,7 @@ def _title_suffix(p1x: float, p1y: float, p2x: float, p2y: float) -> str:
 
 
 # ---------- CORE ----------
-def compute_a1_vs_opt_a2(
+def iter_a1_vs_opt_a2(
     *,
     p1x: float,
     p1y: float,
@@ -144,24 +180,34 @@ def compute_a1_vs_opt_a2(
     max_iter: int = 200,
     solver_tol: float = 1e-10,
     solver_verbose: bool = False,
-) -> Tuple[List[A1A2Point], str]:
+    continuation: bool = False,
+    window_steps: int = 20,
+    a2_seed: Optional[float] = None,
+    progress=None,
+) -> Iterator[A1A2Point]:
     """
-    For each a1 in the provided grid (strictly inside (0,1)), call optimize_a2_for_player1(...)
-    and record a2* and U1(best).
+    Generator form of compute_a1_vs_opt_a2: yields one A1A2Point per valid a1 as soon
+    as it is optimized. a2_seed (optional) seeds the first warm start under continuation,
+    e.g. the last a2* of a resumed run.
 
-    Returns (points, optimizer_source_file)
+    progress: observer or list of observers (optimize_a2.telemetry, e.g. ConsoleProgress,
+    JsonLinesProgress) notified after every a1 with solver calls, masks, failures and ETA.
     """
     # Import the optimizer (and verify its source file)
-    optimize_a2_for_player1, optimizer_src = _import_optimizer_strict()
+    opt_mod, _ = _import_optimizer_module_strict()
+    from optimize_a2.telemetry import ProgressTracker
 
-    points: List[A1A2Point] = []
-    for a1 in a1_values:
-        a1f = float(a1)
+    a1_list = [float(a1) for a1 in a1_values]
+    tracker = ProgressTracker(progress, label="a1_curve")
+    tracker.start(sum(1 for a1f in a1_list if 0.0 < a1f < 1.0))
+
+    prev_a2: Optional[float] = None if a2_seed is None else float(a2_seed)
+    for a1f in a1_list:
         if not (0.0 < a1f < 1.0):
             # Skip any endpoints or invalid a1
             continue
 
-        res = optimize_a2_for_player1(
+        kwargs = dict(
             a1=a1f,
             p1x=float(p1x), p1y=float(p1y),
             p2x=float(p2x), p2y=float(p2y),
@@ -170,11 +216,238 @@ def compute_a1_vs_opt_a2(
             tol=float(tol), max_iter=int(max_iter),
             solver_tol=float(solver_tol), solver_verbose=bool(solver_verbose),
         )
-        points.append(A1A2Point(a1=a1f, a2_star=float(res.best_a2), u1_at_best=float(res.u1_at_best)))
+        if continuation and prev_a2 is not None:
+            res = opt_mod.optimize_a2_for_player1_warm(
+                a2_seed=prev_a2, window_steps=int(window_steps), **kwargs
+            )
+        else:
+            res = opt_mod.optimize_a2_for_player1(**kwargs)
+        prev_a2 = float(res.best_a2)
+        tracker.update(
+            solver_calls=len(res.samples), masks=[str(res.chosen_mask)],
+            failures=0 if math.isfinite(res.u1_at_best) else 1,
+        )
 
+        yield A1A2Point(
+            a1=a1f, a2_star=float(res.best_a2), u1_at_best=float(res.u1_at_best),
+            chosen_mask=str(res.chosen_mask), n_solver_calls=len(res.samples),
+        )
+
+    tracker.finish()
+
+
+def compute_a1_vs_opt_a2(
+    *,
+    p1x: float,
+    p1y: float,
+    p2x: float,
+    p2y: float,
+    c1: float,
+    c2: float,
+    a1_values: Iterable[float],
+    a2_lo: float = 1e-6,
+    a2_hi: float = 1.0 - 1e-6,
+    tol: float = 1e-5,
+    max_iter: int = 200,
+    solver_tol: float = 1e-10,
+    solver_verbose: bool = False,
+    continuation: bool = False,
+    window_steps: int = 20,
+    progress=None,
+) -> Tuple[List[A1A2Point], str]:
+    """
+    For each a1 in the provided grid (strictly inside (0,1)), call optimize_a2_for_player1(...)
+    and record a2* and U1(best).
+
+    continuation=True warm-starts each a1 from the previous a1's a2*
+    (optimize_a2_for_player1_warm: narrow window + a probe at every mask segment's optimum).
+    The first a1 is always a cold start. Points carry n_solver_calls so the saving is visible.
+
+    progress: telemetry observer(s), see iter_a1_vs_opt_a2.
+
+    Returns (points, optimizer_source_file)
+    """
+    # Import the optimizer (and verify its source file)
+    _, optimizer_src = _import_optimizer_module_strict()
+
+    points = list(iter_a1_vs_opt_a2(
+        p1x=p1x, p1y=p1y, p2x=p2x, p2y=p2y, c1=c1, c2=c2,
+        a1_values=a1_values,
+        a2_lo=a2_lo, a2_hi=a2_hi,
+        tol=tol, max_iter=max_iter,
+        solver_tol=solver_tol, solver_verbose=solver_verbose,
+        continuation=continuation, window_steps=window_steps,
+        progress=progress,
+    ))
     return points, optimizer_src
 
 
+def compute_a1_vs_opt_a2_adaptive(
+    *,
+    p1x: float,
+    p1y: float,
+    p2x: float,
+    p2y: float,
+    c1: float,
+    c2: float,
+    min_a1: float = 0.001,
+    max_a1: float = 0.999,
+    n_initial: int = 33,
+    a2_jump_tol: float = 0.02,
+    a1_precision: float = 1e-4,
+    max_points: int = 2000,
+    a2_lo: float = 1e-6,
+    a2_hi: float = 1.0 - 1e-6,
+    tol: float = 1e-5,
+    max_iter: int = 200,
+    solver_tol: float = 1e-10,
+    solver_verbose: bool = False,
+    continuation: bool = False,
+) -> Tuple[List[A1A2Point], str]:
+    """
+    Adaptive a1 grid for the a2*(a1) curve.
+
+    Starts from a uniform grid of n_initial points in [min_a1, max_a1]. Then, pass by pass,
+    every interval between consecutive points whose a2* values differ by more than a2_jump_tol,
+    or whose chosen masks differ, is bisected (its midpoint is optimized) as long as the
+    interval is wider than a1_precision. Smooth stretches therefore stay coarse, while jumps
+    (mask switches) are bracketed to within a1_precision. Stops early at max_points.
+
+    continuation=True seeds each new midpoint from its left neighbour's a2*
+    (optimize_a2_for_player1_warm).
+
+    Returns (points sorted by a1, optimizer_source_file).
+    """
+    if n_initial < 2:
+        raise ValueError("Require n_initial >= 2.")
+    if not (a2_jump_tol > 0.0 and a1_precision > 0.0):
+        raise ValueError("Require a2_jump_tol > 0 and a1_precision > 0.")
+
+    _, optimizer_src = _import_optimizer_module_strict()
+    opt_kwargs = dict(
+        p1x=p1x, p1y=p1y, p2x=p2x, p2y=p2y, c1=c1, c2=c2,
+        a2_lo=a2_lo, a2_hi=a2_hi,
+        tol=tol, max_iter=max_iter,
+        solver_tol=solver_tol, solver_verbose=solver_verbose,
+        continuation=continuation,
+    )
+
+    points = list(iter_a1_vs_opt_a2(a1_values=make_a1_grid(min_a1, max_a1, n_initial), **opt_kwargs))
+
+    while len(points) < max_points:
+        refined: List[A1A2Point] = []
+        n_new = 0
+        for left, right in zip(points[:-1], points[1:]):
+            refined.append(left)
+            jump = abs(right.a2_star - left.a2_star) > a2_jump_tol or right.chosen_mask != left.chosen_mask
+            if jump and (right.a1 - left.a1) > a1_precision and len(points) + n_new < max_points:
+                refined.extend(iter_a1_vs_opt_a2(
+                    a1_values=[0.5 * (left.a1 + right.a1)], a2_seed=left.a2_star, **opt_kwargs
+                ))
+                n_new += 1
+        refined.append(points[-1])
+        if n_new == 0:
+            break
+        points = refined
+
+    return points, optimizer_src
+
+
+def stream_and_save(
+    *,
+    p1x: float,
+    p1y: float,
+    p2x: float,
+    p2y: float,
+    c1: float,
+    c2: float,
+    min_a1: float = 0.001,
+    max_a1: float = 0.999,
+    n_points: int = 999,
+    a2_lo: float = 1e-6,
+    a2_hi: float = 1.0 - 1e-6,
+    tol: float = 1e-5,
+    max_iter: int = 200,
+    solver_tol: float = 1e-10,
+    solver_verbose: bool = False,
+    continuation: bool = False,
+    output_dir: str = _DEFAULT_OUTPUT_DIR,
+    csv_name: str = "a1_vs_opt_a2.csv",
+    resume: bool = True,
+    flush_every: int = 10,
+    progress=None,
+) -> Iterator[A1A2Point]:
+    """
+    Streaming, resumable version of the compute + CSV part of run_and_save.
+
+    Yields each newly computed A1A2Point and appends it to <output_dir>/<csv_name>
+    (same columns as run_and_save). Every `flush_every` points the file is flushed + fsynced
+    and the checkpoint manifest <csv_name>.manifest.json is rewritten atomically.
+
+    resume=True and a manifest with the *same* parameters -> the a1 values already in the CSV
+    are skipped (a torn last line from a crash is dropped). A manifest with different parameters
+    raises ValueError instead of mixing two runs in one file. resume=False starts over.
+
+    Use load_points_csv(csv_path) + plot_and_save(...) afterwards to draw the figure.
+    """
+    if flush_every < 1:
+        raise ValueError("Require flush_every >= 1.")
+    grid = make_a1_grid(min_a1=min_a1, max_a1=max_a1, n=n_points)
+    params = {
+        "p1x": float(p1x), "p1y": float(p1y), "p2x": float(p2x), "p2y": float(p2y),
+        "c1": float(c1), "c2": float(c2),
+        "min_a1": float(min_a1), "max_a1": float(max_a1), "n_points": int(n_points),
+        "a2_lo": float(a2_lo), "a2_hi": float(a2_hi), "tol": float(tol), "max_iter": int(max_iter),
+        "solver_tol": float(solver_tol), "continuation": bool(continuation),
+    }
+    csv_path = os.path.join(output_dir, csv_name)
+    manifest_path = csv_path + ".manifest.json"
+
+    done: List[A1A2Point] = []
+    if resume and os.path.exists(manifest_path):
+        manifest = read_manifest(manifest_path)
+        if manifest.get("params") != params:
+            raise ValueError(
+                f"Checkpoint {manifest_path} was written with different parameters; "
+                "use another csv_name or resume=False."
+            )
+        if os.path.exists(csv_path):
+            drop_torn_tail(csv_path)
+            done = load_points_csv(csv_path)
+
+    # (Re)write the CSV with only the fully written rows, then append from there.
+    _save_csv(done, csv_path)
+    done_keys = {f"{pt.a1:.10f}" for pt in done}
+    todo = [a1 for a1 in grid if f"{a1:.10f}" not in done_keys]
+    n_done = len(done)
+    write_manifest(manifest_path, params=params, n_total=len(grid), n_done=n_done, complete=not todo)
+
+    with open(csv_path, "a", newline="") as f:
+        w = csv.writer(f)
+        since_flush = 0
+        for pt in iter_a1_vs_opt_a2(
+            p1x=p1x, p1y=p1y, p2x=p2x, p2y=p2y, c1=c1, c2=c2,
+            a1_values=todo,
+            a2_lo=a2_lo, a2_hi=a2_hi,
+            tol=tol, max_iter=max_iter,
+            solver_tol=solver_tol, solver_verbose=solver_verbose,
+            continuation=continuation,
+            a2_seed=done[-1].a2_star if done else None,
+            progress=progress,
+        ):
+            w.writerow(_csv_row(pt))
+            n_done += 1
+            since_flush += 1
+            if since_flush >= flush_every:
+                flush(f)
+                write_manifest(manifest_path, params=params, n_total=len(grid), n_done=n_done, complete=False)
+                since_flush = 0
+            yield pt
+        flush(f)
+
+    write_manifest(manifest_path, params=params, n_total=len(grid), n_done=n_done, complete=True)
+
+
 def plot_and_save(
     points: Sequence[A1A2Point],
     png_path: str,
@@ -187,22 +460,17 @@ def plot_and_save(
     """
     One matplotlib figure; no seaborn; no explicit colors; no subplots.
     The plot *title* includes the p-parameters, and the *filename* is handled upstream.
+    Drawn on the Agg canvas without pyplot state (figures.render_figure); an existing PNG
+    whose inputs are unchanged is not redrawn.
     """
-    import matplotlib.pyplot as plt
+    from figures import FigureSpec, render_figure
 
-    _ensure_dir(os.path.dirname(png_path))
-    xs = [pt.a1 for pt in points]
-    ys = [pt.a2_star for pt in points]
-
-    plt.figure()
-    plt.plot(xs, ys, marker="o", linestyle="-")
-    plt.xlabel("a1")
-    plt.ylabel("optimal a2 (a2*)")
-    plt.title(f"a1 vs optimal a2  |  {_title_suffix(p1x, p1y, p2x, p2y)}")
-    plt.grid(True)
-    plt.tight_layout()
-    plt.savefig(png_path, dpi=200)
-    plt.close()
+    render_figure(FigureSpec(
+        path=png_path, kind="lines",
+        data={"x": [pt.a1 for pt in points], "y": [pt.a2_star for pt in points]},
+        options={"xlabel": "a1", "ylabel": "optimal a2 (a2*)", "marker": "o", "linestyle": "-",
+                 "title": f"a1 vs optimal a2  |  {_title_suffix(p1x, p1y, p2x, p2y)}"},
+    ))
 
 
 def run_and_save(
@@ -222,6 +490,11 @@ def run_and_save(
     max_iter: int = 200,
     solver_tol: float = 1e-10,
     solver_verbose: bool = False,
+    continuation: bool = False,
+    adaptive: bool = False,
+    a2_jump_tol: float = 0.02,
+    a1_precision: float = 1e-4,
+    progress=None,
     output_dir: str = _DEFAULT_OUTPUT_DIR,
     csv_name: str = "a1_vs_opt_a2.csv",
     png_name: str = "a1_vs_opt_a2.png",
@@ -229,22 +502,39 @@ def run_and_save(
     """
     Convenience wrapper:
       1) builds a1 grid,
-      2) computes points,
+      2) computes points (continuation=True warm-starts along a1),
       3) writes CSV + PNG.
 
+    adaptive=True uses compute_a1_vs_opt_a2_adaptive instead of a uniform grid; n_points is
+    then the *maximum* number of points (the refinement starts from 33 and bisects jumps).
+    progress (telemetry observers) is reported for the uniform grid only.
+
     The PNG filename is automatically suffixed with the p-parameters:
       a1_vs_opt_a2__p1x-<..>_p1y-<..>_p2x-<..>_p2y-<..>.png
 
     Returns (optimizer_source_file, csv_path, png_path).
     """
-    grid = make_a1_grid(min_a1=min_a1, max_a1=max_a1, n=n_points)
-    points, optimizer_src = compute_a1_vs_opt_a2(
-        p1x=p1x, p1y=p1y, p2x=p2x, p2y=p2y, c1=c1, c2=c2,
-        a1_values=grid,
-        a2_lo=a2_lo, a2_hi=a2_hi,
-        tol=tol, max_iter=max_iter,
-        solver_tol=solver_tol, solver_verbose=solver_verbose,
-    )
+    if adaptive:
+        points, optimizer_src = compute_a1_vs_opt_a2_adaptive(
+            p1x=p1x, p1y=p1y, p2x=p2x, p2y=p2y, c1=c1, c2=c2,
+            min_a1=min_a1, max_a1=max_a1, n_initial=min(33, n_points), max_points=n_points,
+            a2_jump_tol=a2_jump_tol, a1_precision=a1_precision,
+            a2_lo=a2_lo, a2_hi=a2_hi,
+            tol=tol, max_iter=max_iter,
+            solver_tol=solver_tol, solver_verbose=solver_verbose,
+            continuation=continuation,
+        )
+    else:
+        grid = make_a1_grid(min_a1=min_a1, max_a1=max_a1, n=n_points)
+        points, optimizer_src = compute_a1_vs_opt_a2(
+            p1x=p1x, p1y=p1y, p2x=p2x, p2y=p2y, c1=c1, c2=c2,
+            a1_values=grid,
+            a2_lo=a2_lo, a2_hi=a2_hi,
+            tol=tol, max_iter=max_iter,
+            solver_tol=solver_tol, solver_verbose=solver_verbose,
+            continuation=continuation,
+            progress=progress,
+        )
 
     # CSV path (unchanged naming)
     csv_path = os.path.join(output_dir, csv_name)
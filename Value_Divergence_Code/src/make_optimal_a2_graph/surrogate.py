@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+"""
+Precomputed surrogate of a1 ↦ a2*(a1) for one parameter set (p1x, p1y, p2x, p2y, c1, c2).
+
+Build once (a few hundred optimizations, warm-started), then evaluate in microseconds:
+  1) compute_a1_vs_opt_a2_adaptive locates the jumps / mask switches of a2*(a1);
+  2) between consecutive jumps a2* is smooth, so each segment gets its own Chebyshev
+     interpolant (values at Chebyshev nodes, no numpy required);
+  3) every segment is checked against the optimizer at independent points (the Chebyshev
+     extrema, interleaved with the nodes); the degree is doubled, or the segment split,
+     until the check error is below target_error. The worst check error is stored as
+     `max_check_error` and each segment keeps its own.
+
+Near a breakpoint (within jump_precision/2) the true a2* may sit on either side of the jump;
+`breakpoints` and `jump_precision` say exactly where that is.
+
+Serializable to JSON (save / load). load_or_build_surrogate rebuilds only when the
+stored parameters differ from the requested ones.
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import math
+import os
+from dataclasses import asdict, dataclass, field
+from typing import Dict, Iterable, List, Tuple, Union
+
+from optimize_a2.checkpoint import ensure_dir
+
+from .core import _import_optimizer_module_strict, compute_a1_vs_opt_a2_adaptive, iter_a1_vs_opt_a2
+
+
+@dataclass
+class ChebSegment:
+    lo: float
+    hi: float
+    coeffs: List[float]       # Chebyshev coefficients on [lo, hi] mapped to [-1, 1]
+    max_check_error: float    # max |interpolant − optimizer| at the independent check points
+
+
+@dataclass
+class A2StarSurrogate:
+    params: Dict
+    segments: List[ChebSegment]
+    breakpoints: List[float]  # interior segment boundaries (jump locations, mask switches, splits)
+    jump_precision: float
+    max_check_error: float
+    n_solver_calls: int
+    _los: List[float] = field(default_factory=list, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._los = [seg.lo for seg in self.segments]
+
+    def __call__(self, a1: Union[float, Iterable[float]]) -> Union[float, List[float]]:
+        """a2*(a1); accepts a float or an iterable of floats (returns a list)."""
+        if isinstance(a1, (int, float)):
+            return self._eval(float(a1))
+        return [self._eval(float(x)) for x in a1]
+
+    def _eval(self, a1: float) -> float:
+        lo, hi = self.segments[0].lo, self.segments[-1].hi
+        if not (lo <= a1 <= hi):
+            raise ValueError(f"a1={a1} outside the surrogate domain [{lo}, {hi}].")
+        seg = self.segments[max(0, bisect.bisect_right(self._los, a1) - 1)]
+        return _clenshaw(seg.coeffs, _to_unit(a1, seg.lo, seg.hi))
+
+    def to_dict(self) -> Dict:
+        return {
+            "params": self.params,
+            "segments": [asdict(seg) for seg in self.segments],
+            "breakpoints": self.breakpoints,
+            "jump_precision": self.jump_precision,
+            "max_check_error": self.max_check_error,
+            "n_solver_calls": self.n_solver_calls,
+        }
+
+    @classmethod
+    def from_dict(cls, d: Dict) -> "A2StarSurrogate":
+        return cls(
+            params=d["params"],
+            segments=[ChebSegment(**seg) for seg in d["segments"]],
+            breakpoints=list(d["breakpoints"]),
+            jump_precision=float(d["jump_precision"]),
+            max_check_error=float(d["max_check_error"]),
+            n_solver_calls=int(d["n_solver_calls"]),
+        )
+
+    def save(self, path: str) -> str:
+        ensure_dir(os.path.dirname(path))
+        tmp = path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.to_dict(), f)
+        os.replace(tmp, path)
+        return path
+
+    @classmethod
+    def load(cls, path: str) -> "A2StarSurrogate":
+        with open(path, "r") as f:
+            return cls.from_dict(json.load(f))
+
+
+# ---------- CHEBYSHEV HELPERS ----------
+def _to_unit(x: float, lo: float, hi: float) -> float:
+    return (2.0 * x - (lo + hi)) / (hi - lo)
+
+
+def _from_unit(t: float, lo: float, hi: float) -> float:
+    return 0.5 * (lo + hi) + 0.5 * (hi - lo) * t
+
+
+def _cheb_nodes(n: int) -> List[float]:
+    """Chebyshev points of the first kind on (-1, 1); they never touch the segment ends."""
+    return [math.cos(math.pi * (j + 0.5) / n) for j in range(n)]
+
+
+def _cheb_coeffs(values: List[float]) -> List[float]:
+    """Coefficients c_k of sum_k c_k T_k interpolating `values` at _cheb_nodes(len(values))."""
+    n = len(values)
+    coeffs = []
+    for k in range(n):
+        s = sum(values[j] * math.cos(math.pi * k * (j + 0.5) / n) for j in range(n))
+        coeffs.append((1.0 if k == 0 else 2.0) * s / n)
+    return coeffs
+
+
+def _clenshaw(coeffs: List[float], t: float) -> float:
+    b1 = b2 = 0.0
+    for c in reversed(coeffs[1:]):
+        b1, b2 = 2.0 * t * b1 - b2 + c, b1
+    return t * b1 - b2 + coeffs[0]
+
+
+# ---------- BUILD ----------
+def build_a2_star_surrogate(
+    *,
+    p1x: float,
+    p1y: float,
+    p2x: float,
+    p2y: float,
+    c1: float,
+    c2: float,
+    min_a1: float = 0.001,
+    max_a1: float = 0.999,
+    target_error: float = 1e-4,
+    degree: int = 8,
+    max_degree: int = 64,
+    min_width: float = 1e-3,
+    n_initial: int = 33,
+    a2_jump_tol: float = 0.02,
+    jump_precision: float = 1e-4,
+    a2_lo: float = 1e-6,
+    a2_hi: float = 1.0 - 1e-6,
+    tol: float = 1e-5,
+    max_iter: int = 200,
+    solver_tol: float = 1e-10,
+) -> A2StarSurrogate:
+    """
+    Build the piecewise Chebyshev surrogate of a2*(a1) on [min_a1, max_a1] (see module docstring).
+
+    degree is the starting degree per segment; it is doubled up to max_degree while the check
+    error exceeds target_error, after which the segment is split in half (down to min_width).
+    Segments that still miss the target keep their best fit and report their check error.
+    """
+    params = _surrogate_params(**locals())
+    opt_kwargs = dict(
+        p1x=p1x, p1y=p1y, p2x=p2x, p2y=p2y, c1=c1, c2=c2,
+        a2_lo=a2_lo, a2_hi=a2_hi, tol=tol, max_iter=max_iter, solver_tol=solver_tol,
+    )
+    _import_optimizer_module_strict()
+
+    # (1) locate jumps / mask switches
+    pts, _ = compute_a1_vs_opt_a2_adaptive(
+        min_a1=min_a1, max_a1=max_a1, n_initial=n_initial,
+        a2_jump_tol=a2_jump_tol, a1_precision=jump_precision,
+        continuation=True, **opt_kwargs,
+    )
+    n_calls = sum(pt.n_solver_calls for pt in pts)
+    breakpoints = [
+        0.5 * (left.a1 + right.a1)
+        for left, right in zip(pts[:-1], pts[1:])
+        if abs(right.a2_star - left.a2_star) > a2_jump_tol or right.chosen_mask != left.chosen_mask
+    ]
+
+    def a2_at(a1s: List[float]) -> List[float]:
+        nonlocal n_calls
+        out = []
+        for pt in iter_a1_vs_opt_a2(a1_values=a1s, continuation=True, **opt_kwargs):
+            out.append(pt.a2_star)
+            n_calls += pt.n_solver_calls
+        return out
+
+    def fit(lo: float, hi: float) -> List[ChebSegment]:
+        best = None
+        n = max(1, int(degree)) + 1
+        while True:
+            values = a2_at(sorted(_from_unit(t, lo, hi) for t in _cheb_nodes(n)))[::-1]
+            coeffs = _cheb_coeffs(values)
+            check_t = [math.cos(math.pi * j / n) for j in range(1, n)] or [0.0]
+            check_x = sorted(_from_unit(t, lo, hi) for t in check_t)
+            truth = a2_at(check_x)
+            err = max(abs(_clenshaw(coeffs, _to_unit(x, lo, hi)) - y) for x, y in zip(check_x, truth))
+            seg = ChebSegment(lo=lo, hi=hi, coeffs=coeffs, max_check_error=err)
+            if best is None or err < best.max_check_error:
+                best = seg
+            if err <= target_error:
+                return [seg]
+            if 2 * (n - 1) <= max_degree:
+                n = 2 * (n - 1) + 1
+                continue
+            if hi - lo > 2.0 * min_width:
+                mid = 0.5 * (lo + hi)
+                return fit(lo, mid) + fit(mid, hi)
+            return [best]
+
+    # (2) + (3) fit and check each smooth segment
+    edges = [float(min_a1)] + breakpoints + [float(max_a1)]
+    segments: List[ChebSegment] = []
+    for lo, hi in zip(edges[:-1], edges[1:]):
+        segments.extend(fit(lo, hi))
+
+    return A2StarSurrogate(
+        params=params,
+        segments=segments,
+        breakpoints=[seg.lo for seg in segments[1:]],
+        jump_precision=float(jump_precision),
+        max_check_error=max(seg.max_check_error for seg in segments),
+        n_solver_calls=int(n_calls),
+    )
+
+
+def _surrogate_params(**kwargs) -> Dict:
+    """JSON-ready parameter dict identifying a surrogate (everything that changes the result)."""
+    return json.loads(json.dumps({k: kwargs[k] for k in sorted(kwargs)}))
+
+
+def load_or_build_surrogate(path: str, **build_kwargs) -> Tuple[A2StarSurrogate, bool]:
+    """
+    Return (surrogate, rebuilt). Loads `path` when it was built with exactly these arguments
+    (defaults included); otherwise builds a fresh surrogate and saves it to `path`.
+    """
+    import inspect
+
+    bound = inspect.signature(build_a2_star_surrogate).bind(**build_kwargs)
+    bound.apply_defaults()
+    wanted = _surrogate_params(**bound.arguments)
+    if os.path.exists(path):
+        try:
+            sur = A2StarSurrogate.load(path)
+        except (OSError, ValueError, KeyError, TypeError):
+            sur = None
+        if sur is not None and sur.params == wanted:
+            return sur, False
+    sur = build_a2_star_surrogate(**bound.arguments)
+    sur.save(path)
+    return sur, True
@@ -6,16 +6,60 @@ and the optimal a2 for Player 1. Uses Tony's optimizer (which calls the canonica
 """
 
 from .core import (
+    iter_sweep_productivities,
     sweep_productivities,
+    stream_sweep_productivities,
+    sweep_productivities_columnar,
+    iter_columnar_chunks,
+    load_columnar,
     save_summary_csv,
     save_raw_curves_csv,
     plot_fraction_heatmap,
     plot_signed_gap_heatmap,
+    plot_heatmaps_from_summary,
+    load_summary_columns,
+    shard_cells,
+)
+from .shards import (
+    parse_shard,
+    run_sweep_shard,
+    merge_sweep_shards,
+)
+from .quadtree import (
+    sweep_productivities_adaptive,
+    resample_adaptive_grid,
+    save_quadtree_leaves_csv,
+)
+from .arrays import (
+    MASK_CODES,
+    PATH_CODES,
+    sweep_productivities_memmap,
+    open_sweep_memmap,
+    summarize_sweep_memmap,
 )
 __all__ = [
+    "iter_sweep_productivities",
     "sweep_productivities",
+    "stream_sweep_productivities",
+    "sweep_productivities_columnar",
+    "iter_columnar_chunks",
+    "load_columnar",
     "save_summary_csv",
     "save_raw_curves_csv",
     "plot_fraction_heatmap",
     "plot_signed_gap_heatmap",
+    "plot_heatmaps_from_summary",
+    "load_summary_columns",
+    "shard_cells",
+    "parse_shard",
+    "run_sweep_shard",
+    "merge_sweep_shards",
+    "sweep_productivities_adaptive",
+    "resample_adaptive_grid",
+    "save_quadtree_leaves_csv",
+    "MASK_CODES",
+    "PATH_CODES",
+    "sweep_productivities_memmap",
+    "open_sweep_memmap",
+    "summarize_sweep_memmap",
 ]
@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+"""
+Sweep results as memory-mapped arrays shaped by the grid.
+
+sweep_productivities_memmap preallocates, in out_dir,
+    a2_star.npy  float64 [r1, r2, a1]   (NaN where the optimizer raised)
+    u1.npy       float64 [r1, r2, a1]
+    mask.npy     int8    [r1, r2, a1]   code into MASK_CODES (-1: a mask not in the table)
+    path.npy     int8    [r1, r2, a1]   code into PATH_CODES (optimizer path, see screen=)
+    calls.npy    int32   [r1, r2]       solver calls per cell
+    done.npy     uint8   [r1, r2]       1 once the cell's slices are written and flushed
+    memmap.json  parameters, axes, mask / path code tables
+as .npy memmaps. Each worker opens the files itself and writes its cells' slices in place;
+only small counters travel back to the parent, and the parent never holds the results.
+
+open_sweep_memmap reopens a finished (or partial) run read-only, without copying;
+summarize_sweep_memmap computes the per-cell summary columns from those arrays, and
+plot_fraction_heatmap / plot_signed_gap_heatmap / plot_heatmaps_from_summary accept
+the output directory directly. Re-running with the same parameters resumes (done cells
+are skipped); different parameters raise ValueError.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import Dict, List, Tuple
+
+from optimize_a2.checkpoint import ensure_dir, write_manifest
+
+from .core import (
+    DEFAULT_OUTDIR,
+    _compensated_add,
+    _cost_balanced_chunks,
+    _import_optimizer_strict,
+    _optimizer_for,
+    _sweep_params,
+)
+
+MASK_CODES = ("", "B,X", "X,B", "B,Y", "Y,B", "X,Y", "Y,X", "B,B", "NOFEAS", "ERR")
+_MASK_INDEX = {m: k for k, m in enumerate(MASK_CODES)}
+PATH_CODES = ("", "full_scan", "screened", "screen_fallback")
+_PATH_INDEX = {p: k for k, p in enumerate(PATH_CODES)}
+_META = "memmap.json"
+
+
+def _open(out_dir: str, mode: str) -> Dict:
+    import numpy as np
+
+    return {
+        name: np.load(os.path.join(out_dir, f"{name}.npy"), mmap_mode=mode)
+        for name in ("a2_star", "u1", "mask", "path", "calls", "done")
+    }
+
+
+def _memmap_cell_chunk(out_dir: str, chunk: List[Tuple[int, float, float]], a1_grid, n_r2: int,
+                       cell_kwargs: Dict) -> Dict:
+    """
+    Worker entry point: optimize every a1 of each (flat index, r1, r2) cell in the chunk and
+    write the results straight into the memmaps. Returns counters only.
+    """
+    opt_fun = _optimizer_for(cell_kwargs["screen"])
+    arr = _open(out_dir, "r+")
+    c, scale1, scale2 = cell_kwargs["c"], cell_kwargs["scale1"], cell_kwargs["scale2"]
+    opt_kwargs = {k: cell_kwargs[k] for k in ("a2_lo", "a2_hi", "tol", "max_iter", "solver_tol", "solver_verbose")}
+    stats: Dict = {"cells": 0, "solver_calls": 0, "masks": [], "failures": 0}
+    for k, r1, r2 in chunk:
+        i, j = divmod(k, n_r2)
+        n_calls = 0
+        for t, a1 in enumerate(a1_grid):
+            try:
+                res = opt_fun(
+                    a1=float(a1), r1=float(r1), r2=float(r2),
+                    p1x=float(scale1 * r1), p1y=float(scale1),
+                    p2x=float(scale2 * r2), p2y=float(scale2),
+                    c1=float(c), c2=float(c),
+                    **opt_kwargs,
+                )
+            except Exception:
+                arr["a2_star"][i, j, t] = float("nan")
+                arr["u1"][i, j, t] = float("nan")
+                arr["mask"][i, j, t] = _MASK_INDEX["ERR"]
+                stats["failures"] += 1
+                continue
+            arr["a2_star"][i, j, t] = float(res.best_a2)
+            arr["u1"][i, j, t] = float(res.u1_at_best)
+            arr["mask"][i, j, t] = _MASK_INDEX.get(str(res.chosen_mask), -1)
+            arr["path"][i, j, t] = _PATH_INDEX.get(str(res.strategy), -1)
+            n_calls += len(res.samples)
+            stats["masks"].append(str(res.chosen_mask))
+        arr["calls"][i, j] = n_calls
+        stats["solver_calls"] += n_calls
+        stats["cells"] += 1
+        for name in ("a2_star", "u1", "mask", "path", "calls"):
+            arr[name].flush()
+        arr["done"][i, j] = 1
+        arr["done"].flush()
+    return stats
+
+
+def sweep_productivities_memmap(
+    *,
+    out_dir: str = os.path.join(DEFAULT_OUTDIR, "opposites_attract_grid_memmap"),
+    resume: bool = True,
+    **sweep_kwargs,
+) -> str:
+    """
+    Run the (r1, r2, a1) sweep into memory-mapped .npy arrays under out_dir (see module
+    docstring). Accepts the grid / optimizer / workers / chunks_per_worker / progress keyword
+    arguments of sweep_productivities. Returns out_dir.
+    """
+    import numpy as np
+    from numpy.lib.format import open_memmap
+    from optimize_a2.telemetry import ProgressTracker
+
+    if sweep_kwargs.get("shard") is not None:
+        raise ValueError("shard is not supported here; give each shard its own sweep instead.")
+    params = _sweep_params(sweep_kwargs)
+    workers = int(sweep_kwargs.get("workers", 1))
+    chunks_per_worker = int(sweep_kwargs.get("chunks_per_worker", 4))
+    _import_optimizer_strict()
+
+    r1_grid = np.linspace(params["r1_min"], params["r1_max"], params["r1_steps"])
+    r2_grid = np.linspace(params["r2_min"], params["r2_max"], params["r2_steps"])
+    a1_grid = np.linspace(params["a1_min"], params["a1_max"], params["a1_steps"])
+    shape = (len(r1_grid), len(r2_grid), len(a1_grid))
+
+    meta_path = os.path.join(out_dir, _META)
+    if resume and os.path.exists(meta_path):
+        with open(meta_path, "r") as f:
+            if json.load(f).get("params") != params:
+                raise ValueError(f"{out_dir} holds a sweep with different parameters; "
+                                 "use another out_dir or resume=False.")
+    else:
+        ensure_dir(out_dir)
+        specs = {"a2_star": ("f8", shape, np.nan), "u1": ("f8", shape, np.nan), "mask": ("i1", shape, 0),
+                 "path": ("i1", shape, 0), "calls": ("i4", shape[:2], 0), "done": ("u1", shape[:2], 0)}
+        for name, (dtype, shp, fill) in specs.items():
+            mm = open_memmap(os.path.join(out_dir, f"{name}.npy"), mode="w+", dtype=dtype, shape=shp)
+            mm[...] = fill
+            mm.flush()
+            del mm
+    write_manifest(
+        meta_path, params=params, shape=list(shape), masks=list(MASK_CODES), paths=list(PATH_CODES),
+        axes={"r1": r1_grid.tolist(), "r2": r2_grid.tolist(), "a1": a1_grid.tolist()},
+    )
+
+    done = np.load(os.path.join(out_dir, "done.npy"), mmap_mode="r")
+    todo = [(i * shape[1] + j, float(r1_grid[i]), float(r2_grid[j]))
+            for i in range(shape[0]) for j in range(shape[1]) if not done[i, j]]
+    del done
+    cell_kwargs = dict(
+        c=params["c"], scale1=params["scale1"], scale2=params["scale2"],
+        a2_lo=params["a2_lo"], a2_hi=params["a2_hi"], tol=params["tol"], max_iter=params["max_iter"],
+        solver_tol=params["solver_tol"], solver_verbose=bool(sweep_kwargs.get("solver_verbose", False)),
+        screen=bool(params["screen"]),
+    )
+
+    tracker = ProgressTracker(sweep_kwargs.get("progress"), label="memmap sweep")
+    tracker.start(len(todo) * len(a1_grid))
+
+    def report(stats: Dict) -> None:
+        tracker.update(units=stats["cells"] * len(a1_grid), solver_calls=stats["solver_calls"],
+                       masks=stats["masks"], failures=stats["failures"])
+
+    if workers <= 1 or len(todo) <= 1:
+        for cell in todo:
+            report(_memmap_cell_chunk(out_dir, [cell], a1_grid, shape[1], cell_kwargs))
+    else:
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        chunks = _cost_balanced_chunks(todo, workers * max(1, chunks_per_worker))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_memmap_cell_chunk, out_dir, ch, a1_grid, shape[1], cell_kwargs) for ch in chunks]
+            for fut in as_completed(futures):
+                report(fut.result())
+    tracker.finish()
+    return out_dir
+
+
+def open_sweep_memmap(out_dir: str) -> Dict:
+    """
+    Reopen a memmap sweep read-only (no copy, no recomputation):
+    {"a2_star", "u1", "mask", "path", "calls", "done": memmaps, "r1", "r2", "a1": axes,
+     "masks" / "paths": code tables, "params": sweep parameters}.
+    """
+    import numpy as np
+
+    with open(os.path.join(out_dir, _META), "r") as f:
+        meta = json.load(f)
+    out = _open(out_dir, "r")
+    out.update({name: np.asarray(vals) for name, vals in meta["axes"].items()})
+    out["masks"] = list(meta["masks"])
+    out["paths"] = list(meta["paths"])
+    out["params"] = meta["params"]
+    return out
+
+
+def summarize_sweep_memmap(source) -> Dict:
+    """
+    Per-(r1, r2) summary columns (the keys of save_summary_csv, r1-major) computed from the
+    a2_star array of a memmap sweep (out_dir or open_sweep_memmap result). Cells not yet done
+    get n_valid = 0 and NaN statistics. mean_signed_gap is summed along a1 with the same
+    compensated sum as the streamed summaries, so both give bit-identical values.
+    """
+    import numpy as np
+
+    arr = open_sweep_memmap(source) if isinstance(source, (str, os.PathLike)) else source
+    r1, r2, a1 = arr["r1"], arr["r2"], arr["a1"]
+    R1, R2 = np.meshgrid(r1, r2, indexing="ij")
+    sign = np.sign(R2 - R1)
+    valid = np.isfinite(arr["a2_star"]) & (arr["done"][..., None] == 1)
+    gap = np.where(valid, (arr["a2_star"] - a1[None, None, :]) * sign[..., None], 0.0)
+    n_valid = valid.sum(axis=2)
+    n_match = (valid & (gap > 0.0)).sum(axis=2)
+    total = np.zeros(n_valid.shape)
+    comp = np.zeros(n_valid.shape)
+    for k in range(len(a1)):
+        total, comp = _compensated_add(total, comp, gap[..., k])
+    with np.errstate(invalid="ignore", divide="ignore"):
+        frac = np.where((n_valid > 0) & (sign != 0), n_match / n_valid, np.nan)
+        mean_gap = np.where(n_valid > 0, (total + comp) / n_valid, np.nan)
+        ratio = np.where(R1 != 0, R2 / R1, np.inf)
+    return {
+        "r1": R1.ravel(), "r2": R2.ravel(), "ratio_r2_over_r1": ratio.ravel(),
+        "n_valid": n_valid.ravel(), "n_a1": np.full(R1.size, len(a1)),
+        "frac_match_opposites": frac.ravel(), "mean_signed_gap": mean_gap.ravel(),
+    }
+
+
+def is_memmap_sweep(path: str) -> bool:
+    return os.path.isfile(os.path.join(path, _META))
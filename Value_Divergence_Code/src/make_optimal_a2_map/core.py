@@ -7,6 +7,8 @@ We *strictly* import the optimizer from the exact file:
 
 Outputs:
 - summary dataframe (r1, r2, frac_match, mean_signed_gap, n_valid, n_a1), optionally raw (a1, a2*).
+- the same tables as chunked binary columns (.npz, or Parquet with pyarrow) for large grids.
+- a2*, U1 and mask codes as memory-mapped [r1, r2, a1] arrays (make_optimal_a2_map.arrays).
 - PNG heatmaps for frac_match and mean_signed_gap.
 """
 
@@ -14,7 +16,12 @@ from __future__ import annotations
 import os
 import math
 import csv
-from typing import Dict, List, Tuple
+import inspect
+import json
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from optimize_a2.checkpoint import drop_torn_tail, ensure_dir, flush, read_manifest, write_manifest
 
 # ---------- FIXED PATHS ----------
 SRC_DIR = "/Users/tonymolino/Dropbox/Mac/Desktop/PyProjects/Value_Divergence/Value_Divergence_Code/src"
@@ -28,7 +35,9 @@ PNG_FRAC    = os.path.join(DEFAULT_OUTDIR, "opposites_attract_fraction_heatmap.p
 PNG_GAP     = os.path.join(DEFAULT_OUTDIR, "opposites_attract_signed_gap_heatmap.png")
 
 
+@lru_cache(maxsize=None)
 def _import_optimizer_strict():
+    # once per process: sys.path and the file-identity check do not change between cells
     import sys, os, importlib
     if SRC_DIR not in sys.path:
         sys.path.insert(0, SRC_DIR)
@@ -50,6 +59,323 @@ def _mrs_a2(a1: float, r1: float, r2: float) -> float:
     return float(num / den)
 
 
+def _optimizer_for(screen: bool):
+    """
+    opt(a1=, r1=, r2=, p1x=, ..., c2=, <optimizer tolerances>) -> OptimizationResult:
+    the full optimizer, or the screened fast path seeded with _mrs_a2, both interval ends and
+    the analytic optimum of every feasible mask segment (so the candidates cover every mask).
+    """
+    opt_fun, _ = _import_optimizer_strict()
+    if not screen:
+        def opt(*, r1: float, r2: float, **kw):
+            return opt_fun(**kw)
+        return opt
+
+    from optimize_a2.optimize_a2 import mask_segment_optima, optimize_a2_for_player1_screened
+
+    def opt_screened(*, r1: float, r2: float, **kw):
+        candidates = [_mrs_a2(kw["a1"], r1, r2), kw["a2_lo"], kw["a2_hi"]]
+        seg = mask_segment_optima(**{k: kw[k] for k in (
+            "a1", "p1x", "p1y", "p2x", "p2y", "c1", "c2", "a2_lo", "a2_hi", "solver_tol")})
+        candidates += [a2 for a2, _ in seg]
+        return optimize_a2_for_player1_screened(candidates=candidates, segment_optima=seg, **kw)
+    return opt_screened
+
+
+def _compensated_add(total, comp, x):
+    """
+    (total + x, comp + the exact rounding error of that addition): one step of a compensated
+    sum, read off as total + comp. Branch-free (TwoSum), so the same code runs on floats and
+    elementwise on numpy arrays; every summary of the signed gaps goes through it.
+    """
+    t = total + x
+    bp = t - total
+    return t, comp + ((total - (t - bp)) + (x - bp))
+
+
+class _OnlineCellSummary:
+    """
+    Running per-cell summary in O(1) memory: n_valid, n_match and a compensated sum
+    (_compensated_add) of the signed gaps (a2*−a1)·sign(r2−r1). r2 == r1 cells count a neutral
+    gap of 0.
+    """
+
+    __slots__ = ("sign_target", "n_valid", "n_match", "_sum", "_comp")
+
+    def __init__(self, sign_target: int) -> None:
+        self.sign_target = int(sign_target)
+        self.n_valid = 0
+        self.n_match = 0
+        self._sum = 0.0
+        self._comp = 0.0
+
+    def add(self, diff: float) -> None:
+        gap = 0.0
+        if self.sign_target != 0:
+            gap = diff * self.sign_target
+            if gap > 0.0:
+                self.n_match += 1
+        self._sum, self._comp = _compensated_add(self._sum, self._comp, gap)
+        self.n_valid += 1
+
+    def frac_match(self) -> float:
+        return (self.n_match / self.n_valid) if (self.n_valid > 0 and self.sign_target != 0) else float("nan")
+
+    def mean_signed_gap(self) -> float:
+        return ((self._sum + self._comp) / self.n_valid) if self.n_valid > 0 else float("nan")
+
+
+def _sweep_cell(
+    r1: float, r2: float, a1_grid, *,
+    c: float, scale1: float, scale2: float,
+    a2_lo: float, a2_hi: float, tol: float, max_iter: int,
+    solver_tol: float, solver_verbose: bool,
+    screen: bool = False,
+    tracker=None,
+) -> Tuple[Dict, List[Dict], Dict]:
+    """
+    One (r1, r2) cell: optimize a2 for every a1 and summarize.
+    Returns (summary_row, raw_rows, stats) with stats = {solver_calls, masks, failures}.
+
+    screen=True tries the analytic interior benchmark _mrs_a2, both interval ends and each feasible
+    mask segment's analytic optimum first and refines around the best of them
+    (optimize_a2_for_player1_screened);
+    other points get the full optimizer. Each raw row's "path" is the optimizer strategy used.
+    """
+    opt_fun = _optimizer_for(screen)
+
+    # productivities from (r1,r2), holding p_iy = 1
+    p1x = scale1 * r1; p1y = scale1 * 1.0
+    p2x = scale2 * r2; p2y = scale2 * 1.0
+
+    sign_target = 0
+    if r2 > r1:  # 2 better at X than 1
+        sign_target = +1
+    elif r2 < r1:
+        sign_target = -1
+
+    acc = _OnlineCellSummary(sign_target)
+    raw_rows: List[Dict] = []
+    stats: Dict = {"solver_calls": 0, "masks": [], "failures": 0}
+
+    for a1 in a1_grid:
+        try:
+            res = opt_fun(
+                a1=float(a1), r1=float(r1), r2=float(r2),
+                p1x=float(p1x), p1y=float(p1y),
+                p2x=float(p2x), p2y=float(p2y),
+                c1=float(c), c2=float(c),
+                a2_lo=float(a2_lo), a2_hi=float(a2_hi),
+                tol=float(tol), max_iter=int(max_iter),
+                solver_tol=float(solver_tol), solver_verbose=bool(solver_verbose),
+            )
+            a2_star = float(res.best_a2)
+        except Exception:
+            # skip failed points
+            stats["failures"] += 1
+            if tracker is not None:
+                tracker.update(failures=1)
+            continue
+        stats["solver_calls"] += len(res.samples)
+        stats["masks"].append(str(res.chosen_mask))
+        if tracker is not None:
+            tracker.update(solver_calls=len(res.samples), masks=[str(res.chosen_mask)])
+
+        # classification
+        diff = a2_star - a1
+        acc.add(diff)
+
+        raw_rows.append({
+            "r1": float(r1), "r2": float(r2),
+            "a1": float(a1), "a2_star": float(a2_star),
+            # diagnostic: analytic interior baseline
+            "a2_mrs": float(_mrs_a2(a1, r1, r2)),
+            "diff": float(diff),
+            "sign_target": int(sign_target),
+            "path": str(res.strategy),
+        })
+
+    summary_row = {
+        "r1": float(r1), "r2": float(r2),
+        "ratio_r2_over_r1": float(r2 / r1) if r1 != 0 else float("inf"),
+        "n_valid": int(acc.n_valid),
+        "n_a1": int(len(a1_grid)),
+        "frac_match_opposites": float(acc.frac_match()),
+        "mean_signed_gap": float(acc.mean_signed_gap()),
+    }
+    return summary_row, raw_rows, stats
+
+
+def _sweep_cell_chunk(chunk: List[Tuple[int, float, float]], a1_grid, cell_kwargs: Dict) -> List[Tuple]:
+    """Worker entry point: run _sweep_cell for each (order_index, r1, r2) in the chunk."""
+    return [(k, *_sweep_cell(r1, r2, a1_grid, **cell_kwargs)) for k, r1, r2 in chunk]
+
+
+def _cell_cost(r1: float, r2: float) -> float:
+    """
+    Relative cost estimate of a cell. Cells near r1 == r2 sit on knife edges, where the solver
+    matches several masks and builds a solution for each, so they are weighted up.
+    """
+    gap = abs(math.log(r2 / r1)) if (r1 > 0 and r2 > 0) else 1.0
+    return 1.0 + 1.0 / (1.0 + 20.0 * gap)
+
+
+def _cost_balanced_chunks(
+    cells: List[Tuple[int, float, float]], n_chunks: int
+) -> List[List[Tuple[int, float, float]]]:
+    """
+    Split cells into chunks of roughly equal estimated cost, most expensive first
+    (longest-processing-time order keeps the tail of the run short).
+    """
+    ordered = sorted(cells, key=lambda t: (-_cell_cost(t[1], t[2]), t[0]))
+    budget = sum(_cell_cost(r1, r2) for _, r1, r2 in ordered) / max(1, n_chunks)
+    chunks: List[List[Tuple[int, float, float]]] = []
+    cur: List[Tuple[int, float, float]] = []
+    cur_cost = 0.0
+    for cell in ordered:
+        cur.append(cell)
+        cur_cost += _cell_cost(cell[1], cell[2])
+        if cur_cost >= budget:
+            chunks.append(cur)
+            cur, cur_cost = [], 0.0
+    if cur:
+        chunks.append(cur)
+    return chunks
+
+
+def shard_cells(cells: List[Tuple[float, float]], shard_index: int, n_shards: int) -> List[Tuple[float, float]]:
+    """
+    The (r1, r2) cells owned by shard `shard_index` of `n_shards`, in their original order.
+
+    Deterministic longest-processing-time assignment: cells sorted by _cell_cost (descending,
+    ties by grid position) go one by one to the currently least-loaded shard (ties -> lowest
+    shard index). Every host computes the same partition from the grid alone, so shards need
+    no coordination; together they cover each cell exactly once.
+    """
+    if not (n_shards >= 1 and 0 <= shard_index < n_shards):
+        raise ValueError("Require n_shards >= 1 and 0 <= shard_index < n_shards.")
+    import heapq
+
+    order = sorted(range(len(cells)), key=lambda k: (-_cell_cost(*cells[k]), k))
+    loads = [(0.0, s) for s in range(n_shards)]  # already a valid heap
+    owner = [0] * len(cells)
+    for k in order:
+        load, s_min = heapq.heappop(loads)
+        owner[k] = s_min
+        heapq.heappush(loads, (load + _cell_cost(*cells[k]), s_min))
+    return [cell for cell, s in zip(cells, owner) if s == shard_index]
+
+
+def _run_cells(
+    cells: List[Tuple[float, float]], a1_grid, cell_kwargs: Dict, tracker, *,
+    workers: int = 1, chunks_per_worker: int = 4,
+) -> Iterator[Tuple[Dict, List[Dict]]]:
+    """
+    Compute the given (r1, r2) cells and yield (summary_row, raw_rows) in the given order,
+    serially or in a process pool (see iter_sweep_productivities). The caller starts and
+    finishes the tracker.
+    """
+    if int(workers) <= 1 or len(cells) <= 1:
+        for r1, r2 in cells:
+            summary_row, raw_rows, _ = _sweep_cell(r1, r2, a1_grid, tracker=tracker, **cell_kwargs)
+            yield summary_row, raw_rows
+        return
+
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    indexed = [(k, r1, r2) for k, (r1, r2) in enumerate(cells)]
+    chunks = _cost_balanced_chunks(indexed, int(workers) * max(1, int(chunks_per_worker)))
+    done: Dict[int, Tuple[Dict, List[Dict]]] = {}
+    next_k = 0
+    with ProcessPoolExecutor(max_workers=int(workers)) as pool:
+        futures = [pool.submit(_sweep_cell_chunk, chunk, a1_grid, cell_kwargs) for chunk in chunks]
+        for fut in as_completed(futures):
+            for k, summary_row, raw_rows, stats in fut.result():
+                done[k] = (summary_row, raw_rows)
+                tracker.update(
+                    units=len(a1_grid), solver_calls=stats["solver_calls"],
+                    masks=stats["masks"], failures=stats["failures"],
+                )
+            # release every cell that is next in serial order
+            while next_k in done:
+                yield done.pop(next_k)
+                next_k += 1
+
+
+def _sweep_cells(
+    r1_min: float, r1_max: float, r1_steps: int,
+    r2_min: float, r2_max: float, r2_steps: int,
+    shard: Optional[Tuple[int, int]] = None,
+) -> List[Tuple[float, float]]:
+    """The grid's (r1, r2) cells in r1-major order, restricted to shard=(i, N) if given."""
+    import numpy as np
+
+    r1_grid = np.linspace(r1_min, r1_max, r1_steps)
+    r2_grid = np.linspace(r2_min, r2_max, r2_steps)
+    cells = [(r1, r2) for r1 in r1_grid for r2 in r2_grid]
+    if shard is not None:
+        mine = set(shard_cells([(float(r1), float(r2)) for r1, r2 in cells], *shard))
+        cells = [(r1, r2) for r1, r2 in cells if (float(r1), float(r2)) in mine]
+    return cells
+
+
+def iter_sweep_productivities(
+    *,
+    r1_min: float = 0.5, r1_max: float = 2.0, r1_steps: int = 16,
+    r2_min: float = 0.5, r2_max: float = 2.0, r2_steps: int = 16,
+    a1_min: float = 0.01, a1_max: float = 0.99, a1_steps: int = 101,
+    c: float = 1.0,
+    scale1: float = 1.0,
+    scale2: float = 1.0,
+    a2_lo: float = 1e-6, a2_hi: float = 1.0 - 1e-6, tol: float = 1e-5, max_iter: int = 200,
+    solver_tol: float = 1e-10, solver_verbose: bool = False,
+    skip_cells: Optional[Set[Tuple[float, float]]] = None,
+    progress=None,
+    workers: int = 1,
+    chunks_per_worker: int = 4,
+    shard: Optional[Tuple[int, int]] = None,
+    screen: bool = False,
+) -> Iterator[Tuple[Dict, List[Dict]]]:
+    """
+    Generator form of sweep_productivities: yields (summary_row, raw_rows_of_cell) for each
+    (r1, r2) cell, in the same r1-major order, as soon as the cell's a1 curve is finished.
+    Cells whose (r1, r2) is in skip_cells are not computed (used for resuming).
+
+    progress: observer or list of observers (optimize_a2.telemetry, e.g. ConsoleProgress,
+    JsonLinesProgress); one unit = one (r1, r2, a1) optimization.
+
+    workers > 1 runs cells in a process pool. Cells are grouped into about
+    workers * chunks_per_worker chunks of similar estimated cost (knife-edge cells near
+    r1 == r2 count more) and dispatched most expensive first. Results are buffered and yielded
+    in the serial order, and each cell is computed exactly as in the serial path, so the
+    output is identical to workers=1. Progress is then reported per finished cell.
+
+    shard=(i, N) restricts the sweep to shard i of N (0-based) as assigned by shard_cells:
+    a deterministic, cost-balanced partition of the full grid (see make_optimal_a2_map.shards).
+
+    screen=True enables the analytic screening fast path per (r1, r2, a1) (see _sweep_cell);
+    the raw rows' "path" column records which optimizer path produced each a2*.
+    """
+    import numpy as np
+    _import_optimizer_strict()
+    from optimize_a2.telemetry import ProgressTracker
+
+    a1_grid = np.linspace(a1_min, a1_max, a1_steps)
+    cells = _sweep_cells(r1_min, r1_max, r1_steps, r2_min, r2_max, r2_steps, shard)
+    if skip_cells:
+        cells = [(r1, r2) for r1, r2 in cells if (float(r1), float(r2)) not in skip_cells]
+    tracker = ProgressTracker(progress, label="sweep")
+    tracker.start(len(cells) * len(a1_grid))
+    cell_kwargs = dict(
+        c=c, scale1=scale1, scale2=scale2,
+        a2_lo=a2_lo, a2_hi=a2_hi, tol=tol, max_iter=max_iter,
+        solver_tol=solver_tol, solver_verbose=solver_verbose, screen=screen,
+    )
+
+    yield from _run_cells(cells, a1_grid, cell_kwargs, tracker, workers=workers, chunks_per_worker=chunks_per_worker)
+    tracker.finish()
+
+
 def sweep_productivities(
     *,
     r1_min: float = 0.5, r1_max: float = 2.0, r1_steps: int = 16,
@@ -63,6 +389,12 @@ def sweep_productivities(
     # optimizer tolerances
     a2_lo: float = 1e-6, a2_hi: float = 1.0 - 1e-6, tol: float = 1e-5, max_iter: int = 200,
     solver_tol: float = 1e-10, solver_verbose: bool = False,
+    # telemetry observer(s) from optimize_a2.telemetry (see iter_sweep_productivities)
+    progress=None,
+    # process-pool parallelism over (r1, r2) cells; output identical to workers=1
+    workers: int = 1,
+    # analytic screening fast path (see iter_sweep_productivities)
+    screen: bool = False,
 ) -> Tuple[List[Dict], List[Dict], str]:
     """
     Returns:
@@ -70,164 +402,454 @@ def sweep_productivities(
       raw_rows     : list of dicts with per-(r1,r2,a1) triplets (a2_star, a2_mrs, etc.)
       optimizer_src: the optimizer's file path actually used (sanity check)
     """
-    import numpy as np
-    opt_fun, opt_src = _import_optimizer_strict()
-
-    r1_grid = np.linspace(r1_min, r1_max, r1_steps)
-    r2_grid = np.linspace(r2_min, r2_max, r2_steps)
-    a1_grid = np.linspace(a1_min, a1_max, a1_steps)
+    _, opt_src = _import_optimizer_strict()
 
     summary_rows: List[Dict] = []
     raw_rows: List[Dict] = []
-
-    for r1 in r1_grid:
-        for r2 in r2_grid:
-            # productivities from (r1,r2), holding p_iy = 1
-            p1x = scale1 * r1; p1y = scale1 * 1.0
-            p2x = scale2 * r2; p2y = scale2 * 1.0
-
-            sign_target = 0
-            if r2 > r1:  # 2 better at X than 1
-                sign_target = +1
-            elif r2 < r1:
-                sign_target = -1
-
-            n_match = 0
-            signed_gaps: List[float] = []
-            n_valid = 0
-
-            for a1 in a1_grid:
-                try:
-                    res = opt_fun(
-                        a1=float(a1),
-                        p1x=float(p1x), p1y=float(p1y),
-                        p2x=float(p2x), p2y=float(p2y),
-                        c1=float(c), c2=float(c),
-                        a2_lo=float(a2_lo), a2_hi=float(a2_hi),
-                        tol=float(tol), max_iter=int(max_iter),
-                        solver_tol=float(solver_tol), solver_verbose=bool(solver_verbose),
-                    )
-                    a2_star = float(res.best_a2)
-                except Exception:
-                    # skip failed points
-                    continue
-
-                # classification
-                diff = a2_star - a1
-                if sign_target != 0:
-                    if diff * sign_target > 0.0:
-                        n_match += 1
-                    signed_gaps.append(diff * sign_target)
-                else:
-                    # r2 == r1: treat as neutral; signed gap = 0 for averaging
-                    signed_gaps.append(0.0)
-
-                n_valid += 1
-
-                raw_rows.append({
-                    "r1": float(r1), "r2": float(r2),
-                    "a1": float(a1), "a2_star": float(a2_star),
-                    # diagnostic: analytic interior baseline
-                    "a2_mrs": float(_mrs_a2(a1, r1, r2)),
-                    "diff": float(diff),
-                    "sign_target": int(sign_target),
-                })
-
-            frac_match = (n_match / n_valid) if (n_valid > 0 and sign_target != 0) else float("nan")
-            mean_signed_gap = (sum(signed_gaps) / len(signed_gaps)) if signed_gaps else float("nan")
-
-            summary_rows.append({
-                "r1": float(r1), "r2": float(r2),
-                "ratio_r2_over_r1": float(r2 / r1) if r1 != 0 else float("inf"),
-                "n_valid": int(n_valid),
-                "n_a1": int(len(a1_grid)),
-                "frac_match_opposites": float(frac_match),
-                "mean_signed_gap": float(mean_signed_gap),
-            })
+    for summary_row, cell_rows in iter_sweep_productivities(
+        r1_min=r1_min, r1_max=r1_max, r1_steps=r1_steps,
+        r2_min=r2_min, r2_max=r2_max, r2_steps=r2_steps,
+        a1_min=a1_min, a1_max=a1_max, a1_steps=a1_steps,
+        c=c, scale1=scale1, scale2=scale2,
+        a2_lo=a2_lo, a2_hi=a2_hi, tol=tol, max_iter=max_iter,
+        solver_tol=solver_tol, solver_verbose=solver_verbose,
+        progress=progress,
+        workers=workers,
+        screen=screen,
+    ):
+        summary_rows.append(summary_row)
+        raw_rows.extend(cell_rows)
 
     return summary_rows, raw_rows, opt_src
 
 
-def _ensure_dir(path: str) -> None:
-    os.makedirs(path, exist_ok=True)
+def stream_sweep_productivities(
+    *,
+    summary_path: str = SUMMARY_CSV,
+    raw_path: Optional[str] = RAW_CSV,
+    resume: bool = True,
+    flush_every: int = 1,
+    **sweep_kwargs,
+) -> Iterator[Tuple[Dict, List[Dict]]]:
+    """
+    Streaming, resumable sweep. Accepts the same keyword arguments as sweep_productivities.
+
+    Each finished (r1, r2) cell is appended to summary_path (and its a1 rows to raw_path,
+    unless raw_path is None) with the same columns as save_summary_csv / save_raw_curves_csv,
+    then yielded as (summary_row, raw_rows_of_cell). Every `flush_every` cells both files are
+    flushed + fsynced and <summary_path>.manifest.json is rewritten atomically.
+
+    A cell counts as done once its summary row is on disk (raw rows are written first).
+    resume=True with a manifest for the *same* parameters skips done cells and drops raw rows
+    of a cell that was interrupted mid-write; different parameters raise ValueError.
+    """
+    if flush_every < 1:
+        raise ValueError("Require flush_every >= 1.")
+    params = _sweep_params(sweep_kwargs)
+    # cells this run owns: the shard's share of the grid when shard=(i, N) is set
+    n_total = len(_sweep_cells(
+        params["r1_min"], params["r1_max"], int(params["r1_steps"]),
+        params["r2_min"], params["r2_max"], int(params["r2_steps"]),
+        tuple(params["shard"]) if params["shard"] is not None else None,
+    ))
+    manifest_path = summary_path + ".manifest.json"
+
+    done_summary: List[Dict] = []
+    done_raw: List[Dict] = []
+    if resume and os.path.exists(manifest_path):
+        manifest = read_manifest(manifest_path)
+        if manifest.get("params") != params:
+            raise ValueError(
+                f"Checkpoint {manifest_path} was written with different parameters; "
+                "use another summary_path or resume=False."
+            )
+        if os.path.exists(summary_path):
+            drop_torn_tail(summary_path)
+            done_summary = _load_csv_rows(summary_path, _SUMMARY_KEYS)
+        if raw_path is not None and os.path.exists(raw_path):
+            drop_torn_tail(raw_path)
+            done_raw = _load_csv_rows(raw_path, _RAW_KEYS)
+
+    done_cells = {(float(r["r1"]), float(r["r2"])) for r in done_summary}
+    done_raw = [r for r in done_raw if (float(r["r1"]), float(r["r2"])) in done_cells]
+
+    # (Re)write both files with only the completed cells, then append from there.
+    _write_csv_rows(done_summary, summary_path, _SUMMARY_KEYS)
+    if raw_path is not None:
+        _write_csv_rows(done_raw, raw_path, _RAW_KEYS)
+    n_done = len(done_cells)
+    write_manifest(manifest_path, params=params, n_total=n_total, n_done=n_done, complete=n_done >= n_total)
+
+    f_sum = open(summary_path, "a", newline="")
+    f_raw = open(raw_path, "a", newline="") if raw_path is not None else None
+    try:
+        w_sum = csv.DictWriter(f_sum, fieldnames=_SUMMARY_KEYS)
+        w_raw = csv.DictWriter(f_raw, fieldnames=_RAW_KEYS) if f_raw is not None else None
+        since_flush = 0
+        for summary_row, cell_rows in iter_sweep_productivities(skip_cells=done_cells, **sweep_kwargs):
+            if w_raw is not None:
+                for r in cell_rows:
+                    w_raw.writerow({k: r.get(k, "") for k in _RAW_KEYS})
+                f_raw.flush()
+            w_sum.writerow({k: summary_row.get(k, "") for k in _SUMMARY_KEYS})
+            n_done += 1
+            since_flush += 1
+            if since_flush >= flush_every:
+                if f_raw is not None:
+                    flush(f_raw)
+                flush(f_sum)
+                write_manifest(manifest_path, params=params, n_total=n_total, n_done=n_done, complete=False)
+                since_flush = 0
+            yield summary_row, cell_rows
+        if f_raw is not None:
+            flush(f_raw)
+        flush(f_sum)
+    finally:
+        f_sum.close()
+        if f_raw is not None:
+            f_raw.close()
+
+    write_manifest(manifest_path, params=params, n_total=n_total, n_done=n_done, complete=True)
+
+
+# ---------- COLUMNAR (BINARY) OUTPUT ----------
+_SUMMARY_DTYPES = {
+    "r1": "f8", "r2": "f8", "ratio_r2_over_r1": "f8", "n_valid": "i4", "n_a1": "i4",
+    "frac_match_opposites": "f8", "mean_signed_gap": "f8",
+}
+_RAW_DTYPES = {
+    "r1": "f8", "r2": "f8", "a1": "f8", "a2_star": "f8", "a2_mrs": "f8", "diff": "f8", "sign_target": "i1",
+    "path": "U16",
+}
+
+
+def _columnar_format(fmt: str) -> str:
+    """'auto' -> 'parquet' when pyarrow is importable, else 'npz'."""
+    if fmt == "auto":
+        try:
+            import pyarrow  # noqa: F401
+            import pyarrow.parquet  # noqa: F401
+            return "parquet"
+        except ImportError:
+            return "npz"
+    if fmt not in ("npz", "parquet"):
+        raise ValueError("fmt must be 'auto', 'npz' or 'parquet'.")
+    return fmt
+
+
+class _ColumnarChunkWriter:
+    """
+    Buffers rows into preallocated column arrays of `chunk_rows` and writes each full buffer
+    as one chunk file <prefix>-<00000>.<npz|parquet>. Memory is bounded by one chunk.
+    """
 
+    def __init__(self, out_dir: str, prefix: str, dtypes: Dict[str, str], chunk_rows: int, fmt: str) -> None:
+        import numpy as np
+
+        if chunk_rows < 1:
+            raise ValueError("Require chunk_rows >= 1.")
+        self.out_dir = out_dir
+        self.prefix = prefix
+        self.dtypes = dtypes
+        self.chunk_rows = int(chunk_rows)
+        self.fmt = fmt
+        self.chunks: List[Dict] = []
+        self._buf = {k: np.empty(self.chunk_rows, dtype=dt) for k, dt in dtypes.items()}
+        self._n = 0
+
+    def append(self, row: Dict) -> None:
+        for k, col in self._buf.items():
+            col[self._n] = row[k]
+        self._n += 1
+        if self._n == self.chunk_rows:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._n == 0:
+            return
+        name = f"{self.prefix}-{len(self.chunks):05d}.{self.fmt}"
+        path = os.path.join(self.out_dir, name)
+        cols = {k: col[: self._n] for k, col in self._buf.items()}
+        tmp = path + ".tmp"
+        if self.fmt == "parquet":
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            pq.write_table(pa.table(cols), tmp)
+        else:
+            import numpy as np
+            with open(tmp, "wb") as f:
+                np.savez(f, **cols)
+        os.replace(tmp, path)
+        self.chunks.append({"file": name, "n_rows": int(self._n)})
+        self._n = 0
+
+
+def sweep_productivities_columnar(
+    *,
+    out_dir: str = os.path.join(DEFAULT_OUTDIR, "opposites_attract_grid"),
+    fmt: str = "auto",
+    chunk_rows: int = 65536,
+    write_raw: bool = True,
+    **sweep_kwargs,
+) -> Dict:
+    """
+    Run the sweep (same keyword arguments as sweep_productivities, including workers/progress)
+    and stream results into chunked binary columnar files under out_dir:
+      raw-00000.<fmt>, ...      columns of save_raw_curves_csv (one row per (r1, r2, a1))
+      summary-00000.<fmt>, ...  columns of save_summary_csv (one row per (r1, r2))
+      manifest.json             parameters, format, chunk list and row counts
+    fmt: 'npz', 'parquet' (needs pyarrow) or 'auto' (parquet if available).
+
+    Per-cell frac_match_opposites / mean_signed_gap come from online accumulators, and nothing
+    is kept beyond one chunk per output, so memory does not grow with the grid.
+    Read back with load_columnar(out_dir, "summary" | "raw").
+
+    Returns the manifest dict.
+    """
+    fmt = _columnar_format(fmt)
+    params = _sweep_params(sweep_kwargs)
+    ensure_dir(out_dir)
+    manifest_path = os.path.join(out_dir, "manifest.json")
+
+    summary_w = _ColumnarChunkWriter(out_dir, "summary", _SUMMARY_DTYPES, chunk_rows, fmt)
+    raw_w = _ColumnarChunkWriter(out_dir, "raw", _RAW_DTYPES, chunk_rows, fmt) if write_raw else None
+    write_manifest(manifest_path, params=params, format=fmt, summary=[], raw=[], complete=False)
+
+    for summary_row, cell_rows in iter_sweep_productivities(**sweep_kwargs):
+        if raw_w is not None:
+            for r in cell_rows:
+                raw_w.append(r)
+        summary_w.append(summary_row)
+    summary_w.flush()
+    if raw_w is not None:
+        raw_w.flush()
+
+    manifest = dict(
+        params=params, format=fmt,
+        summary=summary_w.chunks, raw=raw_w.chunks if raw_w is not None else [],
+        n_summary_rows=sum(ch["n_rows"] for ch in summary_w.chunks),
+        n_raw_rows=sum(ch["n_rows"] for ch in raw_w.chunks) if raw_w is not None else 0,
+        complete=True,
+    )
+    write_manifest(manifest_path, **manifest)
+    return read_manifest(manifest_path)
+
+
+def iter_columnar_chunks(out_dir: str, which: str = "summary") -> Iterator[Dict]:
+    """Yield each chunk of a columnar sweep output as {column: ndarray}, in write order."""
+    import numpy as np
 
-def save_summary_csv(rows: List[Dict], path: str = SUMMARY_CSV) -> str:
-    _ensure_dir(os.path.dirname(path))
-    if not rows:
-        return path
-    keys = ["r1", "r2", "ratio_r2_over_r1", "n_valid", "n_a1", "frac_match_opposites", "mean_signed_gap"]
+    if which not in ("summary", "raw"):
+        raise ValueError("which must be 'summary' or 'raw'.")
+    manifest = read_manifest(os.path.join(out_dir, "manifest.json"))
+    for ch in manifest[which]:
+        path = os.path.join(out_dir, ch["file"])
+        if manifest["format"] == "parquet":
+            import pyarrow.parquet as pq
+            table = pq.read_table(path)
+            yield {k: table.column(k).to_numpy() for k in table.column_names}
+        else:
+            with np.load(path) as z:
+                yield {k: z[k] for k in z.files}
+
+
+def load_columnar(out_dir: str, which: str = "summary") -> Dict:
+    """Concatenate all chunks of a columnar sweep output into {column: ndarray}."""
+    import numpy as np
+
+    dtypes = _SUMMARY_DTYPES if which == "summary" else _RAW_DTYPES
+    parts = list(iter_columnar_chunks(out_dir, which))
+    if not parts:
+        return {k: np.empty(0, dtype=dt) for k, dt in dtypes.items()}
+    return {k: np.concatenate([p[k] for p in parts]) for k in parts[0]}
+
+
+_SUMMARY_KEYS = ["r1", "r2", "ratio_r2_over_r1", "n_valid", "n_a1", "frac_match_opposites", "mean_signed_gap"]
+_RAW_KEYS = ["r1", "r2", "a1", "a2_star", "a2_mrs", "diff", "sign_target", "path"]
+_TEXT_KEYS = {"path"}
+
+
+def _write_csv_rows(rows: List[Dict], path: str, keys: List[str]) -> None:
+    ensure_dir(os.path.dirname(path))
     with open(path, "w", newline="") as f:
         w = csv.DictWriter(f, fieldnames=keys)
         w.writeheader()
         for r in rows:
             w.writerow({k: r.get(k, "") for k in keys})
+
+
+def _load_csv_rows(path: str, keys: List[str]) -> List[Dict]:
+    """Read back rows written with `keys`; rows with missing/unparseable fields are dropped."""
+    rows: List[Dict] = []
+    with open(path, "r", newline="") as f:
+        for r in csv.DictReader(f):
+            try:
+                for k in keys:
+                    if k not in _TEXT_KEYS:
+                        float(r[k])
+            except (KeyError, TypeError, ValueError):
+                continue
+            rows.append({k: (r.get(k) or "") if k in _TEXT_KEYS else r[k] for k in keys})
+    return rows
+
+
+def _sweep_params(sweep_kwargs: Dict) -> Dict:
+    """Full, JSON-ready sweep parameter dict (defaults filled in) that identifies a run."""
+    if "skip_cells" in sweep_kwargs:
+        raise TypeError("skip_cells is managed by the checkpoint; do not pass it.")
+    bound = inspect.signature(iter_sweep_productivities).bind(**sweep_kwargs)
+    bound.apply_defaults()
+    params = dict(bound.arguments)
+    params.pop("skip_cells", None)
+    params.pop("solver_verbose", None)
+    params.pop("progress", None)
+    params.pop("workers", None)
+    params.pop("chunks_per_worker", None)
+    return json.loads(json.dumps(params))
+
+
+def save_summary_csv(rows: List[Dict], path: str = SUMMARY_CSV) -> str:
+    ensure_dir(os.path.dirname(path))
+    if not rows:
+        return path
+    _write_csv_rows(rows, path, _SUMMARY_KEYS)
     return path
 
 
 def save_raw_curves_csv(rows: List[Dict], path: str = RAW_CSV) -> str:
-    _ensure_dir(os.path.dirname(path))
+    ensure_dir(os.path.dirname(path))
     if not rows:
         return path
-    keys = ["r1", "r2", "a1", "a2_star", "a2_mrs", "diff", "sign_target"]
-    with open(path, "w", newline="") as f:
-        w = csv.DictWriter(f, fieldnames=keys)
-        w.writeheader()
-        for r in rows:
-            w.writerow({k: r.get(k, "") for k in keys})
+    _write_csv_rows(rows, path, _RAW_KEYS)
     return path
 
 
-def plot_fraction_heatmap(rows: List[Dict], path: str = PNG_FRAC) -> str:
+def load_summary_columns(path: str = SUMMARY_CSV) -> Dict:
+    """
+    Load a saved summary (save_summary_csv / stream_sweep_productivities output) as columns:
+    {key: 1-D float ndarray} for every summary key present in the file. No recomputation.
+    """
     import numpy as np
-    import matplotlib.pyplot as plt
-
-    # pivot to grid by (r1,r2)
-    r1_vals = sorted(set(float(r["r1"]) for r in rows))
-    r2_vals = sorted(set(float(r["r2"]) for r in rows))
-    m = len(r1_vals); n = len(r2_vals)
-    Z = np.full((m, n), np.nan)
-    for r in rows:
-        i = r1_vals.index(float(r["r1"]))
-        j = r2_vals.index(float(r["r2"]))
-        Z[i, j] = float(r["frac_match_opposites"])
-
-    _ensure_dir(os.path.dirname(path))
-    plt.figure()
-    plt.imshow(Z, origin="lower", aspect="auto",
-               extent=[min(r2_vals), max(r2_vals), min(r1_vals), max(r1_vals)])
-    plt.colorbar(label="Fraction matching opposites-attract")
-    plt.xlabel("r2 (p2x/p2y)")
-    plt.ylabel("r1 (p1x/p1y)")
-    plt.title("Opposites-Attract Match Fraction over (r1, r2)")
-    plt.tight_layout()
-    plt.savefig(path, dpi=200)
-    plt.close()
-    return path
+
+    with open(path, "r", newline="") as f:
+        header = next(csv.reader(f))
+    keys = [k for k in _SUMMARY_KEYS if k in header]
+    data = np.loadtxt(path, delimiter=",", skiprows=1, usecols=[header.index(k) for k in keys], ndmin=2)
+    return {k: data[:, i] for i, k in enumerate(keys)}
 
 
-def plot_signed_gap_heatmap(rows: List[Dict], path: str = PNG_GAP) -> str:
+def _summary_columns(source, keys: List[str]) -> Dict:
+    """
+    Normalize a heatmap source to {key: ndarray}: a list of summary row dicts, a mapping of
+    columns (lists/arrays), a path to a saved summary CSV, or a columnar / memmap output directory.
+    """
     import numpy as np
-    import matplotlib.pyplot as plt
-
-    r1_vals = sorted(set(float(r["r1"]) for r in rows))
-    r2_vals = sorted(set(float(r["r2"]) for r in rows))
-    m = len(r1_vals); n = len(r2_vals)
-    Z = np.full((m, n), np.nan)
-    for r in rows:
-        i = r1_vals.index(float(r["r1"]))
-        j = r2_vals.index(float(r["r2"]))
-        Z[i, j] = float(r["mean_signed_gap"])
-
-    _ensure_dir(os.path.dirname(path))
-    plt.figure()
-    plt.imshow(Z, origin="lower", aspect="auto",
-               extent=[min(r2_vals), max(r2_vals), min(r1_vals), max(r1_vals)])
-    plt.colorbar(label="Mean signed gap  E[(a2*−a1)·sign(r2−r1)]")
-    plt.xlabel("r2 (p2x/p2y)")
-    plt.ylabel("r1 (p1x/p1y)")
-    plt.title("Signed Gap over (r1, r2)")
-    plt.tight_layout()
-    plt.savefig(path, dpi=200)
-    plt.close()
+
+    if isinstance(source, (str, os.PathLike)):
+        from .arrays import is_memmap_sweep, summarize_sweep_memmap
+
+        path = os.fspath(source)
+        if is_memmap_sweep(path):
+            source = summarize_sweep_memmap(path)
+        elif os.path.isdir(path):
+            source = load_columnar(path, "summary")
+        else:
+            source = load_summary_columns(path)
+    if isinstance(source, dict):
+        return {k: np.asarray(source[k], dtype=float) for k in keys}
+    rows = list(source)
+    return {k: np.fromiter((float(r[k]) for r in rows), dtype=float, count=len(rows)) for k in keys}
+
+
+def _pivot_axes(r1, r2):
+    """Sorted unique r1 / r2 axes and each row's (i, j) position on them (np.unique inverse)."""
+    import numpy as np
+
+    r1_vals, i = np.unique(r1, return_inverse=True)
+    r2_vals, j = np.unique(r2, return_inverse=True)
+    return r1_vals, r2_vals, i, j
+
+
+def _pivot_grid(r1, r2, values):
+    """
+    Vectorized pivot of (r1, r2, value) columns onto the sorted unique axes.
+    Returns (r1_vals, r2_vals, Z) with Z[i, j] = value at (r1_vals[i], r2_vals[j]), NaN if absent.
+    """
+    import numpy as np
+
+    r1_vals, r2_vals, i, j = _pivot_axes(r1, r2)
+    Z = np.full((len(r1_vals), len(r2_vals)), np.nan)
+    Z[i, j] = values
+    return r1_vals, r2_vals, Z
+
+
+@lru_cache(maxsize=None)
+def _import_figures():
+    import figures
+    return figures
+
+
+def _heatmap_spec(r1_vals, r2_vals, Z, path: str, *, cbar_label: str, title: str):
+    return _import_figures().FigureSpec(
+        path=path, kind="heatmap", data={"x": r2_vals, "y": r1_vals, "Z": Z},
+        options={"xlabel": "r2 (p2x/p2y)", "ylabel": "r1 (p1x/p1y)", "title": title, "cbar_label": cbar_label},
+    )
+
+
+def _save_heatmap(r1_vals, r2_vals, Z, path: str, *, cbar_label: str, title: str) -> str:
+    """Render on the Agg canvas (figures.render_figure); unchanged inputs skip the redraw."""
+    _import_figures().render_figure(_heatmap_spec(r1_vals, r2_vals, Z, path, cbar_label=cbar_label, title=title))
     return path
+
+
+_FRAC_LABELS = dict(
+    cbar_label="Fraction matching opposites-attract",
+    title="Opposites-Attract Match Fraction over (r1, r2)",
+)
+_GAP_LABELS = dict(
+    cbar_label="Mean signed gap  E[(a2*−a1)·sign(r2−r1)]",
+    title="Signed Gap over (r1, r2)",
+)
+
+
+def plot_fraction_heatmap(rows, path: str = PNG_FRAC) -> str:
+    """rows: summary row dicts, a dict of columns, a saved summary CSV path or a columnar / memmap output dir."""
+    cols = _summary_columns(rows, ["r1", "r2", "frac_match_opposites"])
+    r1_vals, r2_vals, Z = _pivot_grid(cols["r1"], cols["r2"], cols["frac_match_opposites"])
+    return _save_heatmap(r1_vals, r2_vals, Z, path, **_FRAC_LABELS)
+
+
+def plot_signed_gap_heatmap(rows, path: str = PNG_GAP) -> str:
+    """rows: summary row dicts, a dict of columns, a saved summary CSV path or a columnar / memmap output dir."""
+    cols = _summary_columns(rows, ["r1", "r2", "mean_signed_gap"])
+    r1_vals, r2_vals, Z = _pivot_grid(cols["r1"], cols["r2"], cols["mean_signed_gap"])
+    return _save_heatmap(r1_vals, r2_vals, Z, path, **_GAP_LABELS)
+
+
+def plot_heatmaps_from_summary(
+    source=SUMMARY_CSV,
+    frac_path: str = PNG_FRAC,
+    gap_path: str = PNG_GAP,
+    *,
+    workers: int = 1,
+) -> Tuple[str, str]:
+    """
+    Re-render both heatmaps from stored results with a single load and a single pivot of the
+    (r1, r2) axes. source: saved summary CSV path (default), columnar or memmap output dir, dict of
+    columns, or row dicts. workers=2 draws the two figures in parallel; figures whose inputs
+    are unchanged since the last render are skipped (figures.render_figures).
+    """
+    import numpy as np
+
+    cols = _summary_columns(source, ["r1", "r2", "frac_match_opposites", "mean_signed_gap"])
+    r1_vals, r2_vals, i, j = _pivot_axes(cols["r1"], cols["r2"])
+    specs = []
+    for key, target, labels in (
+        ("frac_match_opposites", frac_path, _FRAC_LABELS),
+        ("mean_signed_gap", gap_path, _GAP_LABELS),
+    ):
+        Z = np.full((len(r1_vals), len(r2_vals)), np.nan)
+        Z[i, j] = cols[key]
+        specs.append(_heatmap_spec(r1_vals, r2_vals, Z, target, **labels))
+    _import_figures().render_figures(specs, workers=workers)
+    return frac_path, gap_path
@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+"""
+Adaptive (quadtree) version of the (r1, r2) productivity sweep.
+
+Most of a uniform r1_steps × r2_steps grid sits where frac_match_opposites is flat at 0 or 1.
+sweep_productivities_adaptive instead
+  1) sweeps a coarse coarse_steps × coarse_steps grid of cells (the quadtree roots);
+  2) splits every square whose corner summaries differ by more than frac_tol (or gap_tol)
+     into four, computing only the new edge midpoints and centre, level by level, up to
+     max_depth splits;
+  3) returns the computed summary rows, their raw rows, and the leaf squares.
+
+All computed points lie on the lattice of a uniform grid with
+    (coarse_steps − 1) · 2**max_depth + 1
+steps per axis, so a fully refined region is exactly that uniform sweep. Corners whose
+summary is NaN (e.g. frac_match_opposites on the r1 == r2 diagonal) are ignored by the split test.
+
+resample_adaptive_grid turns (summary_rows, leaves) into a dense grid of columns that the
+heatmap plotters accept directly; save_quadtree_leaves_csv exports the leaf list.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+from typing import Dict, List, Optional, Tuple
+
+from optimize_a2.checkpoint import ensure_dir
+
+from .core import (
+    _import_optimizer_strict,
+    _run_cells,
+    _write_csv_rows,
+)
+
+_LEAF_KEYS = ["r1_lo", "r1_hi", "r2_lo", "r2_hi", "depth", "frac_spread", "gap_spread"]
+_VALUE_KEYS = ["frac_match_opposites", "mean_signed_gap"]
+
+
+def _spread(values: List[float]) -> float:
+    finite = [v for v in values if math.isfinite(v)]
+    return (max(finite) - min(finite)) if len(finite) >= 2 else 0.0
+
+
+def sweep_productivities_adaptive(
+    *,
+    r1_min: float = 0.5, r1_max: float = 2.0,
+    r2_min: float = 0.5, r2_max: float = 2.0,
+    coarse_steps: int = 5,
+    max_depth: int = 4,
+    frac_tol: float = 0.2,
+    gap_tol: Optional[float] = None,
+    a1_min: float = 0.01, a1_max: float = 0.99, a1_steps: int = 101,
+    c: float = 1.0,
+    scale1: float = 1.0,
+    scale2: float = 1.0,
+    a2_lo: float = 1e-6, a2_hi: float = 1.0 - 1e-6, tol: float = 1e-5, max_iter: int = 200,
+    solver_tol: float = 1e-10, solver_verbose: bool = False,
+    progress=None,
+    workers: int = 1,
+    chunks_per_worker: int = 4,
+    screen: bool = False,
+) -> Tuple[List[Dict], List[Dict], List[Dict]]:
+    """
+    Quadtree-refined sweep (see module docstring).
+
+    A square is split when the spread (max − min) of frac_match_opposites over its four
+    corners exceeds frac_tol, or, if gap_tol is given, the spread of mean_signed_gap exceeds
+    gap_tol. Each level's new points are computed as one batch, so workers > 1 parallelizes
+    them like iter_sweep_productivities, and screen=True enables its analytic screening fast
+    path. progress counts (r1, r2, a1) optimizations (the total is not known up front).
+
+    Returns:
+      summary_rows : computed (r1, r2) summary rows (sweep_productivities columns), r1-major
+      raw_rows     : their per-a1 rows
+      leaves       : leaf squares as dicts with keys _LEAF_KEYS
+    """
+    if coarse_steps < 2 or max_depth < 0:
+        raise ValueError("Require coarse_steps >= 2 and max_depth >= 0.")
+    import numpy as np
+    _import_optimizer_strict()
+    from optimize_a2.telemetry import ProgressTracker
+
+    n_fine = (int(coarse_steps) - 1) * 2 ** int(max_depth)
+    r1_axis = np.linspace(r1_min, r1_max, n_fine + 1)
+    r2_axis = np.linspace(r2_min, r2_max, n_fine + 1)
+    a1_grid = np.linspace(a1_min, a1_max, a1_steps)
+    cell_kwargs = dict(
+        c=c, scale1=scale1, scale2=scale2,
+        a2_lo=a2_lo, a2_hi=a2_hi, tol=tol, max_iter=max_iter,
+        solver_tol=solver_tol, solver_verbose=solver_verbose, screen=screen,
+    )
+    tracker = ProgressTracker(progress, label="adaptive sweep")
+    tracker.start(None)
+
+    summary: Dict[Tuple[int, int], Dict] = {}
+    raw: Dict[Tuple[int, int], List[Dict]] = {}
+
+    def compute(points: List[Tuple[int, int]]) -> None:
+        todo = sorted({p for p in points if p not in summary})
+        cells = [(r1_axis[i], r2_axis[j]) for i, j in todo]
+        for (i, j), (summary_row, raw_rows) in zip(
+            todo, _run_cells(cells, a1_grid, cell_kwargs, tracker, workers=workers, chunks_per_worker=chunks_per_worker)
+        ):
+            summary[(i, j)] = summary_row
+            raw[(i, j)] = raw_rows
+
+    def spreads(i: int, j: int, size: int) -> Tuple[float, float]:
+        corners = [summary[(i + di, j + dj)] for di in (0, size) for dj in (0, size)]
+        return (
+            _spread([row["frac_match_opposites"] for row in corners]),
+            _spread([row["mean_signed_gap"] for row in corners]),
+        )
+
+    # a square is (i, j, size): lower-left lattice index and side length in lattice steps
+    size = 2 ** int(max_depth)
+    level = [(i, j, size) for i in range(0, n_fine, size) for j in range(0, n_fine, size)]
+    compute([(i, j) for i in range(0, n_fine + 1, size) for j in range(0, n_fine + 1, size)])
+
+    leaves: List[Dict] = []
+    for depth in range(int(max_depth) + 1):
+        split: List[Tuple[int, int, int]] = []
+        for i, j, s in level:
+            frac_spread, gap_spread = spreads(i, j, s)
+            wants_split = frac_spread > frac_tol or (gap_tol is not None and gap_spread > gap_tol)
+            if wants_split and depth < int(max_depth):
+                split.append((i, j, s))
+                continue
+            leaves.append({
+                "r1_lo": float(r1_axis[i]), "r1_hi": float(r1_axis[i + s]),
+                "r2_lo": float(r2_axis[j]), "r2_hi": float(r2_axis[j + s]),
+                "depth": depth, "frac_spread": frac_spread, "gap_spread": gap_spread,
+            })
+        if not split:
+            break
+        compute([
+            (i + di, j + dj)
+            for i, j, s in split
+            for di, dj in ((s // 2, 0), (0, s // 2), (s // 2, s // 2), (s, s // 2), (s // 2, s))
+        ])
+        level = [
+            (i + di, j + dj, s // 2)
+            for i, j, s in split
+            for di in (0, s // 2) for dj in (0, s // 2)
+        ]
+    tracker.finish()
+
+    keys = sorted(summary)
+    return [summary[k] for k in keys], [r for k in keys for r in raw[k]], leaves
+
+
+def resample_adaptive_grid(
+    summary_rows: List[Dict],
+    leaves: List[Dict],
+    *,
+    steps: Optional[int] = None,
+) -> Dict:
+    """
+    Dense steps × steps grid over the leaves' bounding box, as columns
+    {r1, r2, frac_match_opposites, mean_signed_gap} (r1-major), ready for
+    plot_fraction_heatmap / plot_signed_gap_heatmap / plot_heatmaps_from_summary.
+
+    Each grid point takes the bilinear interpolant of the corners of the finest leaf that
+    contains it (NaN corners are left out and the weights renormalized); grid points that
+    were computed keep their computed values. steps defaults to the finest leaf resolution,
+    i.e. the uniform lattice of the adaptive sweep.
+    """
+    import numpy as np
+
+    if not leaves:
+        raise ValueError("No leaves to resample.")
+    r1_min = min(lf["r1_lo"] for lf in leaves); r1_max = max(lf["r1_hi"] for lf in leaves)
+    r2_min = min(lf["r2_lo"] for lf in leaves); r2_max = max(lf["r2_hi"] for lf in leaves)
+    if steps is None:
+        finest = min(lf["r1_hi"] - lf["r1_lo"] for lf in leaves)
+        steps = int(round((r1_max - r1_min) / finest)) + 1
+    r1_vals = np.linspace(r1_min, r1_max, int(steps))
+    r2_vals = np.linspace(r2_min, r2_max, int(steps))
+
+    known = {(float(row["r1"]), float(row["r2"])): row for row in summary_rows}
+    out = {key: np.full((len(r1_vals), len(r2_vals)), np.nan) for key in _VALUE_KEYS}
+
+    eps1 = 1e-9 * (r1_max - r1_min)
+    eps2 = 1e-9 * (r2_max - r2_min)
+    # coarse leaves first, so finer leaves win on shared edges
+    for lf in sorted(leaves, key=lambda lf: lf["depth"]):
+        i0, i1 = np.searchsorted(r1_vals, [lf["r1_lo"] - eps1, lf["r1_hi"] + eps1])
+        j0, j1 = np.searchsorted(r2_vals, [lf["r2_lo"] - eps2, lf["r2_hi"] + eps2])
+        if i0 >= i1 or j0 >= j1:
+            continue
+        t = ((r1_vals[i0:i1] - lf["r1_lo"]) / (lf["r1_hi"] - lf["r1_lo"]))[:, None]
+        u = ((r2_vals[j0:j1] - lf["r2_lo"]) / (lf["r2_hi"] - lf["r2_lo"]))[None, :]
+        corners = [(lf["r1_lo"], lf["r2_lo"]), (lf["r1_lo"], lf["r2_hi"]),
+                   (lf["r1_hi"], lf["r2_lo"]), (lf["r1_hi"], lf["r2_hi"])]
+        weights = [(1 - t) * (1 - u), (1 - t) * u, t * (1 - u), t * u]
+        for key in _VALUE_KEYS:
+            num = np.zeros((i1 - i0, j1 - j0))
+            den = np.zeros((i1 - i0, j1 - j0))
+            for corner, w in zip(corners, weights):
+                v = float(known[corner][key])
+                if math.isfinite(v):
+                    num += w * v
+                    den += w
+            with np.errstate(invalid="ignore", divide="ignore"):
+                out[key][i0:i1, j0:j1] = np.where(den > 0, num / den, np.nan)
+
+    # computed points that fall on the dense grid keep their exact values
+    pts = np.array(list(known), dtype=float).reshape(-1, 2)
+    i = np.rint((pts[:, 0] - r1_min) / (r1_max - r1_min) * (len(r1_vals) - 1)).astype(int)
+    j = np.rint((pts[:, 1] - r2_min) / (r2_max - r2_min) * (len(r2_vals) - 1)).astype(int)
+    on_grid = (
+        (i >= 0) & (i < len(r1_vals)) & (j >= 0) & (j < len(r2_vals))
+        & (np.abs(r1_vals[np.clip(i, 0, len(r1_vals) - 1)] - pts[:, 0]) <= eps1)
+        & (np.abs(r2_vals[np.clip(j, 0, len(r2_vals) - 1)] - pts[:, 1]) <= eps2)
+    )
+    rows = list(known.values())
+    for key in _VALUE_KEYS:
+        vals = np.array([float(row[key]) for row in rows])
+        out[key][i[on_grid], j[on_grid]] = vals[on_grid]
+
+    R1, R2 = np.meshgrid(r1_vals, r2_vals, indexing="ij")
+    cols = {"r1": R1.ravel(), "r2": R2.ravel()}
+    cols.update({key: out[key].ravel() for key in _VALUE_KEYS})
+    return cols
+
+
+def save_quadtree_leaves_csv(leaves: List[Dict], path: str) -> str:
+    ensure_dir(os.path.dirname(path))
+    _write_csv_rows(leaves, path, _LEAF_KEYS)
+    return path
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+Sharded multi-host sweeps that only need a shared filesystem.
+
+Each host runs one shard:
+    run_sweep_shard(shard_index=i, n_shards=N, out_dir=SHARED_DIR, **sweep_kwargs)
+which computes the cells assigned to it by shard_cells (deterministic, cost-balanced) and writes
+    <out_dir>/shard-<i>-of-<N>.summary.csv / .raw.csv   (+ .manifest.json checkpoint)
+through stream_sweep_productivities, so a preempted shard resumes where it stopped.
+
+When all shards are done, one host runs
+    merge_sweep_shards(out_dir=SHARED_DIR, n_shards=N)
+which checks that every shard is complete, ran with the same parameters, and that the shards
+together cover every (r1, r2) cell exactly once, then writes the combined summary / raw CSVs in
+the serial r1-major order (the same files save_summary_csv / save_raw_curves_csv produce).
+
+Command-line entry point: Scripts/run_sweep_shard.py (--shard i/N, --merge N).
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Dict, List, Optional, Tuple
+
+from optimize_a2.checkpoint import drop_torn_tail, ensure_dir, read_manifest
+
+from .core import (
+    RAW_CSV,
+    SUMMARY_CSV,
+    _RAW_KEYS,
+    _SUMMARY_KEYS,
+    _load_csv_rows,
+    _write_csv_rows,
+    stream_sweep_productivities,
+)
+
+
+def parse_shard(spec: str) -> Tuple[int, int]:
+    """'i/N' -> (i, N), with 0 <= i < N."""
+    try:
+        i_txt, n_txt = spec.split("/")
+        i, n = int(i_txt), int(n_txt)
+    except ValueError:
+        raise ValueError(f"Shard spec must look like 'i/N', got {spec!r}.") from None
+    if not (n >= 1 and 0 <= i < n):
+        raise ValueError(f"Require 0 <= i < N in shard spec, got {spec!r}.")
+    return i, n
+
+
+def _shard_paths(out_dir: str, shard_index: int, n_shards: int) -> Tuple[str, str]:
+    stem = os.path.join(out_dir, f"shard-{shard_index}-of-{n_shards}")
+    return stem + ".summary.csv", stem + ".raw.csv"
+
+
+def run_sweep_shard(
+    *,
+    shard_index: int,
+    n_shards: int,
+    out_dir: str,
+    write_raw: bool = True,
+    resume: bool = True,
+    **sweep_kwargs,
+) -> Tuple[str, Optional[str]]:
+    """
+    Compute one shard of the sweep (same keyword arguments as sweep_productivities, including
+    workers/progress) into out_dir. Returns (summary_csv, raw_csv or None).
+    """
+    ensure_dir(out_dir)
+    summary_path, raw_path = _shard_paths(out_dir, shard_index, n_shards)
+    for _ in stream_sweep_productivities(
+        summary_path=summary_path,
+        raw_path=raw_path if write_raw else None,
+        resume=resume,
+        shard=(int(shard_index), int(n_shards)),
+        **sweep_kwargs,
+    ):
+        pass
+    return summary_path, (raw_path if write_raw else None)
+
+
+def _grid_cells(params: Dict) -> List[Tuple[float, float]]:
+    import numpy as np
+
+    r1_grid = np.linspace(params["r1_min"], params["r1_max"], params["r1_steps"])
+    r2_grid = np.linspace(params["r2_min"], params["r2_max"], params["r2_steps"])
+    return [(float(r1), float(r2)) for r1 in r1_grid for r2 in r2_grid]
+
+
+def merge_sweep_shards(
+    *,
+    out_dir: str,
+    n_shards: int,
+    summary_path: str = SUMMARY_CSV,
+    raw_path: Optional[str] = RAW_CSV,
+) -> Tuple[str, Optional[str]]:
+    """
+    Validate and merge the n_shards shard outputs in out_dir into summary_path / raw_path
+    (raw_path=None skips the raw merge). Raises ValueError listing missing shards, unfinished
+    shards, parameter mismatches, duplicate cells or missing cells.
+    """
+    problems: List[str] = []
+    params: Optional[Dict] = None
+    summary_by_cell: Dict[Tuple[float, float], Dict] = {}
+    raw_by_cell: Dict[Tuple[float, float], List[Dict]] = {}
+
+    for i in range(int(n_shards)):
+        s_path, r_path = _shard_paths(out_dir, i, n_shards)
+        m_path = s_path + ".manifest.json"
+        if not (os.path.exists(s_path) and os.path.exists(m_path)):
+            problems.append(f"shard {i}/{n_shards}: output missing ({s_path})")
+            continue
+        manifest = read_manifest(m_path)
+        if not manifest.get("complete", False):
+            problems.append(f"shard {i}/{n_shards}: not complete ({manifest.get('n_done')}/{manifest.get('n_total')})")
+        shard_params = dict(manifest.get("params", {}))
+        if shard_params.pop("shard", None) != [i, int(n_shards)]:
+            problems.append(f"shard {i}/{n_shards}: manifest belongs to a different shard")
+        if params is None:
+            params = shard_params
+        elif shard_params != params:
+            problems.append(f"shard {i}/{n_shards}: parameters differ from shard 0")
+
+        for row in _load_csv_rows(s_path, _SUMMARY_KEYS):
+            key = (float(row["r1"]), float(row["r2"]))
+            if key in summary_by_cell:
+                problems.append(f"duplicate cell r1={key[0]!r}, r2={key[1]!r} (shard {i})")
+            summary_by_cell[key] = row
+        if raw_path is not None:
+            if not os.path.exists(r_path):
+                problems.append(f"shard {i}/{n_shards}: raw output missing ({r_path})")
+                continue
+            drop_torn_tail(r_path)
+            for row in _load_csv_rows(r_path, _RAW_KEYS):
+                raw_by_cell.setdefault((float(row["r1"]), float(row["r2"])), []).append(row)
+
+    if params is not None:
+        expected = _grid_cells(params)
+        missing = [cell for cell in expected if cell not in summary_by_cell]
+        extra = set(summary_by_cell) - set(expected)
+        if missing:
+            problems.append(f"{len(missing)} cell(s) missing, e.g. r1={missing[0][0]!r}, r2={missing[0][1]!r}")
+        if extra:
+            problems.append(f"{len(extra)} cell(s) not on the sweep grid")
+    if problems:
+        raise ValueError("Cannot merge shards:\n  " + "\n  ".join(problems))
+
+    _write_csv_rows([summary_by_cell[cell] for cell in expected], summary_path, _SUMMARY_KEYS)
+    if raw_path is not None:
+        _write_csv_rows([r for cell in expected for r in raw_by_cell.get(cell, [])], raw_path, _RAW_KEYS)
+    return summary_path, raw_path
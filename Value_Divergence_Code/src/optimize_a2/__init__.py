@@ -4,9 +4,41 @@ value_divergence_tools
 Exports:
 - optimize_a2_for_player1: maximize player 1's utility over a2 in (0,1),
   repeatedly calling your standard solver in Finding_Equilibrium_1.py.
+- optimize_a2_for_player1_warm: same maximization, warm-started from a seed a2
+  (e.g. the previous a1's a2*), probing every mask segment's closed-form optimum.
+- optimize_a2_for_player1_screened: screening fast path that tries a few candidate a2 values
+  (e.g. an analytic benchmark, the endpoints and mask_segment_optima) and accepts the best only
+  when the candidates cover the analytic optimum of every feasible mask segment.
+- mask_segment_optima: closed-form argmax of U1 on each mask's feasible a2 segments (no solver calls).
+- a2_star_sensitivities / A2Sensitivity: a2* with exact d a2*/dθ and d U1*/dθ for every
+  parameter (implicit function theorem on the mask's closed-form U1), flagging endpoint
+  and mask-boundary optima where it does not apply (see optimize_a2.sensitivity).
 - OptimizationResult: container with best a2, U1, chosen mask, and the equilibrium dict.
+- ProgressTracker / ConsoleProgress / JsonLinesProgress: progress, throughput and ETA
+  telemetry for long curve and sweep runs (see optimize_a2.telemetry).
 """
 
-from .optimize_a2 import optimize_a2_for_player1, OptimizationResult
+from .optimize_a2 import (
+    optimize_a2_for_player1,
+    optimize_a2_for_player1_warm,
+    optimize_a2_for_player1_screened,
+    mask_segment_optima,
+    OptimizationResult,
+)
+from .sensitivity import SENSITIVITY_PARAMS, A2Sensitivity, a2_star_sensitivities
+from .telemetry import ProgressSnapshot, ProgressTracker, ConsoleProgress, JsonLinesProgress
 
-__all__ = ["optimize_a2_for_player1", "OptimizationResult"]
+__all__ = [
+    "optimize_a2_for_player1",
+    "optimize_a2_for_player1_warm",
+    "optimize_a2_for_player1_screened",
+    "mask_segment_optima",
+    "OptimizationResult",
+    "SENSITIVITY_PARAMS",
+    "A2Sensitivity",
+    "a2_star_sensitivities",
+    "ProgressSnapshot",
+    "ProgressTracker",
+    "ConsoleProgress",
+    "JsonLinesProgress",
+]
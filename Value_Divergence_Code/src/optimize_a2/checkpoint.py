@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""
+Crash-safe file helpers shared by the resumable curve (make_optimal_a2_graph) and sweep
+(make_optimal_a2_map) writers: fsync'd flushes, cutting a half-written last CSV line, and an
+atomically replaced JSON checkpoint manifest.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from typing import Dict
+
+
+def ensure_dir(path: str) -> None:
+    os.makedirs(path, exist_ok=True)
+
+
+def flush(f) -> None:
+    """Flush f and fsync it, so everything written so far survives a crash."""
+    f.flush()
+    os.fsync(f.fileno())
+
+
+def drop_torn_tail(path: str) -> None:
+    """Cut a trailing line that has no newline (a write interrupted by a crash)."""
+    with open(path, "rb+") as f:
+        data = f.read()
+        if data and not data.endswith(b"\n"):
+            f.truncate(data.rfind(b"\n") + 1)
+
+
+def read_manifest(path: str) -> Dict:
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def write_manifest(path: str, **fields) -> None:
+    """Atomically (tmp file + os.replace) write the checkpoint manifest."""
+    manifest = dict(fields, updated=time.strftime("%Y-%m-%dT%H:%M:%S"))
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        flush(f)
+    os.replace(tmp, path)
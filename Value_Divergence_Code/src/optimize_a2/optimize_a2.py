@@ -17,9 +17,10 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass
+from functools import lru_cache
 from importlib import import_module, util as importlib_util
 from types import ModuleType
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
 
 # ---- Exact file paths (no blanks). Update here if you move the file. ----
@@ -46,6 +47,7 @@ def _load_solver_from_path(pyfile: str) -> Optional[Tuple[Callable, str]]:
     return None
 
 
+@lru_cache(maxsize=None)
 def _import_solver() -> Tuple[Callable, str]:
     """
     Import the canonical equilibrium solver:
@@ -53,6 +55,8 @@ def _import_solver() -> Tuple[Callable, str]:
     Resolution order:
       1) Standard import by module name (if it's already on sys.path)
       2) Load directly from known absolute file paths in _CANDIDATE_FILES
+    Resolved once per process: every optimizer call asks for the solver, and step 2
+    re-executes the file, which cost ~8% of a warm-started optimization.
     """
     # 1) If user has already put it on sys.path
     try:
@@ -121,36 +125,25 @@ class OptimizationResult:
     eqm_at_best: Dict
     samples: List[Tuple[float, float, str]]  # (a2, U1, mask_or_note)
     solver_source: str
+    # how the coarse bracket was found: full_scan | warm | warm_fallback | screened | screen_fallback
+    strategy: str = "full_scan"
 
-def optimize_a2_for_player1(
+
+# Number of points in the uniform coarse scan (increase if you want even denser brute force)
+_COARSE_N = 2001
+
+
+def _make_trial(
+    eq_solver: Callable,
     *,
     a1: float,
     p1x: float, p1y: float,
     p2x: float, p2y: float,
     c1: float, c2: float,
-    a2_lo: float = 1e-6,         # open interval (0,1): the solver requires a2 in (0,1)
-    a2_hi: float = 1.0 - 1e-6,
-    tol: float = 1e-5,
-    max_iter: int = 200,
-    solver_tol: float = 1e-10,
-    solver_verbose: bool = False,
-) -> OptimizationResult:
-    """
-    Robust maximization of Player 1's utility over a2 ∈ (a2_lo, a2_hi).
-
-    Strategy:
-      (1) Uniform coarse scan across the *entire* interval (no assumptions).
-      (2) Golden-section refinement in a small bracket around the best coarse point.
-      (3) ALWAYS include the true global endpoints as candidates.
-      (4) Return the best among all candidates.
-
-    This fixes failures when U1(a2) is piecewise / has jumps at mask switches.
-    """
-    if not (0.0 < a2_lo < a2_hi < 1.0):
-        raise ValueError("Require 0.0 < a2_lo < a2_hi < 1.0 (open interval).")
-
-    # --- canonical solver ---
-    eq_solver, solver_src = _import_solver()
+    solver_tol: float,
+    solver_verbose: bool,
+) -> Callable[[float], Tuple[float, Dict, str]]:
+    """Build trial(a2) -> (U1, equilibrium dict, mask_or_note) for fixed (a1, c, p)."""
 
     def trial(a2_val: float) -> Tuple[float, Dict, str]:
         """Evaluate U1 at a2_val by solving equilibrium via your standard solver."""
@@ -170,29 +163,90 @@ def optimize_a2_for_player1(
         u1, mask = u1_mask
         return float(u1), sol, str(mask)
 
-    samples: List[Tuple[float, float, str]] = []
-    eps = max(1e-9, 1e-12 * (a2_hi - a2_lo))
+    return trial
 
-    # ---------- (1) UNIFORM COARSE SCAN over the full interval ----------
-    COARSE_N = 2001  # increase if you want even denser brute force
+
+def _coarse_grid(a2_lo: float, a2_hi: float, eps: float, n: int = _COARSE_N) -> Tuple[List[float], float]:
+    """
+    The uniform coarse-scan abscissae (first/last pulled in by eps) and the grid step.
+    Shared by the cold and warm-start optimizers so both probe exactly the same a2 values.
+    """
     span = (a2_hi - a2_lo)
-    step = span / (COARSE_N + 1)  # so first/last interior to (a2_lo, a2_hi)
+    step = span / (n + 1)  # so first/last interior to (a2_lo, a2_hi)
+    grid = [a2_lo + i * step for i in range(1, n + 1)]
+    grid[0] = a2_lo + eps
+    grid[-1] = a2_hi - eps
+    return grid, step
 
-    coarse_best_u = float("-inf")
-    coarse_best_a2 = None
-    coarse_best_sol: Dict = {}
-    coarse_best_mask = "INIT"
 
-    for i in range(1, COARSE_N + 1):
-        a2v = a2_lo + i * step
-        if i == 1:
-            a2v = a2_lo + eps
-        elif i == COARSE_N:
-            a2v = a2_hi - eps
-        u, st, m = trial(a2v)
-        samples.append((a2v, u, m))
-        if u > coarse_best_u:
-            coarse_best_u, coarse_best_a2, coarse_best_sol, coarse_best_mask = u, a2v, st, m
+def mask_segment_optima(
+    *,
+    a1: float,
+    p1x: float, p1y: float,
+    p2x: float, p2y: float,
+    c1: float, c2: float,
+    a2_lo: float = 1e-6,
+    a2_hi: float = 1.0 - 1e-6,
+    solver_tol: float = 1e-10,
+) -> List[Tuple[float, str]]:
+    """
+    [(a2, mask)]: for every maximal run of coarse-grid points on which a mask passes the
+    Table-1 tests, the point where that mask's closed-form U1 is largest. No solver calls:
+    vectorized table1_pass and _efforts_by_mask over the whole coarse grid.
+    """
+    import numpy as np
+    from Equil_finder.batch_solver import _efforts_by_mask
+    from Equil_finder.mask_sampler import MASKS, table1_pass
+
+    eps = max(1e-9, 1e-12 * (a2_hi - a2_lo))
+    grid, _ = _coarse_grid(a2_lo, a2_hi, eps)
+    a2 = np.asarray(grid, dtype=float)
+    # only a2 varies along the grid; the scalars broadcast against it
+    with np.errstate(all="ignore"):
+        passing = table1_pass(dict(a1=a1, a2=a2, c1=c1, c2=c2, p1x=p1x, p1y=p1y, p2x=p2x, p2y=p2y),
+                              solver_tol)
+        efforts = _efforts_by_mask(float(a1), a2, float(c1), float(c2),
+                                   float(p1x), float(p1y), float(p2x), float(p2y))
+
+    out: List[Tuple[float, str]] = []
+    for mask in MASKS:
+        ok = np.asarray(passing[mask], dtype=bool)
+        if not ok.any():
+            continue
+        x1, y1, x2, y2 = efforts[mask]
+        X = p1x * x1 + p2x * x2
+        Y = p1y * y1 + p2y * y2
+        with np.errstate(all="ignore"):
+            u1 = X ** (1.0 - a1) * Y ** a1 - 0.5 * c1 * (x1 + y1) ** 2
+        u1 = np.where(ok & np.isfinite(u1), u1, -np.inf)
+        edges = np.flatnonzero(np.diff(np.concatenate(([0], ok.astype(np.int8), [0]))))
+        for start, stop in zip(edges[::2], edges[1::2]):
+            j = start + int(np.argmax(u1[start:stop]))
+            if np.isfinite(u1[j]):
+                out.append((float(a2[j]), mask))
+    return out
+
+
+def _refine_and_pick(
+    trial: Callable[[float], Tuple[float, Dict, str]],
+    samples: List[Tuple[float, float, str]],
+    *,
+    coarse_best: Tuple[Optional[float], float, Dict, str],
+    step: float,
+    a2_lo: float,
+    a2_hi: float,
+    eps: float,
+    tol: float,
+    max_iter: int,
+    solver_src: str,
+    strategy: str,
+) -> OptimizationResult:
+    """
+    Steps (2)-(4) of the robust optimizer, given the best coarse point (a2, U1, sol, mask):
+    golden refinement around it, global endpoints, and the final pick among all candidates.
+    """
+    coarse_best_a2, coarse_best_u, coarse_best_sol, coarse_best_mask = coarse_best
+    span = (a2_hi - a2_lo)
 
     # If everything infeasible, fallback to midpoint
     if coarse_best_a2 is None:
@@ -206,6 +260,7 @@ def optimize_a2_for_player1(
             eqm_at_best=st_mid,
             samples=[(float(a2), float(u1), str(msk)) for (a2, u1, msk) in samples],
             solver_source=solver_src,
+            strategy=strategy,
         )
 
     # ---------- (2) GOLDEN REFINEMENT around the coarse best ----------
@@ -271,4 +326,253 @@ def optimize_a2_for_player1(
         eqm_at_best=best[2],
         samples=[(float(a2), float(u1), str(msk)) for (a2, u1, msk) in samples],
         solver_source=solver_src,
+        strategy=strategy,
+    )
+
+
+def optimize_a2_for_player1(
+    *,
+    a1: float,
+    p1x: float, p1y: float,
+    p2x: float, p2y: float,
+    c1: float, c2: float,
+    a2_lo: float = 1e-6,         # open interval (0,1): the solver requires a2 in (0,1)
+    a2_hi: float = 1.0 - 1e-6,
+    tol: float = 1e-5,
+    max_iter: int = 200,
+    solver_tol: float = 1e-10,
+    solver_verbose: bool = False,
+) -> OptimizationResult:
+    """
+    Robust maximization of Player 1's utility over a2 ∈ (a2_lo, a2_hi).
+
+    Strategy:
+      (1) Uniform coarse scan across the *entire* interval (no assumptions).
+      (2) Golden-section refinement in a small bracket around the best coarse point.
+      (3) ALWAYS include the true global endpoints as candidates.
+      (4) Return the best among all candidates.
+
+    This fixes failures when U1(a2) is piecewise / has jumps at mask switches.
+    """
+    if not (0.0 < a2_lo < a2_hi < 1.0):
+        raise ValueError("Require 0.0 < a2_lo < a2_hi < 1.0 (open interval).")
+
+    # --- canonical solver ---
+    eq_solver, solver_src = _import_solver()
+    trial = _make_trial(
+        eq_solver, a1=a1, p1x=p1x, p1y=p1y, p2x=p2x, p2y=p2y, c1=c1, c2=c2,
+        solver_tol=solver_tol, solver_verbose=solver_verbose,
+    )
+
+    samples: List[Tuple[float, float, str]] = []
+    eps = max(1e-9, 1e-12 * (a2_hi - a2_lo))
+
+    # ---------- (1) UNIFORM COARSE SCAN over the full interval ----------
+    grid, step = _coarse_grid(a2_lo, a2_hi, eps)
+
+    coarse_best_u = float("-inf")
+    coarse_best_a2 = None
+    coarse_best_sol: Dict = {}
+    coarse_best_mask = "INIT"
+
+    for a2v in grid:
+        u, st, m = trial(a2v)
+        samples.append((a2v, u, m))
+        if u > coarse_best_u:
+            coarse_best_u, coarse_best_a2, coarse_best_sol, coarse_best_mask = u, a2v, st, m
+
+    return _refine_and_pick(
+        trial, samples,
+        coarse_best=(coarse_best_a2, coarse_best_u, coarse_best_sol, coarse_best_mask),
+        step=step, a2_lo=a2_lo, a2_hi=a2_hi, eps=eps, tol=tol, max_iter=max_iter,
+        solver_src=solver_src, strategy="full_scan",
+    )
+
+
+def optimize_a2_for_player1_warm(
+    *,
+    a1: float,
+    p1x: float, p1y: float,
+    p2x: float, p2y: float,
+    c1: float, c2: float,
+    a2_seed: float,
+    window_steps: int = 20,
+    a2_lo: float = 1e-6,
+    a2_hi: float = 1.0 - 1e-6,
+    tol: float = 1e-5,
+    max_iter: int = 200,
+    solver_tol: float = 1e-10,
+    solver_verbose: bool = False,
+) -> OptimizationResult:
+    """
+    Warm-started version of optimize_a2_for_player1 for continuation along a1.
+
+    Instead of the full 2001-point coarse scan:
+      (1a) Scan only the coarse-grid points within ±window_steps of a2_seed
+           (typically the previous a1's a2*).
+      (1b) Segment probes: evaluate U1 at every mask segment's closed-form optimum
+           (mask_segment_optima) outside the window, so a jump to another region / mask is
+           caught wherever it sits, however narrow.
+      The coarse best is the best of the window and the probes. If no mask segment is
+      feasible, or the window's best point wins on the window edge (the closed form missed a
+      higher point beyond it), fall back to the full cold-start optimizer.
+      Otherwise continue with steps (2)-(4) exactly as the cold start does.
+
+    The probes are coarse-grid points, and the cold scan's U1 on each segment peaks at that
+    segment's optimum, so the coarse best here is the cold-start coarse best (ties go to the
+    lower a2, as in the cold scan) and the results are identical.
+    The returned `samples` count every solver call (including any fallback).
+    """
+    if not (0.0 < a2_lo < a2_hi < 1.0):
+        raise ValueError("Require 0.0 < a2_lo < a2_hi < 1.0 (open interval).")
+    if window_steps < 1:
+        raise ValueError("Require window_steps >= 1.")
+
+    eq_solver, solver_src = _import_solver()
+    trial = _make_trial(
+        eq_solver, a1=a1, p1x=p1x, p1y=p1y, p2x=p2x, p2y=p2y, c1=c1, c2=c2,
+        solver_tol=solver_tol, solver_verbose=solver_verbose,
+    )
+
+    samples: List[Tuple[float, float, str]] = []
+    eps = max(1e-9, 1e-12 * (a2_hi - a2_lo))
+    grid, step = _coarse_grid(a2_lo, a2_hi, eps)
+    n = len(grid)
+
+    # ---------- (1a) LOCAL WINDOW around the seed ----------
+    i_seed = min(n - 1, max(0, int(round((float(a2_seed) - a2_lo) / step)) - 1))
+    i_lo = max(0, i_seed - window_steps)
+    i_hi = min(n - 1, i_seed + window_steps)
+
+    evaluated: Dict[int, Tuple[float, Dict, str]] = {}
+    for i in range(i_lo, i_hi + 1):
+        evaluated[i] = trial(grid[i])
+        samples.append((grid[i], evaluated[i][0], evaluated[i][2]))
+
+    # ---------- (1b) SEGMENT PROBES over the full interval ----------
+    optima = mask_segment_optima(
+        a1=a1, p1x=p1x, p1y=p1y, p2x=p2x, p2y=p2y, c1=c1, c2=c2,
+        a2_lo=a2_lo, a2_hi=a2_hi, solver_tol=solver_tol,
+    )
+    for a2m, _ in optima:
+        i = min(n - 1, max(0, int(round((a2m - a2_lo) / step)) - 1))
+        if i not in evaluated:
+            evaluated[i] = trial(grid[i])
+            samples.append((grid[i], evaluated[i][0], evaluated[i][2]))
+
+    best_u = float("-inf")
+    best_i = None
+    for i in sorted(evaluated):
+        if evaluated[i][0] > best_u:
+            best_u, best_i = evaluated[i][0], i
+
+    on_edge = best_i is not None and ((best_i == i_lo and i_lo > 0) or (best_i == i_hi and i_hi < n - 1))
+    if not optima or best_i is None or on_edge:
+        cold = optimize_a2_for_player1(
+            a1=a1, p1x=p1x, p1y=p1y, p2x=p2x, p2y=p2y, c1=c1, c2=c2,
+            a2_lo=a2_lo, a2_hi=a2_hi, tol=tol, max_iter=max_iter,
+            solver_tol=solver_tol, solver_verbose=solver_verbose,
+        )
+        cold.samples = [(float(a2), float(u1), str(msk)) for (a2, u1, msk) in samples] + cold.samples
+        cold.strategy = "warm_fallback"
+        return cold
+
+    _, best_sol, best_mask = evaluated[best_i]
+    return _refine_and_pick(
+        trial, samples,
+        coarse_best=(grid[best_i], best_u, best_sol, best_mask),
+        step=step, a2_lo=a2_lo, a2_hi=a2_hi, eps=eps, tol=tol, max_iter=max_iter,
+        solver_src=solver_src, strategy="warm",
+    )
+
+
+def optimize_a2_for_player1_screened(
+    *,
+    a1: float,
+    p1x: float, p1y: float,
+    p2x: float, p2y: float,
+    c1: float, c2: float,
+    candidates: Sequence[float],
+    segment_optima: Optional[Sequence[Tuple[float, str]]] = None,
+    window_steps: int = 20,
+    a2_lo: float = 1e-6,
+    a2_hi: float = 1.0 - 1e-6,
+    tol: float = 1e-5,
+    max_iter: int = 200,
+    solver_tol: float = 1e-10,
+    solver_verbose: bool = False,
+) -> OptimizationResult:
+    """
+    Screening fast path: evaluate U1 at a few candidate a2 values (e.g. an analytic interior
+    benchmark, the two ends of the interval and mask_segment_optima), then scan the coarse
+    grid within ±window_steps of the best one and refine as the cold start does.
+
+    The candidate is accepted (strategy "screened") only when the candidates cover every mask:
+    each feasible mask segment's analytic optimum (mask_segment_optima) lies within one
+    coarse-grid step of an evaluated candidate, so the best candidate sits next to the cold
+    start's coarse best; and the window's best point is not on its edge. Otherwise the full
+    cold-start optimizer runs (strategy "screen_fallback"). `samples` counts every solver call.
+    segment_optima: mask_segment_optima for these parameters, if the caller already has it.
+    """
+    if not candidates:
+        raise ValueError("Require at least one candidate a2.")
+    if window_steps < 1:
+        raise ValueError("Require window_steps >= 1.")
+    eq_solver, solver_src = _import_solver()
+    trial = _make_trial(
+        eq_solver, a1=a1, p1x=p1x, p1y=p1y, p2x=p2x, p2y=p2y, c1=c1, c2=c2,
+        solver_tol=solver_tol, solver_verbose=solver_verbose,
+    )
+    eps = max(1e-9, 1e-12 * (a2_hi - a2_lo))
+    grid, step = _coarse_grid(a2_lo, a2_hi, eps)
+    n = len(grid)
+
+    samples: List[Tuple[float, float, str]] = []
+    seed = a2_lo + 0.5 * (a2_hi - a2_lo)
+    best_u = float("-inf")
+    for a2v in candidates:
+        a2v = min(max(float(a2v), a2_lo + eps), a2_hi - eps)
+        u, _, m = trial(a2v)
+        samples.append((a2v, u, m))
+        if u > best_u:
+            best_u, seed = u, a2v
+
+    optima = segment_optima
+    if optima is None:
+        optima = mask_segment_optima(
+            a1=a1, p1x=p1x, p1y=p1y, p2x=p2x, p2y=p2y, c1=c1, c2=c2,
+            a2_lo=a2_lo, a2_hi=a2_hi, solver_tol=solver_tol,
+        )
+    covered = all(any(abs(a2v - a2m) <= step for a2v, _, _ in samples) for a2m, _ in optima)
+
+    # ---------- LOCAL WINDOW around the best candidate ----------
+    best_i = None
+    if covered:
+        i_seed = min(n - 1, max(0, int(round((seed - a2_lo) / step)) - 1))
+        i_lo = max(0, i_seed - window_steps)
+        i_hi = min(n - 1, i_seed + window_steps)
+        best_u, best_sol, best_mask = float("-inf"), {}, "INIT"
+        for i in range(i_lo, i_hi + 1):
+            u, st, m = trial(grid[i])
+            samples.append((grid[i], u, m))
+            if u > best_u:
+                best_u, best_i, best_sol, best_mask = u, i, st, m
+        if best_i is not None and ((best_i == i_lo and i_lo > 0) or (best_i == i_hi and i_hi < n - 1)):
+            best_i = None
+
+    if best_i is None:
+        cold = optimize_a2_for_player1(
+            a1=a1, p1x=p1x, p1y=p1y, p2x=p2x, p2y=p2y, c1=c1, c2=c2,
+            a2_lo=a2_lo, a2_hi=a2_hi, tol=tol, max_iter=max_iter,
+            solver_tol=solver_tol, solver_verbose=solver_verbose,
+        )
+        cold.samples = [(float(a2), float(u1), str(msk)) for (a2, u1, msk) in samples] + cold.samples
+        cold.strategy = "screen_fallback"
+        return cold
+
+    return _refine_and_pick(
+        trial, samples,
+        coarse_best=(grid[best_i], best_u, best_sol, best_mask),
+        step=step, a2_lo=a2_lo, a2_hi=a2_hi, eps=eps, tol=tol, max_iter=max_iter,
+        solver_src=solver_src, strategy="screened",
     )
@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+"""
+Exact comparative statics of a2* by the implicit function theorem.
+
+Within one mask, U1 is a closed-form function of (a2, θ) (the efforts of
+Equil_finder.batch_solver._efforts_by_mask plugged into U1 = X^(1-a1) Y^a1 - (c1/2)(x1+y1)²).
+At an interior optimum G = ∂U1/∂a2 = 0 with ∂²U1/∂a2² < 0, so
+    d a2*/dθ = -(∂²U1/∂a2∂θ) / (∂²U1/∂a2²),     d U1*/dθ = ∂U1/∂θ   (envelope theorem).
+The derivatives are computed exactly (to rounding) by evaluating the closed form on
+hyper-dual numbers, not by finite differences, and the optimizer's a2* (accurate to its
+golden-section tol) is first polished by Newton steps on G inside the mask.
+
+a2_star_sensitivities runs one optimization and classifies the optimum:
+  - "interior":      IFT applies; da2 / du1 are filled in.
+  - "endpoint":      a2* is at a2_lo / a2_hi with G pointing outward; da2 = 0, du1 by the envelope theorem.
+  - "mask_boundary": a2* sits where the equilibrium regime switches (a kink of U1, or the
+                     knife-edge (B,B)); U1 is not smooth there, da2 / du1 are nan.
+  - "degenerate":    no strict interior maximum of the mask's closed form (∂²U1/∂a2² >= 0 or
+                     Newton did not converge); da2 / du1 are nan.
+  - "infeasible":    the optimizer found no feasible equilibrium.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+
+from .optimize_a2 import OptimizationResult, optimize_a2_for_player1
+
+SENSITIVITY_PARAMS = ("a1", "c1", "c2", "p1x", "p1y", "p2x", "p2y")
+_NEWTON_ITERS = 50
+
+
+class _HyperDual:
+    """f + a·e1 + b·e2 + ab·e1e2 with e1² = e2² = 0: exact first and mixed second derivatives."""
+
+    __slots__ = ("f", "a", "b", "ab")
+
+    def __init__(self, f: float, a: float = 0.0, b: float = 0.0, ab: float = 0.0):
+        self.f, self.a, self.b, self.ab = float(f), float(a), float(b), float(ab)
+
+    def _chain(self, g: float, g1: float, g2: float) -> "_HyperDual":
+        return _HyperDual(g, g1 * self.a, g1 * self.b, g2 * self.a * self.b + g1 * self.ab)
+
+    def __add__(self, o):
+        if isinstance(o, _HyperDual):
+            return _HyperDual(self.f + o.f, self.a + o.a, self.b + o.b, self.ab + o.ab)
+        return _HyperDual(self.f + o, self.a, self.b, self.ab)
+
+    __radd__ = __add__
+
+    def __neg__(self):
+        return _HyperDual(-self.f, -self.a, -self.b, -self.ab)
+
+    def __sub__(self, o):
+        return self + (-o)
+
+    def __rsub__(self, o):
+        return (-self) + o
+
+    def __mul__(self, o):
+        if isinstance(o, _HyperDual):
+            return _HyperDual(self.f * o.f, self.f * o.a + self.a * o.f, self.f * o.b + self.b * o.f,
+                              self.f * o.ab + self.a * o.b + self.b * o.a + self.ab * o.f)
+        return _HyperDual(self.f * o, self.a * o, self.b * o, self.ab * o)
+
+    __rmul__ = __mul__
+
+    def _inv(self) -> "_HyperDual":
+        return self._chain(1.0 / self.f, -1.0 / self.f ** 2, 2.0 / self.f ** 3)
+
+    def __truediv__(self, o):
+        if isinstance(o, _HyperDual):
+            return self * o._inv()
+        return self * (1.0 / o)
+
+    def __rtruediv__(self, o):
+        return self._inv() * o
+
+    def _log(self) -> "_HyperDual":
+        return self._chain(math.log(self.f), 1.0 / self.f, -1.0 / self.f ** 2)
+
+    def _exp(self) -> "_HyperDual":
+        e = math.exp(self.f)
+        return self._chain(e, e, e)
+
+    def __pow__(self, o):
+        if isinstance(o, _HyperDual):
+            return (o * self._log())._exp()
+        o = float(o)
+        return self._chain(self.f ** o, o * self.f ** (o - 1.0), o * (o - 1.0) * self.f ** (o - 2.0))
+
+
+def _u1_closed(mask: str, params: Dict):
+    """U1 under `mask`'s closed-form efforts; params may hold floats or _HyperDuals."""
+    from Equil_finder.batch_solver import _efforts_by_mask
+    from Equil_finder.mask_sampler import PARAM_NAMES
+
+    x1, y1, x2, y2 = _efforts_by_mask(*(params[k] for k in PARAM_NAMES))[mask]
+    a1 = params["a1"]
+    X = params["p1x"] * x1 + params["p2x"] * x2
+    Y = params["p1y"] * y1 + params["p2y"] * y2
+    return X ** (1.0 - a1) * Y ** a1 - 0.5 * params["c1"] * (x1 + y1) ** 2.0
+
+
+def _derivs(mask: str, params: Dict, theta: str) -> _HyperDual:
+    """Hyper-dual U1 seeded with e1 along a2 and e2 along theta: (U1, ∂a2, ∂theta, ∂a2∂theta)."""
+    p = {k: _HyperDual(v) for k, v in params.items()}
+    p["a2"] = _HyperDual(params["a2"], 1.0, 1.0 if theta == "a2" else 0.0)
+    if theta != "a2":
+        p[theta] = _HyperDual(params[theta], 0.0, 1.0)
+    return _u1_closed(mask, p)
+
+
+def _passing_masks(params: Dict, tol: float):
+    from Equil_finder.mask_sampler import MASKS, table1_pass
+
+    passing = table1_pass({k: [v] for k, v in params.items()}, tol)
+    return [m for m in MASKS if bool(passing[m][0])]
+
+
+@dataclass
+class A2Sensitivity:
+    a2_star: float
+    u1: float
+    mask: str
+    status: str                                            # interior | endpoint | mask_boundary |
+                                                           # degenerate | infeasible
+    da2: Dict[str, float] = field(default_factory=dict)    # d a2*/dθ for θ in SENSITIVITY_PARAMS
+    du1: Dict[str, float] = field(default_factory=dict)    # d U1(a2*(θ), θ)/dθ (envelope theorem)
+    d2u1_da2: float = float("nan")                         # curvature ∂²U1/∂a2² at a2*
+    note: str = ""
+    optimization: Optional[OptimizationResult] = None
+
+    def along(self, direction: Dict[str, float]) -> Tuple[float, float]:
+        """
+        (d a2*/dt, d U1*/dt) along a parameter path with dθ/dt = direction[θ], e.g. for
+        p2 = s·(r2, 1) at s: d/ds = {"p2x": r2, "p2y": 1}; for r2 at fixed p2y: {"p2x": p2y}.
+        """
+        return (sum(self.da2[k] * v for k, v in direction.items()),
+                sum(self.du1[k] * v for k, v in direction.items()))
+
+
+def a2_star_sensitivities(
+    *,
+    a1: float,
+    p1x: float, p1y: float,
+    p2x: float, p2y: float,
+    c1: float, c2: float,
+    a2_lo: float = 1e-6,
+    a2_hi: float = 1.0 - 1e-6,
+    tol: float = 1e-5,
+    max_iter: int = 200,
+    solver_tol: float = 1e-10,
+    solver_verbose: bool = False,
+    result: Optional[OptimizationResult] = None,
+) -> A2Sensitivity:
+    """
+    a2* (one optimize_a2_for_player1 call, or `result` if already available for these
+    parameters) with its exact sensitivities to every parameter in SENSITIVITY_PARAMS.
+    See the module docstring for the status values and when da2 / du1 are nan.
+    """
+    nan = {k: float("nan") for k in SENSITIVITY_PARAMS}
+    if result is None:
+        result = optimize_a2_for_player1(
+            a1=a1, p1x=p1x, p1y=p1y, p2x=p2x, p2y=p2y, c1=c1, c2=c2, a2_lo=a2_lo, a2_hi=a2_hi,
+            tol=tol, max_iter=max_iter, solver_tol=solver_tol, solver_verbose=solver_verbose,
+        )
+    mask = result.chosen_mask
+    base = dict(a1=a1, a2=float(result.best_a2), c1=c1, c2=c2, p1x=p1x, p1y=p1y, p2x=p2x, p2y=p2y)
+    base = {k: float(v) for k, v in base.items()}
+
+    def out(status: str, da2=nan, du1=nan, curv=float("nan"), note: str = "") -> A2Sensitivity:
+        return A2Sensitivity(base["a2"], float(result.u1_at_best), mask, status, dict(da2), dict(du1),
+                             curv, note, result)
+
+    if not math.isfinite(result.u1_at_best):
+        return out("infeasible", note="no feasible equilibrium on (a2_lo, a2_hi)")
+    if mask == "B,B" or len(_passing_masks(base, solver_tol)) > 1:
+        return out("mask_boundary", note=f"several masks pass at a2*: {_passing_masks(base, solver_tol)}")
+
+    def grads(params: Dict) -> Tuple[float, Dict[str, float]]:
+        """(∂U1/∂a2, {θ: ∂U1/∂θ})."""
+        first = {t: _derivs(mask, params, t) for t in SENSITIVITY_PARAMS}
+        return first["a1"].a, {t: d.b for t, d in first.items()}
+
+    # ---- corner solution: a2* at a bound with U1 still increasing outward ----
+    G, dU = grads(base)
+    if (base["a2"] - a2_lo <= 2.0 * tol and G < 0.0) or (a2_hi - base["a2"] <= 2.0 * tol and G > 0.0):
+        return out("endpoint", da2={k: 0.0 for k in SENSITIVITY_PARAMS}, du1=dU)
+
+    # ---- Newton polish of G = 0 inside the mask ----
+    params = dict(base)
+    converged = False
+    for _ in range(_NEWTON_ITERS):
+        d = _derivs(mask, params, "a2")
+        G, H = d.a, d.ab
+        if not (math.isfinite(G) and math.isfinite(H)) or H >= 0.0:
+            break
+        step = G / H
+        params["a2"] -= step
+        if not (a2_lo < params["a2"] < a2_hi):
+            break
+        if abs(step) <= 4e-16 * max(1.0, abs(params["a2"])):
+            converged = True
+            break
+    if converged and _passing_masks(params, solver_tol) != [mask]:
+        return out("mask_boundary", note=f"the stationary point of {mask}'s U1 lies outside the mask")
+    if not converged:
+        # Newton left the mask / interval or curvature was not negative: a kink if the mask
+        # switches within the optimizer's tolerance, otherwise no strict interior maximum.
+        near = [dict(base, a2=base["a2"] + s * 2.0 * tol) for s in (-1.0, 1.0)]
+        if any(_passing_masks(p, solver_tol) != [mask] for p in near if a2_lo < p["a2"] < a2_hi):
+            return out("mask_boundary", note=f"{mask} switches within 2·tol of a2*")
+        return out("degenerate", note="Newton on ∂U1/∂a2 did not converge to a strict maximum")
+
+    u1_polished = _u1_closed(mask, params)
+    if u1_polished < result.u1_at_best - 1e-12 * max(1.0, abs(result.u1_at_best)):
+        return out("degenerate", note="polished stationary point is worse than the optimizer's a2*")
+
+    second = {t: _derivs(mask, params, t) for t in SENSITIVITY_PARAMS + ("a2",)}
+    H = second["a2"].ab
+    return A2Sensitivity(
+        a2_star=params["a2"],
+        u1=float(u1_polished),
+        mask=mask,
+        status="interior",
+        da2={t: -second[t].ab / H for t in SENSITIVITY_PARAMS},
+        du1={t: second[t].b for t in SENSITIVITY_PARAMS},
+        d2u1_da2=H,
+        optimization=result,
+    )
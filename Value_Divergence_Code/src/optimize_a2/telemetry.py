@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""
+Progress / throughput / ETA telemetry for long optimizer runs (a1 curves, productivity sweeps).
+
+Observer interface: a run owns a ProgressTracker and calls
+    tracker.start(n_total) ... tracker.update(units=1, solver_calls=..., masks=[...], failures=0) ... tracker.finish()
+Every event is turned into a ProgressSnapshot and handed to each observer, i.e. any callable
+taking one ProgressSnapshot. Built-in sinks:
+  - ConsoleProgress:     single self-overwriting progress line (stderr by default)
+  - JsonLinesProgress:   one JSON object per event appended to a .jsonl file (for capacity planning)
+
+Runs accept `progress=` as one observer or a list of observers; None means silent.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, TextIO, Union
+
+
+@dataclass
+class ProgressSnapshot:
+    label: str
+    event: str                      # "start" | "update" | "finish"
+    n_done: int
+    n_total: Optional[int]
+    n_failed: int
+    solver_calls: int
+    elapsed_s: float
+    units_per_s: float
+    calls_per_s: float
+    eta_s: Optional[float]
+    mask_counts: Dict[str, int] = field(default_factory=dict)
+
+
+ProgressObserver = Callable[[ProgressSnapshot], None]
+ProgressArg = Union[None, ProgressObserver, Iterable[ProgressObserver]]
+
+
+class ProgressTracker:
+    """Accumulates counters for one run and notifies the observers."""
+
+    def __init__(self, observers: ProgressArg = None, *, label: str = "run") -> None:
+        if observers is None:
+            self.observers: List[ProgressObserver] = []
+        elif callable(observers):
+            self.observers = [observers]
+        else:
+            self.observers = list(observers)
+        self.label = label
+        self.n_total: Optional[int] = None
+        self.n_done = 0
+        self.n_failed = 0
+        self.solver_calls = 0
+        self.mask_counts: Dict[str, int] = {}
+        self._t0 = time.perf_counter()
+
+    def start(self, n_total: Optional[int] = None) -> None:
+        self.n_total = None if n_total is None else int(n_total)
+        self._t0 = time.perf_counter()
+        self._emit("start")
+
+    def update(
+        self,
+        *,
+        units: int = 1,
+        solver_calls: int = 0,
+        masks: Iterable[str] = (),
+        failures: int = 0,
+    ) -> None:
+        self.n_done += int(units)
+        self.solver_calls += int(solver_calls)
+        self.n_failed += int(failures)
+        for m in masks:
+            self.mask_counts[m] = self.mask_counts.get(m, 0) + 1
+        self._emit("update")
+
+    def finish(self) -> None:
+        self._emit("finish")
+
+    def snapshot(self, event: str = "update") -> ProgressSnapshot:
+        elapsed = max(time.perf_counter() - self._t0, 1e-12)
+        units_per_s = self.n_done / elapsed
+        eta = None
+        if self.n_total is not None and self.n_done > 0:
+            eta = max(self.n_total - self.n_done, 0) / units_per_s
+        return ProgressSnapshot(
+            label=self.label,
+            event=event,
+            n_done=self.n_done,
+            n_total=self.n_total,
+            n_failed=self.n_failed,
+            solver_calls=self.solver_calls,
+            elapsed_s=elapsed,
+            units_per_s=units_per_s,
+            calls_per_s=self.solver_calls / elapsed,
+            eta_s=eta,
+            mask_counts=dict(self.mask_counts),
+        )
+
+    def _emit(self, event: str) -> None:
+        if not self.observers:
+            return
+        snap = self.snapshot(event)
+        for obs in self.observers:
+            obs(snap)
+
+
+def _fmt_seconds(s: Optional[float]) -> str:
+    if s is None:
+        return "?"
+    s = int(round(s))
+    h, rem = divmod(s, 3600)
+    m, sec = divmod(rem, 60)
+    return f"{h}h{m:02d}m{sec:02d}s" if h else f"{m}m{sec:02d}s"
+
+
+class ConsoleProgress:
+    """
+    One progress line, rewritten in place with '\\r' at most every `min_interval` seconds
+    (start/finish are always printed; finish ends the line).
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None, *, min_interval: float = 0.5, top_masks: int = 4) -> None:
+        self.stream = stream if stream is not None else sys.stderr
+        self.min_interval = float(min_interval)
+        self.top_masks = int(top_masks)
+        self._last = float("-inf")
+        self._width = 0
+
+    def __call__(self, snap: ProgressSnapshot) -> None:
+        now = time.perf_counter()
+        if snap.event == "update" and (now - self._last) < self.min_interval:
+            return
+        self._last = now
+
+        if snap.n_total:
+            done = f"{snap.n_done}/{snap.n_total} ({100.0 * snap.n_done / snap.n_total:5.1f}%)"
+        else:
+            done = f"{snap.n_done}"
+        masks = sorted(snap.mask_counts.items(), key=lambda kv: -kv[1])[: self.top_masks]
+        mask_txt = " ".join(f"{m}:{k}" for m, k in masks) or "-"
+        line = (
+            f"[{snap.label}] {done} | {snap.calls_per_s:,.0f} calls/s | "
+            f"elapsed {_fmt_seconds(snap.elapsed_s)} | ETA {_fmt_seconds(snap.eta_s)} | "
+            f"masks {mask_txt} | failed {snap.n_failed}"
+        )
+        pad = " " * max(self._width - len(line), 0)  # blank out leftovers of a longer previous line
+        self._width = 0 if snap.event == "finish" else len(line)
+        end = "\n" if snap.event == "finish" else ""
+        self.stream.write("\r" + line + pad + end)
+        self.stream.flush()
+
+
+class JsonLinesProgress:
+    """Append each event (every `every`-th update, plus start/finish) as one JSON line to `path`."""
+
+    def __init__(self, path: str, *, every: int = 1) -> None:
+        if every < 1:
+            raise ValueError("Require every >= 1.")
+        self.path = path
+        self.every = int(every)
+        self._n = 0
+        d = os.path.dirname(path)
+        if d:
+            os.makedirs(d, exist_ok=True)
+
+    def __call__(self, snap: ProgressSnapshot) -> None:
+        if snap.event == "update":
+            self._n += 1
+            if self._n % self.every:
+                return
+        rec = asdict(snap)
+        rec["time"] = time.time()
+        with open(self.path, "a") as f:
+            f.write(json.dumps(rec) + "\n")
@@ -0,0 +1,59 @@
+"""
+param_sweep
+
+Declarative N-dimensional sweeps over the eight model parameters (a1, a2, c1, c2, p1x, p1y, p2x, p2y):
+- SweepSpec (+ values_axis / linspace_axis / logspace_axis / sampled_axis): Cartesian axes,
+  jointly sampled blocks (Latin hypercube, Sobol', Halton), fixed values and ties such as c2 = c1.
+- iter_sweep / sweep_arrays: lazy, optionally process-parallel evaluation with the a2 optimizer
+  (target="optimize") or the equilibrium solver (target="solve"), keyed by axis indices.
+- run_a2_monte_carlo: distribution of a2* under random parameters (streaming quantiles,
+  histogram, mask / opposites-attract probabilities with confidence intervals, early stopping).
+- compute_a2_star_surface: a2*(a1) for a list of partners as (n_partners, n_a1) arrays,
+  one line per partner on the screened optimizer (comparative-statics overlays).
+- latin_hypercube / sobol / halton: numpy-only unit-cube samplers (see param_sweep.sampling).
+"""
+
+from .core import (
+    MODEL_PARAMS,
+    Axis,
+    SweepSpec,
+    SweepRecord,
+    values_axis,
+    linspace_axis,
+    logspace_axis,
+    sampled_axis,
+    iter_sweep,
+    sweep_arrays,
+)
+from .monte_carlo import (
+    MC_PARAMS,
+    A2StreamingStats,
+    MonteCarloResult,
+    draw_parameters,
+    run_a2_monte_carlo,
+)
+from .surface import compute_a2_star_surface
+from .sampling import latin_hypercube, sobol, halton, unit_samples
+
+__all__ = [
+    "MODEL_PARAMS",
+    "Axis",
+    "SweepSpec",
+    "SweepRecord",
+    "values_axis",
+    "linspace_axis",
+    "logspace_axis",
+    "sampled_axis",
+    "iter_sweep",
+    "sweep_arrays",
+    "MC_PARAMS",
+    "A2StreamingStats",
+    "MonteCarloResult",
+    "draw_parameters",
+    "run_a2_monte_carlo",
+    "compute_a2_star_surface",
+    "latin_hypercube",
+    "sobol",
+    "halton",
+    "unit_samples",
+]
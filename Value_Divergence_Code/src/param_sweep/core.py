@@ -0,0 +1,388 @@
+# -*- coding: utf-8 -*-
+"""
+Declarative N-dimensional sweeps over the eight model parameters
+    a1, a2, c1, c2, p1x, p1y, p2x, p2y.
+
+A SweepSpec lists
+  - axes:   Cartesian axes, each one parameter (values / linspace / logspace) or a *sampled
+            block* that moves several parameters jointly (Latin hypercube, Sobol', Halton or
+            plain random points inside per-parameter bounds; one block = one axis);
+  - fixed:  constants;
+  - tie:    parameters copied from another one (e.g. {"c2": "c1"} for equal costs);
+  - target: "optimize" (a2 is chosen by the optimizer, so it must not be given) or
+            "solve" (the equilibrium at the given a2).
+Every parameter the target needs must come from exactly one of axes / fixed / tie.
+
+iter_sweep walks the Cartesian product lazily in C order (last axis fastest) and yields
+SweepRecord objects keyed by their axis indices. Points that differ only in the last axis form
+one *line*; lines are the unit of work, so when the last axis is a1 the optimizer is
+warm-started along it (continuation). With workers > 1, lines go to a process pool with a
+bounded number in flight, and records are still yielded in C order. sweep_arrays gathers the
+records into arrays shaped like the grid.
+
+Specs can be written as plain dicts / JSON, e.g.
+    {"target": "optimize",
+     "axes": [{"name": "c1", "logspace": [0.25, 4.0, 9]},
+              {"sample": "sobol", "n": 64, "seed": 0, "bounds": {"p1x": [0.5, 2], "p2x": [0.5, 2]}},
+              {"name": "a1", "linspace": [0.01, 0.99, 99]}],
+     "fixed": {"p1y": 1.0, "p2y": 1.0},
+     "tie": {"c2": "c1"}}
+"""
+
+from __future__ import annotations
+
+import itertools
+import math
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .sampling import unit_samples
+
+MODEL_PARAMS = ("a1", "a2", "c1", "c2", "p1x", "p1y", "p2x", "p2y")
+TARGETS = ("optimize", "solve")
+
+
+# ---------- SPEC ----------
+@dataclass(frozen=True)
+class Axis:
+    """One Cartesian axis: `names` move together; point k sets names[j] = points[k][j]."""
+    names: Tuple[str, ...]
+    points: Tuple[Tuple[float, ...], ...]
+    label: str = ""
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def values(self, name: str) -> List[float]:
+        j = self.names.index(name)
+        return [pt[j] for pt in self.points]
+
+
+def values_axis(name: str, values: Sequence[float]) -> Axis:
+    return Axis((name,), tuple((float(v),) for v in values), label=name)
+
+
+def linspace_axis(name: str, start: float, stop: float, num: int) -> Axis:
+    import numpy as np
+
+    return values_axis(name, np.linspace(start, stop, int(num)))
+
+
+def logspace_axis(name: str, start: float, stop: float, num: int) -> Axis:
+    """num values from start to stop (both > 0), evenly spaced in log."""
+    import numpy as np
+
+    if not (start > 0 and stop > 0):
+        raise ValueError("logspace_axis requires start > 0 and stop > 0.")
+    return values_axis(name, np.geomspace(start, stop, int(num)))
+
+
+def sampled_axis(
+    bounds: Dict[str, Tuple[float, float]],
+    n: int,
+    *,
+    method: str = "sobol",
+    seed: Optional[int] = None,
+    log: Sequence[str] = (),
+) -> Axis:
+    """
+    n jointly sampled points inside the box `bounds` ({name: (lo, hi)}), using
+    sampling.unit_samples(method). Parameters listed in `log` are sampled uniformly in log.
+    """
+    import numpy as np
+
+    names = tuple(bounds)
+    u = unit_samples(method, int(n), len(names), seed)
+    cols = []
+    for j, name in enumerate(names):
+        lo, hi = (float(b) for b in bounds[name])
+        if name in log:
+            cols.append(np.exp(np.log(lo) + u[:, j] * (np.log(hi) - np.log(lo))))
+        else:
+            cols.append(lo + u[:, j] * (hi - lo))
+    points = tuple(tuple(float(c[k]) for c in cols) for k in range(int(n)))
+    return Axis(names, points, label=f"{method}({','.join(names)})")
+
+
+@dataclass(frozen=True)
+class SweepSpec:
+    axes: Tuple[Axis, ...]
+    fixed: Dict[str, float] = field(default_factory=dict)
+    tie: Dict[str, str] = field(default_factory=dict)
+    target: str = "optimize"
+
+    def __post_init__(self) -> None:
+        if self.target not in TARGETS:
+            raise ValueError(f"target must be one of {TARGETS}, got {self.target!r}.")
+        needed = [p for p in MODEL_PARAMS if not (self.target == "optimize" and p == "a2")]
+        sources: Dict[str, List[str]] = {}
+        for ax in self.axes:
+            for name in ax.names:
+                sources.setdefault(name, []).append(f"axis {ax.label or name}")
+        for name in self.fixed:
+            sources.setdefault(name, []).append("fixed")
+        for name, src in self.tie.items():
+            sources.setdefault(name, []).append(f"tie -> {src}")
+            if src == name or src in self.tie:
+                raise ValueError(f"tie {name} -> {src} must point at a swept or fixed parameter.")
+        problems = [f"{p}: given by {', '.join(s)}" for p, s in sources.items() if len(s) > 1]
+        problems += [f"{p}: not a model parameter" for p in sources if p not in MODEL_PARAMS]
+        problems += [f"{p}: missing" for p in needed if p not in sources]
+        problems += [f"{p}: tied to {src}, which is not swept or fixed" for p, src in self.tie.items()
+                     if src not in sources]
+        if self.target == "optimize" and "a2" in sources:
+            problems.append("a2: chosen by the optimizer, do not sweep or fix it")
+        if problems:
+            raise ValueError("Invalid sweep spec:\n  " + "\n  ".join(problems))
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return tuple(len(ax) for ax in self.axes)
+
+    @property
+    def size(self) -> int:
+        return math.prod(self.shape)
+
+    def params_at(self, index: Tuple[int, ...]) -> Dict[str, float]:
+        params = dict(self.fixed)
+        for ax, k in zip(self.axes, index):
+            params.update(zip(ax.names, ax.points[k]))
+        for name, src in self.tie.items():
+            params[name] = params[src]
+        return params
+
+    @classmethod
+    def from_dict(cls, d: Dict) -> "SweepSpec":
+        """Build from the plain-dict / JSON form shown in the module docstring."""
+        axes = []
+        for a in d["axes"]:
+            if "sample" in a:
+                axes.append(sampled_axis(
+                    {k: tuple(v) for k, v in a["bounds"].items()}, int(a["n"]),
+                    method=a["sample"], seed=a.get("seed"), log=a.get("log", ()),
+                ))
+            elif "linspace" in a:
+                axes.append(linspace_axis(a["name"], *a["linspace"]))
+            elif "logspace" in a:
+                axes.append(logspace_axis(a["name"], *a["logspace"]))
+            elif "values" in a:
+                axes.append(values_axis(a["name"], a["values"]))
+            else:
+                raise ValueError(f"Axis needs one of sample / linspace / logspace / values: {a!r}")
+        return cls(
+            axes=tuple(axes),
+            fixed={k: float(v) for k, v in d.get("fixed", {}).items()},
+            tie=dict(d.get("tie", {})),
+            target=d.get("target", "optimize"),
+        )
+
+
+# ---------- RESULTS ----------
+@dataclass
+class SweepRecord:
+    index: Tuple[int, ...]   # position on the spec's axes
+    params: Dict[str, float]
+    a2: float                # a2* for target="optimize", the given a2 for target="solve"
+    u1: float                # Player 1's utility at (a1, a2); nan if no feasible solution
+    mask: str
+    n_solver_calls: int
+    strategy: str = ""       # optimizer strategy (full_scan | warm | screened | *_fallback); "" for solve
+    error: str = ""
+
+
+@lru_cache(maxsize=None)
+def _import_optimizer_module():
+    import importlib
+
+    return importlib.import_module("optimize_a2.optimize_a2")
+
+
+def _solve_point(mod, solver, params: Dict[str, float], opt_kwargs: Dict) -> Tuple[float, float, str, int, str]:
+    sol = solver(
+        a1=params["a1"], a2=params["a2"], c1=params["c1"], c2=params["c2"],
+        p1x=params["p1x"], p1y=params["p1y"], p2x=params["p2x"], p2y=params["p2y"],
+        tol=opt_kwargs["solver_tol"], verbose=False,
+    )
+    got = mod._u1_from_solution(sol, params["a1"], params["c1"])
+    if got is None:
+        return params["a2"], float("nan"), str(sol.get("mask") or "NOFEAS"), 1, ""
+    return params["a2"], float(got[0]), str(got[1]), 1, ""
+
+
+def _solve_line(mod, solver, line: List[Tuple[Tuple[int, ...], Dict[str, float]]],
+                opt_kwargs: Dict) -> List[SweepRecord]:
+    """
+    Records for a target="solve" line from one Equil_finder.batch_solver call. Knife-edge rows
+    where several masks pass (the scalar solver keeps the one with the highest U1, batch_solver
+    the first) and rows outside the solver's domain (it raises) go to the scalar solver.
+    """
+    import numpy as np
+    from Equil_finder.batch_solver import solve_equilibrium_batch
+    from Equil_finder.mask_sampler import MASKS, PARAM_NAMES
+
+    p = {k: np.array([params[k] for _, params in line], dtype=float) for k in PARAM_NAMES}
+    with np.errstate(all="ignore"):
+        sol = solve_equilibrium_batch(p, tol=opt_kwargs["solver_tol"])
+    X = p["p1x"] * sol["x1"] + p["p2x"] * sol["x2"]
+    Y = p["p1y"] * sol["y1"] + p["p2y"] * sol["y2"]
+    with np.errstate(all="ignore"):
+        u1 = X ** (1.0 - p["a1"]) * Y ** p["a1"] - 0.5 * p["c1"] * (sol["x1"] + sol["y1"]) ** 2
+    u1 = np.where((X > 0.0) & (Y > 0.0) & np.isfinite(u1), u1, np.nan)
+    scalar = sol["n_masks"] > 1
+    for k in PARAM_NAMES:
+        scalar |= ~(p[k] > 0.0)
+    scalar |= ~(p["a1"] < 1.0) | ~(p["a2"] < 1.0)
+
+    out: List[SweepRecord] = []
+    for j, (index, params) in enumerate(line):
+        if not scalar[j]:
+            mask = MASKS[sol["mask"][j]] if sol["mask"][j] >= 0 else "NOFEAS"
+            out.append(SweepRecord(index, params, params["a2"], float(u1[j]), mask, 1))
+            continue
+        try:
+            out.append(SweepRecord(index, params, *_solve_point(mod, solver, params, opt_kwargs)))
+        except Exception as e:
+            out.append(SweepRecord(index, params, float("nan"), float("nan"), "ERR", 0,
+                                   error=f"{type(e).__name__}: {e}"))
+    return out
+
+
+def _run_line(line: List[Tuple[Tuple[int, ...], Dict[str, float]]], target: str, opt_kwargs: Dict,
+              continuation: bool, screen: bool = True) -> List[SweepRecord]:
+    """Worker entry point: evaluate one line of points (same index except on the last axis)."""
+    mod = _import_optimizer_module()
+    if target == "solve":
+        return _solve_line(mod, mod._import_solver()[0], line, opt_kwargs)
+
+    out: List[SweepRecord] = []
+    seed: Optional[float] = None
+    for index, params in line:
+        try:
+            kw = dict(
+                a1=params["a1"], p1x=params["p1x"], p1y=params["p1y"],
+                p2x=params["p2x"], p2y=params["p2y"], c1=params["c1"], c2=params["c2"],
+                **opt_kwargs,
+            )
+            if continuation and seed is not None:
+                res = mod.optimize_a2_for_player1_warm(a2_seed=seed, **kw)
+            elif screen:
+                seg = mod.mask_segment_optima(**{k: kw[k] for k in (
+                    "a1", "p1x", "p1y", "p2x", "p2y", "c1", "c2", "a2_lo", "a2_hi", "solver_tol")})
+                candidates = [kw["a2_lo"], kw["a2_hi"]] + [a2v for a2v, _ in seg]
+                res = mod.optimize_a2_for_player1_screened(candidates=candidates, segment_optima=seg, **kw)
+            else:
+                res = mod.optimize_a2_for_player1(**kw)
+            a2, u1, mask = float(res.best_a2), float(res.u1_at_best), str(res.chosen_mask)
+            n_calls, strategy = len(res.samples), res.strategy
+            seed = a2
+        except Exception as e:
+            out.append(SweepRecord(index, params, float("nan"), float("nan"), "ERR", 0,
+                                   error=f"{type(e).__name__}: {e}"))
+            seed = None
+            continue
+        out.append(SweepRecord(index, params, a2, u1, mask, n_calls, strategy))
+    return out
+
+
+def _lines(spec: SweepSpec) -> Iterator[List[Tuple[Tuple[int, ...], Dict[str, float]]]]:
+    """Lazily yield the lines of the Cartesian product (C order)."""
+    if not spec.axes:
+        yield [((), spec.params_at(()))]
+        return
+    *outer, last = spec.shape
+    for head in itertools.product(*(range(n) for n in outer)):
+        yield [(head + (k,), spec.params_at(head + (k,))) for k in range(last)]
+
+
+def iter_sweep(
+    spec: SweepSpec,
+    *,
+    workers: int = 1,
+    max_in_flight: Optional[int] = None,
+    continuation: bool = True,
+    screen: bool = True,
+    progress=None,
+    a2_lo: float = 1e-6, a2_hi: float = 1.0 - 1e-6, tol: float = 1e-5, max_iter: int = 200,
+    solver_tol: float = 1e-10,
+) -> Iterator[SweepRecord]:
+    """
+    Evaluate every point of `spec` and yield SweepRecords in C order of their indices.
+
+    continuation: warm-start the optimizer along each line when the last axis is exactly
+    the a1 axis (same a2* as cold starts whenever the optimum moves continuously; see
+    optimize_a2_for_player1_warm). Ignored for target="solve" or other last axes.
+    screen: every other optimize point takes the screened fast path with each mask segment's
+    closed-form optimum as a candidate (optimize_a2_for_player1_screened, same a2* as the
+    cold start); screen=False runs the full cold-start scan. target="solve" lines are solved
+    in one Equil_finder.batch_solver call.
+    workers > 1: lines run in a process pool, at most max_in_flight (default 4 * workers)
+    at a time, so the product is never materialized.
+    progress: optimize_a2.telemetry observer(s); one unit = one point.
+    """
+    _import_optimizer_module()
+    from optimize_a2.telemetry import ProgressTracker
+
+    opt_kwargs = dict(solver_tol=float(solver_tol))
+    if spec.target == "optimize":
+        opt_kwargs.update(a2_lo=float(a2_lo), a2_hi=float(a2_hi), tol=float(tol), max_iter=int(max_iter))
+    warm = bool(continuation) and spec.target == "optimize" and bool(spec.axes) and spec.axes[-1].names == ("a1",)
+
+    tracker = ProgressTracker(progress, label="param sweep")
+    tracker.start(spec.size)
+
+    def report(records: List[SweepRecord]) -> None:
+        tracker.update(
+            units=len(records),
+            solver_calls=sum(r.n_solver_calls for r in records),
+            masks=[r.mask for r in records if not r.error],
+            failures=sum(1 for r in records if r.error),
+        )
+
+    if int(workers) <= 1:
+        for line in _lines(spec):
+            records = _run_line(line, spec.target, opt_kwargs, warm, bool(screen))
+            report(records)
+            yield from records
+        tracker.finish()
+        return
+
+    from collections import deque
+    from concurrent.futures import ProcessPoolExecutor
+
+    limit = int(max_in_flight) if max_in_flight else 4 * int(workers)
+    pending: deque = deque()
+    with ProcessPoolExecutor(max_workers=int(workers)) as pool:
+        for line in _lines(spec):
+            pending.append(pool.submit(_run_line, line, spec.target, opt_kwargs, warm, bool(screen)))
+            while len(pending) >= limit:
+                records = pending.popleft().result()
+                report(records)
+                yield from records
+        while pending:
+            records = pending.popleft().result()
+            report(records)
+            yield from records
+    tracker.finish()
+
+
+def sweep_arrays(spec: SweepSpec, **iter_kwargs) -> Dict:
+    """
+    Run iter_sweep and return {"a2", "u1", "n_solver_calls": ndarray of spec.shape,
+    "mask": object ndarray of spec.shape, "axes": {name: values along its axis}}.
+    """
+    import numpy as np
+
+    out = {
+        "a2": np.full(spec.shape, np.nan),
+        "u1": np.full(spec.shape, np.nan),
+        "n_solver_calls": np.zeros(spec.shape, dtype=np.int64),
+        "mask": np.full(spec.shape, "", dtype=object),
+    }
+    for rec in iter_sweep(spec, **iter_kwargs):
+        out["a2"][rec.index] = rec.a2
+        out["u1"][rec.index] = rec.u1
+        out["n_solver_calls"][rec.index] = rec.n_solver_calls
+        out["mask"][rec.index] = rec.mask
+    out["axes"] = {name: np.asarray(ax.values(name)) for ax in spec.axes for name in ax.names}
+    return out
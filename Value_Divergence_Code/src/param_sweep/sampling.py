@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+"""
+Space-filling samples on the unit cube [0, 1)^d (numpy only, no scipy needed).
+
+  - latin_hypercube(n, d, seed): one point per 1/n stratum in every coordinate.
+  - sobol(n, d, seed, skip):     Sobol' sequence (Joe–Kuo direction numbers, d <= 10),
+                                 optionally randomized by a seeded digital shift.
+  - halton(n, d, seed, skip):    Halton sequence (first d primes), optionally randomized
+                                 by a seeded Cranley–Patterson rotation.
+
+Randomized QMC (seed given) keeps the low-discrepancy structure and makes independent
+replicates possible, which is what error bars need. seed=None gives the plain sequence.
+"""
+
+from __future__ import annotations
+
+from typing import List, Optional
+
+_SOBOL_BITS = 52
+
+# (degree s, coefficient a, initial direction numbers m_1..m_s) for dimensions 2..10,
+# from Joe & Kuo's new-joe-kuo-6.21201 table. Dimension 1 is the van der Corput sequence.
+_SOBOL_JOE_KUO = [
+    (1, 0, (1,)),
+    (2, 1, (1, 3)),
+    (3, 1, (1, 3, 1)),
+    (3, 2, (1, 1, 1)),
+    (4, 1, (1, 1, 3, 3)),
+    (4, 4, (1, 3, 5, 13)),
+    (5, 2, (1, 1, 5, 5, 17)),
+    (5, 4, (1, 1, 5, 5, 5)),
+    (5, 7, (1, 1, 7, 11, 19)),
+]
+SOBOL_MAX_DIM = 1 + len(_SOBOL_JOE_KUO)
+
+_PRIMES = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53]
+
+
+def _rng(seed):
+    import numpy as np
+
+    return seed if isinstance(seed, np.random.Generator) else np.random.default_rng(seed)
+
+
+def latin_hypercube(n: int, d: int, seed=None):
+    """(n, d) array: each column is a random permutation of the n strata, jittered within each."""
+    import numpy as np
+
+    rng = _rng(seed)
+    u = rng.random((n, d))
+    perms = np.argsort(rng.random((n, d)), axis=0)
+    return (perms + u) / n
+
+
+def _sobol_directions(d: int) -> List[List[int]]:
+    """Direction integers v[j][k] (scaled to _SOBOL_BITS bits) for the first d dimensions."""
+    dirs = [[1 << (_SOBOL_BITS - 1 - k) for k in range(_SOBOL_BITS)]]
+    for s, a, m_init in _SOBOL_JOE_KUO[: d - 1]:
+        m = list(m_init)
+        for k in range(s, _SOBOL_BITS):
+            new = m[k - s] ^ (m[k - s] << s)
+            for i in range(1, s):
+                if (a >> (s - 1 - i)) & 1:
+                    new ^= m[k - i] << i
+            m.append(new)
+        dirs.append([m[k] << (_SOBOL_BITS - 1 - k) for k in range(_SOBOL_BITS)])
+    return dirs
+
+
+def sobol(n: int, d: int, seed=None, *, skip: int = 0):
+    """
+    (n, d) array of Sobol' points n = skip, ..., skip + n − 1 (Gray-code order).
+    Balance properties hold for blocks of 2^k points, so prefer powers of two for n and skip.
+    With a seed, every dimension is XOR-ed with one random 52-bit shift (digital shift).
+    """
+    import numpy as np
+
+    if not (1 <= d <= SOBOL_MAX_DIM):
+        raise ValueError(f"sobol supports 1 <= d <= {SOBOL_MAX_DIM}, got d={d}.")
+    dirs = np.array(_sobol_directions(d), dtype=np.uint64)  # (d, bits)
+    # Point i is the XOR of dirs over the set bits of gray(i) = i ^ (i >> 1). Split gray(i) into
+    # its low m bits (lookup table over all 2^m patterns) and its high bits, which equal
+    # gray(i >> m) and are shared by each block of 2^m consecutive indices.
+    m = min(16, max(1, int(skip + n).bit_length()))
+    low = np.zeros((1, d), dtype=np.uint64)
+    for k in range(m):
+        low = np.concatenate([low, low ^ dirs[:, k]])
+    idx = np.arange(skip, skip + n, dtype=np.uint64)
+    gray = idx ^ (idx >> np.uint64(1))
+    b0 = skip >> m
+    blocks = np.arange(b0, ((skip + n - 1) >> m) + 1, dtype=np.uint64)
+    block_gray = blocks ^ (blocks >> np.uint64(1))
+    high = np.zeros((len(blocks), d), dtype=np.uint64)
+    for k in range(_SOBOL_BITS - m):
+        bit = ((block_gray >> np.uint64(k)) & np.uint64(1)).astype(bool)
+        if bit.any():
+            high[bit] ^= dirs[:, m + k]
+    x = low[(gray & np.uint64((1 << m) - 1)).astype(np.int64)]
+    x ^= high[((idx >> np.uint64(m)) - np.uint64(b0)).astype(np.int64)]
+    if seed is not None:
+        shift = _rng(seed).integers(0, 1 << _SOBOL_BITS, size=d, dtype=np.uint64)
+        x ^= shift
+    return x.astype(np.float64) / float(1 << _SOBOL_BITS)
+
+
+def halton(n: int, d: int, seed=None, *, skip: int = 0):
+    """
+    (n, d) array of Halton points n = skip + 1, ..., skip + n (index 0, the origin, is skipped),
+    bases = the first d primes. With a seed, each dimension gets a random rotation mod 1.
+    """
+    import numpy as np
+
+    if not (1 <= d <= len(_PRIMES)):
+        raise ValueError(f"halton supports 1 <= d <= {len(_PRIMES)}, got d={d}.")
+    idx = np.arange(skip + 1, skip + n + 1, dtype=np.int64)
+    out = np.zeros((n, d))
+    for j, base in enumerate(_PRIMES[:d]):
+        rem = idx.copy()
+        f = 1.0
+        while rem.any():
+            f /= base
+            out[:, j] += f * (rem % base)
+            rem //= base
+    if seed is not None:
+        out = (out + _rng(seed).random(d)) % 1.0
+    return out
+
+
+def unit_samples(method: str, n: int, d: int, seed: Optional[int] = None, *, skip: int = 0):
+    """Dispatch by name: 'lhs' | 'sobol' | 'halton' | 'random'."""
+    if method == "lhs":
+        return latin_hypercube(n, d, seed)
+    if method == "sobol":
+        return sobol(n, d, seed, skip=skip)
+    if method == "halton":
+        return halton(n, d, seed, skip=skip)
+    if method == "random":
+        return _rng(seed).random((n, d))
+    raise ValueError(f"Unknown sampling method {method!r}; use 'lhs', 'sobol', 'halton' or 'random'.")
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+a2*(a1) curves for a list of partners, as one 2-D surface (comparative-statics overlays).
+
+compute_a2_star_surface(a1_grid, partner_param_grid) optimizes a2 at every (partner, a1)
+pair and returns arrays shaped (n_partners, n_a1). It is a two-axis SweepSpec (partner
+block, then a1) run by iter_sweep, so each partner's row is one line: the row is computed in
+one task and rows run in parallel with workers > 1. Every point takes the screened fast path
+by default (optimize_a2_for_player1_screened, candidates at each mask segment's closed-form
+optimum): the same a2* as the cold start for ~45 instead of ~2000 solver calls.
+continuation=True warm-starts along the row from the previous a1's a2* instead
+(optimize_a2_for_player1_warm); screen=False runs the full cold-start scan.
+
+Each partner is a dict of the parameters that change between curves (any of c1, c2, p1x,
+p1y, p2x, p2y); the others come from the keyword defaults.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Mapping, Sequence
+
+from .core import MODEL_PARAMS, Axis, SweepSpec, sweep_arrays, values_axis
+
+SURFACE_DEFAULTS = {"p1x": 1.0, "p1y": 1.0, "p2x": 1.0, "p2y": 1.0, "c1": 1.0, "c2": 1.0}
+
+
+def compute_a2_star_surface(
+    a1_grid: Sequence[float],
+    partner_param_grid: Sequence[Mapping[str, float]],
+    *,
+    p1x: float = 1.0, p1y: float = 1.0, p2x: float = 1.0, p2y: float = 1.0,
+    c1: float = 1.0, c2: float = 1.0,
+    workers: int = 1,
+    continuation: bool = False,
+    screen: bool = True,
+    progress=None,
+    a2_lo: float = 1e-6, a2_hi: float = 1.0 - 1e-6, tol: float = 1e-5, max_iter: int = 200,
+    solver_tol: float = 1e-10,
+) -> Dict:
+    """
+    a2* and U1 for every partner (rows) and a1 (columns).
+
+    partner_param_grid: e.g. [{"p2x": s * 2.0, "p2y": s} for s in scales]; every dict must
+    set the same keys. Returns {"a2", "u1", "n_solver_calls": (n_partners, n_a1) arrays,
+    "mask": object array, "a1": a1 grid, "partners": list of full parameter dicts}.
+    progress: optimize_a2.telemetry observer(s); one unit = one (partner, a1) point.
+    """
+    import numpy as np
+
+    partners = [dict(p) for p in partner_param_grid]
+    if not partners:
+        raise ValueError("partner_param_grid is empty.")
+    names = tuple(sorted(partners[0]))
+    if any(tuple(sorted(p)) != names for p in partners):
+        raise ValueError("Every partner dict must set the same parameters.")
+    bad = [n for n in names if n not in SURFACE_DEFAULTS]
+    if bad:
+        raise ValueError(f"Partner parameters must be among {sorted(SURFACE_DEFAULTS)}, got {bad}.")
+
+    defaults = dict(p1x=p1x, p1y=p1y, p2x=p2x, p2y=p2y, c1=c1, c2=c2)
+    partner_axis = Axis(names, tuple(tuple(float(p[n]) for n in names) for p in partners), label="partner")
+    spec = SweepSpec(
+        axes=(partner_axis, values_axis("a1", np.asarray(a1_grid, dtype=float))),
+        fixed={k: float(v) for k, v in defaults.items() if k not in names},
+        target="optimize",
+    )
+    out = sweep_arrays(
+        spec, workers=workers, continuation=continuation, screen=screen, progress=progress,
+        a2_lo=a2_lo, a2_hi=a2_hi, tol=tol, max_iter=max_iter, solver_tol=solver_tol,
+    )
+    full = [{k: v for k, v in spec.params_at((i, 0)).items() if k in MODEL_PARAMS and k != "a1"}
+            for i in range(len(partners))]
+    return {
+        "a2": out["a2"], "u1": out["u1"], "n_solver_calls": out["n_solver_calls"], "mask": out["mask"],
+        "a1": np.asarray(a1_grid, dtype=float), "partners": full,
+    }
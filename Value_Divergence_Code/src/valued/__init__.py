@@ -0,0 +1,7 @@
+"""
+valued
+
+Command-line entry point (`valued = "valued.cli:app"` in pyproject.toml) for the solver,
+optimizer, a1 -> a2* curve builder, (r1, r2) map sweep and equilibrium checker. See valued.cli
+(entry point and the typer-free `solve` path) and valued.commands (the typer app).
+"""
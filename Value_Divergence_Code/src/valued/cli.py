@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+valued: command-line interface to the solver, optimizer, curve builder, map sweep and checker.
+
+  valued solve    --a1 0.45 --a2 0.55 --c2 1.2 --p1y 1.1 --p2x 0.9 --p2y 1.3 [--format json]
+  valued optimize --a1 0.3 --p2x 2 [--sensitivities] [--format json] [--out result.json]
+  valued curve    --p2x 2 --n-points 199 --out outputs/curve [--resume] [--plot]
+  valued sweep    --r1 0.5 2 16 --r2 0.5 2 16 --workers 8 --format memmap --out outputs/map [--heatmaps]
+  valued check    equilibria.csv --out checked.csv --workers 4 [--method local]
+
+`valued solve` is the command batch schedulers call per parameter vector, so it never
+imports typer: app() parses it with argparse and runs the pure-Python solver, which keeps
+its start-up to the interpreter plus ~20 ms (mostly the solver module and argparse).
+Every other command (and --help) goes to the typer app in valued.commands, which imports
+the modules it needs (and with them NumPy / matplotlib) when a command runs. Long commands
+report progress on stderr (--no-progress to silence); bad inputs and library errors such as
+a resume with different parameters exit with status 2 and a one-line message.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from typing import Dict, List, Optional
+
+
+def _emit(text: str, out: Optional[str]) -> None:
+    """Print text, or write it to `out` (atomically) and print the path."""
+    if out is None:
+        print(text)
+        return
+    d = os.path.dirname(out)
+    if d:
+        os.makedirs(d, exist_ok=True)
+    with open(out + ".tmp", "w", encoding="utf-8") as f:
+        f.write(text + "\n")
+    os.replace(out + ".tmp", out)
+    print(f"Wrote {out}")
+
+
+def _utility(sol: Dict, a: float, c: float, player: int) -> float:
+    X, Y = sol["XY"]["X"], sol["XY"]["Y"]
+    s = sol[f"x{player}"] + sol[f"y{player}"]
+    return X ** (1.0 - a) * Y ** a - 0.5 * c * s ** 2
+
+
+def _solution_text(sol: Dict, a1: float, a2: float, c1: float, c2: float) -> str:
+    lines = [f"mask {sol['mask']}   r (Y/X) {sol.get('r', float('nan')):.12g}"]
+    lines.append(f"  x1 = {sol['x1']:.12g}   y1 = {sol['y1']:.12g}")
+    lines.append(f"  x2 = {sol['x2']:.12g}   y2 = {sol['y2']:.12g}")
+    lines.append(f"  X  = {sol['XY']['X']:.12g}   Y  = {sol['XY']['Y']:.12g}")
+    lines.append(f"  U1 = {_utility(sol, a1, c1, 1):.12g}   U2 = {_utility(sol, a2, c2, 2):.12g}")
+    return "\n".join(lines)
+
+
+# ---------- solve ----------
+def run_solve(
+    *,
+    a1: float, a2: float,
+    c1: float = 1.0, c2: float = 1.0,
+    p1x: float = 1.0, p1y: float = 1.0, p2x: float = 1.0, p2y: float = 1.0,
+    tol: float = 1e-10,
+    fmt: str = "text",
+    out: Optional[str] = None,
+) -> None:
+    """Equilibrium for one parameter vector (Finding_Equilibrium_1, pure Python); ValueError on bad input."""
+    from Equil_finder.Finding_Equilibrium_1 import solve_two_task_cobb_douglas_equilibrium
+
+    sol = solve_two_task_cobb_douglas_equilibrium(a1, a2, c1, c2, p1x, p1y, p2x, p2y, tol=tol, verbose=False)
+    if fmt == "json":
+        import json
+
+        _emit(json.dumps(sol, indent=2, default=str), out)
+    elif sol.get("multiple_matches"):
+        parts = [f"{len(sol['masks'])} masks match (knife-edge): {', '.join(sol['masks'])}"]
+        parts += [_solution_text(s, a1, a2, c1, c2) for s in sol["solutions_by_mask"].values()]
+        _emit("\n".join(parts), out)
+    elif sol.get("mask") is None:
+        _emit(f"no equilibrium: {sol.get('reason', 'no feasible mask')}", out)
+    else:
+        _emit(_solution_text(sol, a1, a2, c1, c2), out)
+
+
+def _solve_parser():
+    import argparse
+
+    ap = argparse.ArgumentParser(prog="valued solve", description=run_solve.__doc__.split(";")[0] + ".")
+    ap.add_argument("--a1", type=float, required=True, help="Player 1's weight on Y, in (0, 1).")
+    ap.add_argument("--a2", type=float, required=True, help="Player 2's weight on Y, in (0, 1).")
+    for name in ("c1", "c2", "p1x", "p1y", "p2x", "p2y"):
+        ap.add_argument(f"--{name}", type=float, default=1.0)
+    ap.add_argument("--tol", type=float, default=1e-10, help="Table-1 inequality tolerance.")
+    ap.add_argument("--format", dest="fmt", choices=("text", "json"), default="text",
+                    help="text or json (full solver dict).")
+    ap.add_argument("--out", default=None, help="Write to this file instead of stdout.")
+    return ap
+
+
+def _solve_main(argv: List[str]) -> None:
+    args = _solve_parser().parse_args(argv)
+    try:
+        run_solve(**vars(args))
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(2)
+
+
+def app(argv: Optional[List[str]] = None) -> None:
+    """Entry point (`valued` script): solve runs here, every other command in valued.commands."""
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if argv[:1] == ["solve"]:
+        _solve_main(argv[1:])
+        return
+    from .commands import app as commands_app
+
+    commands_app(args=argv, prog_name="valued")
+
+
+if __name__ == "__main__":
+    app()
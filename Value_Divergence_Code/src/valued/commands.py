@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+"""
+The typer app behind `valued` for every command except the fast `solve` path (see valued.cli,
+which dispatches here). `solve` is registered too so that `valued --help` lists it.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from enum import Enum
+from typing import Optional, Tuple
+
+import typer
+
+from .cli import _emit, run_solve
+
+app = typer.Typer(
+    name="valued",
+    help="Value Divergence model: equilibria, optimal a2, curves, (r1, r2) maps and checks.",
+    add_completion=False,
+    no_args_is_help=True,
+    pretty_exceptions_enable=False,
+)
+
+
+class OutFormat(str, Enum):
+    text = "text"
+    json = "json"
+
+
+class SweepFormat(str, Enum):
+    csv = "csv"
+    npz = "npz"
+    parquet = "parquet"
+    memmap = "memmap"
+
+
+class CheckMethod(str, Enum):
+    exact = "exact"
+    local = "local"
+
+
+def _progress(enabled: bool):
+    if not enabled:
+        return None
+    from optimize_a2.telemetry import ConsoleProgress
+
+    return ConsoleProgress()
+
+
+def _fail(e: Exception) -> None:
+    typer.echo(f"Error: {e}", err=True)
+    raise typer.Exit(code=2)
+
+
+# ---------- solve ----------
+@app.command()
+def solve(
+    a1: float = typer.Option(..., help="Player 1's weight on Y, in (0, 1)."),
+    a2: float = typer.Option(..., help="Player 2's weight on Y, in (0, 1)."),
+    c1: float = typer.Option(1.0), c2: float = typer.Option(1.0),
+    p1x: float = typer.Option(1.0), p1y: float = typer.Option(1.0),
+    p2x: float = typer.Option(1.0), p2y: float = typer.Option(1.0),
+    tol: float = typer.Option(1e-10, help="Table-1 inequality tolerance."),
+    fmt: OutFormat = typer.Option(OutFormat.text, "--format", help="text or json (full solver dict)."),
+    out: Optional[str] = typer.Option(None, "--out", help="Write to this file instead of stdout."),
+) -> None:
+    """Equilibrium for one parameter vector (Finding_Equilibrium_1, pure Python)."""
+    try:
+        run_solve(a1=a1, a2=a2, c1=c1, c2=c2, p1x=p1x, p1y=p1y, p2x=p2x, p2y=p2y, tol=tol,
+                  fmt=fmt.value, out=out)
+    except ValueError as e:
+        _fail(e)
+
+
+# ---------- optimize ----------
+@app.command()
+def optimize(
+    a1: float = typer.Option(..., help="Player 1's weight on Y, in (0, 1)."),
+    c1: float = typer.Option(1.0), c2: float = typer.Option(1.0),
+    p1x: float = typer.Option(1.0), p1y: float = typer.Option(1.0),
+    p2x: float = typer.Option(1.0), p2y: float = typer.Option(1.0),
+    a2_lo: float = typer.Option(1e-6), a2_hi: float = typer.Option(1.0 - 1e-6),
+    tol: float = typer.Option(1e-5, help="Golden-section tolerance on a2."),
+    solver_tol: float = typer.Option(1e-10),
+    sensitivities: bool = typer.Option(False, "--sensitivities", help="Add exact d a2*/dθ (optimize_a2.sensitivity)."),
+    fmt: OutFormat = typer.Option(OutFormat.text, "--format", help="text or json."),
+    out: Optional[str] = typer.Option(None, "--out", help="Write to this file instead of stdout."),
+) -> None:
+    """a2 maximizing Player 1's utility at the given a1 (optimize_a2_for_player1)."""
+    if not 0.0 < a1 < 1.0:
+        _fail(ValueError(f"a1 must be in (0, 1), got {a1:g}."))
+    if not 0.0 < a2_lo < a2_hi < 1.0:
+        _fail(ValueError(f"Require 0 < a2_lo < a2_hi < 1, got a2_lo={a2_lo:g}, a2_hi={a2_hi:g}."))
+    kw = dict(a1=a1, p1x=p1x, p1y=p1y, p2x=p2x, p2y=p2y, c1=c1, c2=c2, a2_lo=a2_lo, a2_hi=a2_hi,
+              tol=tol, solver_tol=solver_tol)
+    try:
+        if sensitivities:
+            from optimize_a2.sensitivity import a2_star_sensitivities
+
+            sens = a2_star_sensitivities(**kw)
+            rec = {"a2_star": sens.a2_star, "u1": sens.u1, "mask": sens.mask, "status": sens.status,
+                   "da2": sens.da2, "du1": sens.du1, "d2u1_da2": sens.d2u1_da2, "note": sens.note,
+                   "n_solver_calls": len(sens.optimization.samples)}
+        else:
+            from optimize_a2.optimize_a2 import optimize_a2_for_player1
+
+            res = optimize_a2_for_player1(**kw)
+            rec = {"a2_star": res.best_a2, "u1": res.u1_at_best, "mask": res.chosen_mask,
+                   "n_solver_calls": len(res.samples)}
+    except ValueError as e:
+        _fail(e)
+    if fmt is OutFormat.json:
+        _emit(json.dumps(rec, indent=2), out)
+        return
+    lines = [f"a2* = {rec['a2_star']:.10g}   U1 = {rec['u1']:.12g}   mask {rec['mask']}   "
+             f"({rec['n_solver_calls']} solver calls)"]
+    if sensitivities:
+        lines.append(f"status {rec['status']}" + (f" ({rec['note']})" if rec["note"] else ""))
+        lines += [f"  d/d{k:<3s}  a2* {rec['da2'][k]: .6g}   U1* {rec['du1'][k]: .6g}" for k in rec["da2"]]
+    _emit("\n".join(lines), out)
+
+
+# ---------- curve ----------
+@app.command()
+def curve(
+    c1: float = typer.Option(1.0), c2: float = typer.Option(1.0),
+    p1x: float = typer.Option(1.0), p1y: float = typer.Option(1.0),
+    p2x: float = typer.Option(1.0), p2y: float = typer.Option(1.0),
+    min_a1: float = typer.Option(0.001), max_a1: float = typer.Option(0.999),
+    n_points: int = typer.Option(999),
+    continuation: bool = typer.Option(True, help="Warm-start the optimizer along a1."),
+    out: str = typer.Option(..., "--out", help="Output directory (CSV + checkpoint manifest)."),
+    csv_name: str = typer.Option("a1_vs_opt_a2.csv"),
+    resume: bool = typer.Option(True, help="Skip a1 values already in a matching CSV."),
+    plot: bool = typer.Option(False, "--plot", help="Also render the PNG from the finished CSV."),
+    progress: bool = typer.Option(True, help="Progress line on stderr."),
+) -> None:
+    """Stream the a1 -> a2*(a1) curve to a resumable CSV (make_optimal_a2_graph.stream_and_save)."""
+    from make_optimal_a2_graph.core import load_points_csv, plot_and_save, stream_and_save
+
+    try:
+        for _ in stream_and_save(
+            p1x=p1x, p1y=p1y, p2x=p2x, p2y=p2y, c1=c1, c2=c2, min_a1=min_a1, max_a1=max_a1,
+            n_points=n_points, continuation=continuation, output_dir=out, csv_name=csv_name,
+            resume=resume, progress=_progress(progress),
+        ):
+            pass
+    except ValueError as e:
+        _fail(e)
+    csv_path = os.path.join(out, csv_name)
+    typer.echo(f"Wrote {csv_path}")
+    if plot:
+        png = os.path.splitext(csv_path)[0] + ".png"
+        plot_and_save(load_points_csv(csv_path), png, p1x=p1x, p1y=p1y, p2x=p2x, p2y=p2y)
+        typer.echo(f"Wrote {png}")
+
+
+# ---------- sweep ----------
+@app.command()
+def sweep(
+    r1: Tuple[float, float, int] = typer.Option((0.5, 2.0, 16), metavar="MIN MAX STEPS"),
+    r2: Tuple[float, float, int] = typer.Option((0.5, 2.0, 16), metavar="MIN MAX STEPS"),
+    a1: Tuple[float, float, int] = typer.Option((0.01, 0.99, 101), metavar="MIN MAX STEPS"),
+    c: float = typer.Option(1.0, help="Common cost c1 = c2."),
+    screen: bool = typer.Option(False, help="Screened optimizer fast path (analytic candidates for every mask)."),
+    workers: int = typer.Option(1, help="Worker processes."),
+    fmt: SweepFormat = typer.Option(SweepFormat.csv, "--format",
+                                    help="csv (streamed summary/raw CSVs), npz / parquet (columnar chunks) "
+                                         "or memmap ([r1, r2, a1] .npy arrays)."),
+    out: str = typer.Option(..., "--out", help="Output directory."),
+    resume: bool = typer.Option(True, help="Continue a matching earlier run (csv and memmap formats)."),
+    raw: bool = typer.Option(True, help="Keep per-a1 rows (csv / npz / parquet)."),
+    heatmaps: bool = typer.Option(False, "--heatmaps", help="Render both heatmaps into --out afterwards."),
+    progress: bool = typer.Option(True, help="Progress line on stderr."),
+) -> None:
+    """(r1, r2) opposites-attract map (make_optimal_a2_map)."""
+    import make_optimal_a2_map as m
+
+    kw = dict(
+        r1_min=r1[0], r1_max=r1[1], r1_steps=int(r1[2]), r2_min=r2[0], r2_max=r2[1], r2_steps=int(r2[2]),
+        a1_min=a1[0], a1_max=a1[1], a1_steps=int(a1[2]), c=c, screen=screen, workers=workers,
+        progress=_progress(progress),
+    )
+    try:
+        if fmt is SweepFormat.csv:
+            source = os.path.join(out, "opposites_attract_grid_summary.csv")
+            raw_path = os.path.join(out, "opposites_attract_grid_raw.csv") if raw else None
+            os.makedirs(out, exist_ok=True)
+            for _ in m.stream_sweep_productivities(summary_path=source, raw_path=raw_path, resume=resume, **kw):
+                pass
+        elif fmt is SweepFormat.memmap:
+            source = m.sweep_productivities_memmap(out_dir=out, resume=resume, **kw)
+        else:
+            if resume:
+                typer.echo("Note: --resume has no effect with columnar formats; rerunning the sweep.", err=True)
+            m.sweep_productivities_columnar(out_dir=out, fmt=fmt.value, write_raw=raw, **kw)
+            source = out
+    except ValueError as e:
+        _fail(e)
+    typer.echo(f"Wrote {out}")
+    if heatmaps:
+        paths = m.plot_heatmaps_from_summary(
+            source, os.path.join(out, "opposites_attract_fraction_heatmap.png"),
+            os.path.join(out, "opposites_attract_signed_gap_heatmap.png"), workers=min(2, workers),
+        )
+        typer.echo("Heatmaps: " + ", ".join(paths))
+
+
+# ---------- check ----------
+@app.command()
+def check(
+    input_csv: str = typer.Argument(..., help="CSV with a1..p2y and x1, y1, x2, y2 columns."),
+    out: str = typer.Option(..., "--out", help="Output CSV."),
+    method: CheckMethod = typer.Option(CheckMethod.exact, help="exact best responses or the ±delta stencil."),
+    tol: float = typer.Option(1e-10),
+    delta: float = typer.Option(1e-4, help="Stencil step (local only)."),
+    chunk_rows: int = typer.Option(200_000),
+    workers: int = typer.Option(1, help="Worker processes."),
+) -> None:
+    """Nash check of every row of an equilibrium CSV (Equil_finder.best_response / local_nash)."""
+    try:
+        if method is CheckMethod.exact:
+            from Equil_finder.best_response import verify_equilibrium_csv
+
+            n = verify_equilibrium_csv(input_csv, out, tol=tol, chunk_rows=chunk_rows, workers=workers)
+        else:
+            from Equil_finder.local_nash import check_equilibrium_csv
+
+            n = check_equilibrium_csv(input_csv, out, delta=delta, tol=tol, chunk_rows=chunk_rows, workers=workers)
+    except (ValueError, OSError) as e:
+        _fail(e)
+    typer.echo(f"Checked {n} rows -> {out}")
+
+
+if __name__ == "__main__":
+    app()
@@ -15,19 +15,17 @@ Fixed:
   p1x = 1, p1y = 1, c1 = 1, c2 = 1
 
 Notes:
-  - We import your optimizer from:
-      /Users/tonymolino/Dropbox/Mac/Desktop/PyProjects/Value_Divergence/Value_Divergence_Code/src/optimize_a2/optimize_a2.py
-  - If 'optimize_a2_for_player1_grid' exists, we use it with n=301 (faster).
-    Otherwise we call 'optimize_a2_for_player1' (your robust version).
+  - All 10 curves (2 ratios x 5 scales) come from ONE call to
+    param_sweep.compute_a2_star_surface: each curve is one line over A1_GRID (screened optimizer),
+    and curves run in parallel with WORKERS > 1.
+  - Both PNGs are drawn by figures.render_figures (Agg, WORKERS processes); a figure whose
+    curves are unchanged since the last run is not redrawn.
   - Outputs are saved under:
       /Users/tonymolino/Dropbox/Mac/Desktop/PyProjects/Value_Divergence/Value_Divergence_Code/outputs
 """
 
 import sys
 from pathlib import Path
-import math
-import matplotlib.pyplot as plt
-import numpy as np
 
 # ---------- Absolute, project-specific paths ----------
 SRC_DIR = Path("/Users/tonymolino/Dropbox/Mac/Desktop/PyProjects/Value_Divergence/Value_Divergence_Code/src")
@@ -37,82 +35,64 @@ OUT_DIR.mkdir(parents=True, exist_ok=True)
 if str(SRC_DIR) not in sys.path:
     sys.path.insert(0, str(SRC_DIR))
 
-# ---------- Import optimizer (prefer grid if available; else robust) ----------
-from optimize_a2 import optimize_a2_for_player1 as opt_robust  # type: ignore
-# Optional speed-up: if present, use brute-force grid with small n
-try:
-    from optimize_a2 import optimize_a2_for_player1_grid as opt_grid  # type: ignore
-except Exception:
-    opt_grid = None
-
-def a2_star(a1: float, p1x: float, p1y: float, p2x: float, p2y: float,
-            c1: float = 1.0, c2: float = 1.0) -> float:
-    """Return a2* maximizing U1 at given a1 and productivities, calling your canonical solver inside."""
-    if opt_grid is not None:
-        res = opt_grid(
-            a1=a1, p1x=p1x, p1y=p1y, p2x=p2x, p2y=p2y, c1=c1, c2=c2,
-            a2_lo=1e-6, a2_hi=1.0-1e-6, n=301,  # dense enough, much faster than huge coarse scans
-            solver_tol=1e-10, solver_verbose=False,
-        )
-    else:
-        res = opt_robust(
-            a1=a1, p1x=p1x, p1y=p1y, p2x=p2x, p2y=p2y, c1=c1, c2=c2,
-            a2_lo=1e-6, a2_hi=1.0-1e-6, tol=1e-5, max_iter=200,
-            solver_tol=1e-10, solver_verbose=False,
-        )
-    return float(res.best_a2)
+from param_sweep import compute_a2_star_surface  # type: ignore
+from figures import FigureSpec, render_figures  # type: ignore
 
 # ---------- Fixed player-1 and costs ----------
 P1X, P1Y = 1.0, 1.0
 C1, C2   = 1.0, 1.0
 
 # ---------- a1 grid (kept modest for speed; increase if you want smoother curves) ----------
-A1_GRID = np.linspace(0.001, 0.999, 121)  # 121 points ~ fast but clear
+# plain floats: importing this script (spawned workers re-import it) does not load NumPy
+A1_GRID = [0.001 + k * (0.999 - 0.001) / 120 for k in range(121)]  # 121 points
 
 # ---------- Five absolute-strength levels (scales) ----------
 SCALES = [0.5, 0.75, 1.0, 1.5, 2.0]  # 5 curves
 
-# ---------- Helper to compute and plot one overlay ----------
-def overlay_for_fixed_ratio(r2: float, tag: str):
+# ---------- Parallelism (1 = serial; curves are independent) ----------
+WORKERS = 1
+
+# ---------- Helper to describe one overlay ----------
+def overlay_for_fixed_ratio(r2: float, tag: str, curves) -> FigureSpec:
     """
     Keep comparative advantage fixed at r2 = p2x/p2y.
-    For each absolute scale s in SCALES, set p2 = s * (r2, 1) and overlay a2*(a1) curve.
+    curves: [(s, p2x, p2y, a2* along A1_GRID)] for each absolute scale s in SCALES.
     """
-    plt.figure()
-    for s in SCALES:
-        p2x = s * r2
-        p2y = s * 1.0
-
-        # compute curve
-        ys = []
-        for a1 in A1_GRID:
-            ys.append(a2_star(a1, P1X, P1Y, p2x, p2y, C1, C2))
-
-        label = f"s={s:g}  (p2x={p2x:g}, p2y={p2y:g})"
-        plt.plot(A1_GRID, ys, label=label)  # default colors cycle; distinct across five curves
-
     adv = "X-advantage" if r2 > 1.0 else ("Y-advantage" if r2 < 1.0 else "balanced")
-    plt.xlabel("a1")
-    plt.ylabel("a2*(a1)")
-    plt.title(f"Overlay: a1 vs a2*(a1) | Opponent {adv} (r2={r2:g}), p1=(1,1), c=(1,1)")
-    plt.grid(True)
-    plt.legend()
-    plt.tight_layout()
-
-    # Save with parameters in filename
-    out_png = OUT_DIR / f"overlay_a1_vs_a2star__{tag}__r2-{r2:g}__p1x-1_p1y-1.png"
-    plt.savefig(str(out_png), dpi=200)
-    plt.close()
-    print("Saved:", out_png)
+    return FigureSpec(
+        # Save with parameters in filename
+        path=str(OUT_DIR / f"overlay_a1_vs_a2star__{tag}__r2-{r2:g}__p1x-1_p1y-1.png"),
+        kind="lines",
+        data={"x": A1_GRID, "y": [ys for *_, ys in curves]},
+        options={
+            # default colors cycle; distinct across five curves
+            "labels": [f"s={s:g}  (p2x={p2x:g}, p2y={p2y:g})" for s, p2x, p2y, _ in curves],
+            "xlabel": "a1", "ylabel": "a2*(a1)",
+            "title": f"Overlay: a1 vs a2*(a1) | Opponent {adv} (r2={r2:g}), p1=(1,1), c=(1,1)",
+        },
+    )
 
 def main():
-    # Panel A: Opponent relatively better at X (fix r2>1)
-    R2_X = 2.0    # choose a clear X-advantage
-    overlay_for_fixed_ratio(R2_X, tag="Xadv")
-
-    # Panel B: Opponent relatively better at Y (fix r2<1)
-    R2_Y = 0.5    # choose a clear Y-advantage
-    overlay_for_fixed_ratio(R2_Y, tag="Yadv")
+    panels = [
+        (2.0, "Xadv"),   # Panel A: opponent relatively better at X (r2 > 1)
+        (0.5, "Yadv"),   # Panel B: opponent relatively better at Y (r2 < 1)
+    ]
+    # For each panel and scale s: p2 = s * (r2, 1)
+    partners = [{"p2x": s * r2, "p2y": s * 1.0} for r2, _ in panels for s in SCALES]
+    surf = compute_a2_star_surface(
+        A1_GRID, partners, p1x=P1X, p1y=P1Y, c1=C1, c2=C2, workers=WORKERS,
+        a2_lo=1e-6, a2_hi=1.0-1e-6, tol=1e-5, max_iter=200, solver_tol=1e-10,
+    )
+    specs = []
+    for i, (r2, tag) in enumerate(panels):
+        rows = range(i * len(SCALES), (i + 1) * len(SCALES))
+        curves = [(s, partners[k]["p2x"], partners[k]["p2y"], surf["a2"][k]) for s, k in zip(SCALES, rows)]
+        specs.append(overlay_for_fixed_ratio(r2, tag, curves))
+    done = render_figures(specs, workers=WORKERS)
+    for path in done["rendered"]:
+        print("Saved:", path)
+    for path in done["skipped"]:
+        print("Unchanged:", path)
 
 if __name__ == "__main__":
     main()
@@ -10,13 +10,14 @@ Absolute strength "S" is held fixed under one of:
   MODE="gm":  p2x = S*sqrt(r2),  p2y = S/sqrt(r2)   (fix product p2x*p2y = S^2)
   MODE="l1":  p2x = 2S*r2/(1+r2), p2y = 2S/(1+r2)  (fix sum p2x+p2y = 2S)
 
-Curves: r2_list below (edit as you like).
+Curves: r2_list below (edit as you like). All curves come from one
+param_sweep.compute_a2_star_surface call (one screened line over A1_GRID per r2;
+WORKERS > 1 runs curves in parallel). The PNG is drawn on the Agg canvas by
+figures.render_figure and skipped when the curves are unchanged since the last run.
 """
 
 import sys
 from pathlib import Path
-import numpy as np
-import matplotlib.pyplot as plt
 
 # ---- project paths ----
 SRC_DIR = Path("/Users/tonymolino/Dropbox/Mac/Desktop/PyProjects/Value_Divergence/Value_Divergence_Code/src")
@@ -25,24 +26,24 @@ OUT_DIR.mkdir(parents=True, exist_ok=True)
 if str(SRC_DIR) not in sys.path:
     sys.path.insert(0, str(SRC_DIR))
 
-# prefer grid optimizer for speed if available
-from optimize_a2 import optimize_a2_for_player1 as opt_robust  # type: ignore
-try:
-    from optimize_a2 import optimize_a2_for_player1_grid as opt_grid  # type: ignore
-except Exception:
-    opt_grid = None
+from param_sweep import compute_a2_star_surface  # type: ignore
+from figures import FigureSpec, render_figure  # type: ignore
 
 # ---- fixed player-1 & costs ----
 P1X = 1.0; P1Y = 1.0
 C1  = 1.0; C2  = 1.0
 
 # ---- a1 grid (keep modest for speed; increase if you want) ----
-A1_GRID = np.linspace(0.001, 0.999, 101)
+# plain floats: importing this script (spawned workers re-import it) does not load NumPy
+A1_GRID = [0.001 + k * (0.999 - 0.001) / 100 for k in range(101)]  # 101 points
 
 # ---- absolute-strength definition ----
 MODE = "gm"   # "gm" (product fixed) or "l1" (sum fixed)
 S    = 1.0    # absolute level to hold fixed
 
+# ---- parallelism (1 = serial; curves are independent) ----
+WORKERS = 1
+
 def p2_from(r2: float, mode: str, S: float) -> tuple[float, float]:
     if mode == "gm":
         return (S * (r2**0.5), S / (r2**0.5))           # p2x*p2y = S^2
@@ -51,43 +52,30 @@ def p2_from(r2: float, mode: str, S: float) -> tuple[float, float]:
     else:
         raise ValueError("MODE must be 'gm' or 'l1'")
 
-def a2_star(a1: float, p2x: float, p2y: float) -> float:
-    if opt_grid is not None:
-        res = opt_grid(
-            a1=a1, p1x=P1X, p1y=P1Y, p2x=p2x, p2y=p2y, c1=C1, c2=C2,
-            a2_lo=1e-6, a2_hi=1-1e-6, n=201, solver_tol=1e-10, solver_verbose=False,
-        )
-    else:
-        res = opt_robust(
-            a1=a1, p1x=P1X, p1y=P1Y, p2x=p2x, p2y=p2y, c1=C1, c2=C2,
-            a2_lo=1e-6, a2_hi=1-1e-6, tol=1e-5, max_iter=200,
-            solver_tol=1e-10, solver_verbose=False,
-        )
-    return float(res.best_a2)
-
 def main():
     # r2 list spans Y-adv (<1), balanced (=1), X-adv (>1)
     r2_list = [0.3333333333, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0]  # edit freely
 
-    plt.figure()
-    for r2 in r2_list:
-        p2x, p2y = p2_from(r2, MODE, S)
-        ys = [a2_star(a1, p2x, p2y) for a1 in A1_GRID]
-        plt.plot(A1_GRID, ys, label=f"r2={r2:g}  (p2x={p2x:g}, p2y={p2y:g})")
+    p2s = [p2_from(r2, MODE, S) for r2 in r2_list]
+    surf = compute_a2_star_surface(
+        A1_GRID, [{"p2x": p2x, "p2y": p2y} for p2x, p2y in p2s],
+        p1x=P1X, p1y=P1Y, c1=C1, c2=C2, workers=WORKERS,
+        a2_lo=1e-6, a2_hi=1-1e-6, tol=1e-5, max_iter=200, solver_tol=1e-10,
+    )
 
     mode_text = "GM fixed (p2x·p2y=S^2)" if MODE=="gm" else "L1 fixed (p2x+p2y=2S)"
-    plt.xlabel("a1")
-    plt.ylabel("a2*(a1)")
-    plt.title(f"a1 vs a2*(a1) | Opponent comparative advantage across both sides\n"
-              f"p1=(1,1), c=(1,1); {mode_text}, S={S:g}")
-    plt.grid(True)
-    plt.legend()
-    plt.tight_layout()
-
     out_png = OUT_DIR / f"overlay_ratio_across_both__{MODE}_S-{S:g}.png"
-    plt.savefig(out_png, dpi=200)
-    plt.close()
-    print("Saved:", out_png)
+    drawn = render_figure(FigureSpec(
+        path=str(out_png), kind="lines",
+        data={"x": A1_GRID, "y": surf["a2"]},
+        options={
+            "labels": [f"r2={r2:g}  (p2x={p2x:g}, p2y={p2y:g})" for r2, (p2x, p2y) in zip(r2_list, p2s)],
+            "xlabel": "a1", "ylabel": "a2*(a1)",
+            "title": (f"a1 vs a2*(a1) | Opponent comparative advantage across both sides\n"
+                      f"p1=(1,1), c=(1,1); {mode_text}, S={S:g}"),
+        },
+    ))
+    print("Saved:" if drawn else "Unchanged:", out_png)
 
 if __name__ == "__main__":
     main()
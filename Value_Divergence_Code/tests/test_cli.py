@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""valued CLI: the solve fast path, exit codes, and the typer commands behind it."""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from valued.cli import app
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+
+def test_solve_json_matches_solver(capsys):
+    from Equil_finder.Finding_Equilibrium_1 import solve_two_task_cobb_douglas_equilibrium
+
+    app(["solve", "--a1", "0.45", "--a2", "0.55", "--p2x", "0.9", "--format", "json"])
+    got = json.loads(capsys.readouterr().out)
+    sol = solve_two_task_cobb_douglas_equilibrium(0.45, 0.55, 1.0, 1.0, 1.0, 1.0, 0.9, 1.0, tol=1e-10, verbose=False)
+    assert got["mask"] == sol["mask"] and got["x1"] == pytest.approx(sol["x1"], rel=1e-12)
+
+
+@pytest.mark.parametrize("argv", [
+    ["solve", "--a1", "1.5", "--a2", "0.5"],
+    ["optimize", "--a1", "0"],
+    ["optimize", "--a1", "0.5", "--a2-lo", "0.6", "--a2-hi", "0.4"],
+])
+def test_bad_input_exits_2(argv, capsys):
+    with pytest.raises(SystemExit) as e:
+        app(argv)
+    assert e.value.code == 2
+    assert capsys.readouterr().err.startswith("Error:")
+
+
+def test_solve_does_not_import_typer():
+    code = ("import sys; from valued.cli import app; app(['solve', '--a1', '0.3', '--a2', '0.6']); "
+            "sys.exit('typer' in sys.modules or 'numpy' in sys.modules)")
+    proc = subprocess.run([sys.executable, "-c", code], env=dict(os.environ, PYTHONPATH=SRC_DIR),
+                          capture_output=True, text=True)
+    assert proc.returncode == 0, proc.stderr
+    assert "mask" in proc.stdout or "no equilibrium" in proc.stdout
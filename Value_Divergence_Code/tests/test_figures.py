@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""figures: unchanged inputs are skipped by hash, changed inputs or a missing PNG are redrawn."""
+
+import json
+
+import numpy as np
+import pytest
+
+from figures import FigureSpec, render_figure, render_figures
+from figures.render import MANIFEST_NAME
+
+
+def _specs(d, scale=1.0):
+    x = np.linspace(0.0, 1.0, 11)
+    return [
+        FigureSpec(str(d / "line.png"), "lines", {"x": x, "y": scale * x ** 2}, {"title": "t"}, dpi=40),
+        FigureSpec(str(d / "map.png"), "heatmap", {"x": x, "y": x, "Z": scale * np.outer(x, x)}, dpi=40),
+    ]
+
+
+def test_second_run_skips_unchanged(tmp_path):
+    first = render_figures(_specs(tmp_path), workers=2)
+    assert sorted(first["rendered"]) == sorted(s.path for s in _specs(tmp_path)) and not first["skipped"]
+    with open(tmp_path / MANIFEST_NAME) as f:
+        assert set(json.load(f)) == {"line.png", "map.png"}
+    mtime = (tmp_path / "line.png").stat().st_mtime_ns
+
+    again = render_figures(_specs(tmp_path))
+    assert not again["rendered"] and len(again["skipped"]) == 2
+    assert (tmp_path / "line.png").stat().st_mtime_ns == mtime
+    assert render_figure(_specs(tmp_path)[0]) is False
+    assert render_figure(_specs(tmp_path)[0], force=True) is True
+
+
+def test_changed_inputs_or_missing_png_redraw(tmp_path):
+    render_figures(_specs(tmp_path))
+    changed = _specs(tmp_path, scale=2.0)
+    out = render_figures([changed[0], _specs(tmp_path)[1]])
+    assert out["rendered"] == [changed[0].path] and out["skipped"] == [str(tmp_path / "map.png")]
+
+    (tmp_path / "map.png").unlink()
+    assert render_figures(_specs(tmp_path, scale=2.0))["rendered"] == [str(tmp_path / "map.png")]
+
+
+def test_rejects_unknown_kind_and_duplicate_paths(tmp_path):
+    with pytest.raises(ValueError):
+        render_figures([FigureSpec(str(tmp_path / "a.png"), "pie")])
+    spec = _specs(tmp_path)[0]
+    with pytest.raises(ValueError):
+        render_figures([spec, spec])
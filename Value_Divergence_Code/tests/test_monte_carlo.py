@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""Monte Carlo a2*: screened == cold start, and results do not depend on the worker count."""
+
+import numpy as np
+
+from param_sweep.monte_carlo import run_a2_monte_carlo
+
+DISTS = {"a1": ("uniform", 0.1, 0.9), "c1": 1.0, "c2": 1.0, "p1x": ("uniform", 0.5, 2.0), "p1y": 1.0,
+         "p2x": ("loguniform", 0.5, 2.0), "p2y": 1.0}
+
+
+def _same(a, b):
+    assert (a.n_draws, a.n_valid, a.n_failed) == (b.n_draws, b.n_valid, b.n_failed)
+    assert a.mean == b.mean and a.std == b.std
+    assert a.quantiles == b.quantiles and a.mask_probs == b.mask_probs and a.p_opposites == b.p_opposites
+    assert np.array_equal(a.hist_counts, b.hist_counts)
+
+
+def test_screened_equals_cold():
+    cold = run_a2_monte_carlo(DISTS, max_draws=60, batch_size=20, seed=3)
+    fast = run_a2_monte_carlo(DISTS, max_draws=60, batch_size=20, seed=3, screen=True)
+    _same(cold, fast)
+    assert fast.n_solver_calls * 10 < cold.n_solver_calls
+
+
+def test_workers_do_not_change_results():
+    serial = run_a2_monte_carlo(DISTS, max_draws=200, batch_size=25, seed=8, screen=True)
+    parallel = run_a2_monte_carlo(DISTS, max_draws=200, batch_size=25, seed=8, screen=True,
+                                  workers=2, max_in_flight=3)
+    _same(serial, parallel)
+    assert serial.n_solver_calls == parallel.n_solver_calls
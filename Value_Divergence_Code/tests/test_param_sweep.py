@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""param_sweep: the screened and batched paths must reproduce the scalar optimizer / solver."""
+
+import math
+
+import numpy as np
+
+from optimize_a2 import optimize_a2_for_player1
+from param_sweep import SweepSpec, compute_a2_star_surface, sweep_arrays
+from param_sweep.core import _import_optimizer_module, _lines, _run_line, _solve_point
+
+OPT_SPEC = {
+    "target": "optimize",
+    "axes": [{"sample": "sobol", "n": 8, "seed": 1, "bounds": {"p1x": [0.5, 2], "p2x": [0.5, 2], "c2": [0.5, 2]}},
+             {"name": "a1", "linspace": [0.02, 0.98, 5]}],
+    "fixed": {"p1y": 1.0, "p2y": 1.0, "c1": 1.0},
+}
+SOLVE_SPEC = {
+    "target": "solve",
+    "axes": [{"sample": "sobol", "n": 16, "seed": 2, "bounds": {"p1x": [0.5, 2], "p2x": [0.5, 2], "a1": [0.01, 0.99]}},
+             {"name": "a2", "linspace": [0.0, 1.0, 21]}],
+    "fixed": {"p1y": 1.0, "p2y": 1.0, "c1": 1.0, "c2": 1.0},
+}
+
+
+def test_screened_sweep_matches_cold():
+    spec = SweepSpec.from_dict(OPT_SPEC)
+    screened = sweep_arrays(spec, continuation=False)
+    cold = sweep_arrays(spec, continuation=False, screen=False)
+    assert np.array_equal(screened["a2"], cold["a2"])
+    assert np.array_equal(screened["u1"], cold["u1"])
+    assert (screened["mask"] == cold["mask"]).all()
+    assert screened["n_solver_calls"].sum() * 10 < cold["n_solver_calls"].sum()
+
+
+def test_parallel_sweep_matches_serial():
+    spec = SweepSpec.from_dict(OPT_SPEC)
+    serial = sweep_arrays(spec)
+    parallel = sweep_arrays(spec, workers=2, max_in_flight=2)
+    assert np.array_equal(serial["a2"], parallel["a2"])
+    assert (serial["mask"] == parallel["mask"]).all()
+
+
+def test_batched_solve_matches_scalar_solver():
+    spec = SweepSpec.from_dict(SOLVE_SPEC)
+    mod = _import_optimizer_module()
+    solver = mod._import_solver()[0]
+    opt_kwargs = dict(solver_tol=1e-10)
+    for line in _lines(spec):
+        for (_, params), rec in zip(line, _run_line(line, "solve", opt_kwargs, False)):
+            if not 0.0 < params["a2"] < 1.0:
+                assert rec.mask == "ERR" and rec.error.startswith("ValueError")
+                continue
+            a2, u1, mask, _, _ = _solve_point(mod, solver, params, opt_kwargs)
+            assert (rec.a2, rec.mask) == (a2, mask)
+            assert (math.isnan(u1) and math.isnan(rec.u1)) or math.isclose(rec.u1, u1, rel_tol=1e-12)
+
+
+def test_surface_matches_cold_optimizer():
+    a1_grid = [0.05, 0.3, 0.6, 0.9]
+    partners = [{"p2x": 2.0 * s, "p2y": s} for s in (0.5, 1.0, 1.5)]
+    surf = compute_a2_star_surface(a1_grid, partners, p1x=1.2)
+    for i, partner in enumerate(partners):
+        for j, a1 in enumerate(a1_grid):
+            res = optimize_a2_for_player1(a1=a1, p1x=1.2, p1y=1.0, c1=1.0, c2=1.0, **partner)
+            assert (surf["a2"][i, j], surf["mask"][i, j]) == (res.best_a2, res.chosen_mask)
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""IFT sensitivities of a2* and envelope-theorem dU1*/dθ against central finite differences."""
+
+import math
+
+import pytest
+
+from optimize_a2.sensitivity import SENSITIVITY_PARAMS, a2_star_sensitivities
+
+INTERIOR = [
+    # (parameters, mask at a2*) with a strict interior optimum
+    (dict(a1=0.733, p1x=1.4, p1y=1.762, p2x=1.052, p2y=1.01, c1=0.937, c2=1.801), "Y,X"),
+    (dict(a1=0.924, p1x=1.074, p1y=1.704, p2x=1.149, p2y=0.747, c1=0.988, c2=0.689), "Y,B"),
+    (dict(a1=0.272, p1x=1.772, p1y=0.991, p2x=1.104, p2y=1.04, c1=0.574, c2=1.913), "X,Y"),
+]
+H = 1e-5
+
+
+@pytest.mark.parametrize("params, mask", INTERIOR)
+def test_interior_sensitivities_match_finite_differences(params, mask):
+    s = a2_star_sensitivities(**params)
+    assert s.status == "interior" and s.mask == mask
+    assert s.d2u1_da2 < 0.0
+    for theta in SENSITIVITY_PARAMS:
+        # the polished a2* is exact to rounding, so a small central step is accurate
+        up = a2_star_sensitivities(**dict(params, **{theta: params[theta] + H}))
+        dn = a2_star_sensitivities(**dict(params, **{theta: params[theta] - H}))
+        assert up.status == dn.status == "interior"
+        fd_a2 = (up.a2_star - dn.a2_star) / (2.0 * H)
+        fd_u1 = (up.u1 - dn.u1) / (2.0 * H)
+        assert s.da2[theta] == pytest.approx(fd_a2, rel=1e-5, abs=1e-7), theta
+        assert s.du1[theta] == pytest.approx(fd_u1, rel=1e-5, abs=1e-7), theta
+
+
+def test_endpoint_optimum_has_zero_da2():
+    s = a2_star_sensitivities(a1=0.3, p1x=1.0, p1y=1.0, p2x=2.0, p2y=1.0, c1=1.0, c2=1.0)
+    assert s.status == "endpoint"
+    assert all(v == 0.0 for v in s.da2.values())
+    assert all(math.isfinite(v) for v in s.du1.values())
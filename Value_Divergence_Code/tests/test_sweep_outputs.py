@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+"""(r1, r2) sweep outputs: every storage path summarizes a sweep to the same bits."""
+
+import numpy as np
+
+from make_optimal_a2_map import stream_sweep_productivities, summarize_sweep_memmap, sweep_productivities_memmap
+
+GRID = dict(r1_min=0.5, r1_max=2.0, r1_steps=3, r2_min=0.5, r2_max=2.0, r2_steps=4,
+            a1_min=0.01, a1_max=0.99, a1_steps=23, screen=True)
+
+
+def test_memmap_summary_matches_streamed_summary(tmp_path):
+    rows = [row for row, _ in stream_sweep_productivities(summary_path=str(tmp_path / "s.csv"), raw_path=None, **GRID)]
+    summary = summarize_sweep_memmap(sweep_productivities_memmap(out_dir=str(tmp_path / "mm"), **GRID))
+    assert list(summary["r1"]) == [row["r1"] for row in rows]
+    assert list(summary["r2"]) == [row["r2"] for row in rows]
+    assert list(summary["n_valid"]) == [row["n_valid"] for row in rows]
+    for key in ("frac_match_opposites", "mean_signed_gap"):
+        assert np.array_equal(summary[key], np.array([row[key] for row in rows]), equal_nan=True), key
+
+
+def test_parallel_memmap_matches_serial(tmp_path):
+    serial = summarize_sweep_memmap(sweep_productivities_memmap(out_dir=str(tmp_path / "a"), **GRID))
+    parallel = summarize_sweep_memmap(sweep_productivities_memmap(out_dir=str(tmp_path / "b"), workers=2, **GRID))
+    for key, col in serial.items():
+        assert np.array_equal(col, parallel[key], equal_nan=col.dtype.kind == "f"), key
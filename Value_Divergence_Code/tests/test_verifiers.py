@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""best_response (exact BR / KKT) and local_nash (±delta stencil) agree on solved and perturbed rows."""
+
+import csv
+
+import numpy as np
+
+from Equil_finder.batch_solver import solve_equilibrium_batch
+from Equil_finder.best_response import verify_equilibrium_batch, verify_equilibrium_csv
+from Equil_finder.local_nash import REQUIRED_COLS, check_equilibrium_csv, check_local_nash_batch
+from Equil_finder.mask_sampler import MASKS, PARAM_NAMES, sample_mask_params
+
+BOUNDS = {"a1": (0.05, 0.95), "a2": (0.05, 0.95), "c1": (0.5, 2.0), "c2": (0.5, 2.0),
+          "p1x": (0.5, 2.0), "p1y": (0.5, 2.0), "p2x": (0.5, 2.0), "p2y": (0.5, 2.0)}
+
+
+def _solved_rows(n_per_mask=8, seed=5):
+    parts = [sample_mask_params(m, n_per_mask, BOUNDS, rng=seed + i) for i, m in enumerate(MASKS)]
+    cols = {k: np.concatenate([p[k] for p in parts]) for k in PARAM_NAMES}
+    sol = solve_equilibrium_batch(cols, 1e-10)
+    keep = sol["mask"] >= 0
+    cols.update({k: sol[k] for k in ("x1", "y1", "x2", "y2")})
+    return {k: v[keep] for k, v in cols.items()}
+
+
+def test_solver_rows_pass_both_checks():
+    cols = _solved_rows()
+    exact = verify_equilibrium_batch(cols, tol=1e-9)
+    local = check_local_nash_batch(cols, delta=1e-4, tol=1e-9)
+    assert exact["IsNash"].all() and local["IsLocalNash"].all()
+    assert np.all(exact["KKT_P1"] < 1e-6) and np.all(exact["KKT_P2"] < 1e-6)
+    assert np.all(exact["MaxGain_P1"] > -1e-9) and np.all(exact["MaxGain_P2"] > -1e-9)
+
+
+def test_perturbed_rows_fail_both_checks():
+    cols = _solved_rows()
+    moved = dict(cols, x1=cols["x1"] + 0.05, y1=cols["y1"] + 0.05)
+    exact = verify_equilibrium_batch(moved, tol=1e-9)
+    local = check_local_nash_batch(moved, delta=1e-4, tol=1e-12)
+    assert not exact["IsBR_P1"].any() and not local["IsBR_P1"].any()
+    assert np.array_equal(exact["IsBR_P2"], local["IsBR_P2"])
+
+
+def test_csv_checkers_agree(tmp_path):
+    cols = _solved_rows(n_per_mask=4)
+    src = tmp_path / "rows.csv"
+    with open(src, "w", newline="") as f:
+        w = csv.writer(f)
+        w.writerow(REQUIRED_COLS)
+        w.writerows(zip(*(cols[k].tolist() for k in REQUIRED_COLS)))
+    n = len(cols["a1"])
+    assert check_equilibrium_csv(str(src), str(tmp_path / "local.csv"), tol=1e-9, chunk_rows=5, workers=2) == n
+    assert verify_equilibrium_csv(str(src), str(tmp_path / "exact.csv"), tol=1e-9, chunk_rows=5) == n
+    with open(tmp_path / "local.csv", newline="") as f:
+        local = [r["IsLocalNash"] for r in csv.DictReader(f)]
+    with open(tmp_path / "exact.csv", newline="") as f:
+        exact = [r["IsNash"] for r in csv.DictReader(f)]
+    assert local == exact == ["Yes"] * n
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""
+Continuation along a1 must give the same a2* as the cold-start optimizer at every point.
+
+p1 = (2, 1), p2 = (1, 1), c = (1, 1) is the case the first warm start got wrong: near
+a1 ≈ 0.0917 the winning region is a narrow (X,B) segment around a2 ≈ 0.06 that fell between
+the guard points, and the warm start stayed at a2 = 1e-6 (B,X).
+"""
+
+import pytest
+
+from optimize_a2 import optimize_a2_for_player1, optimize_a2_for_player1_warm
+
+OPT = dict(a2_lo=1e-6, a2_hi=1.0 - 1e-6, tol=1e-5, max_iter=200, solver_tol=1e-10)
+A1_GRID = [0.01 + k * (0.99 - 0.01) / 24 for k in range(25)]
+
+
+@pytest.mark.parametrize("params", [
+    dict(p1x=2.0, p1y=1.0, p2x=1.0, p2y=1.0, c1=1.0, c2=1.0),
+    dict(p1x=0.7, p1y=1.3, p2x=1.8, p2y=0.6, c1=1.0, c2=1.5),
+])
+def test_warm_start_matches_cold_along_a1(params):
+    seed = None
+    warm_calls = cold_calls = 0
+    for a1 in A1_GRID:
+        cold = optimize_a2_for_player1(a1=a1, **params, **OPT)
+        warm = cold if seed is None else optimize_a2_for_player1_warm(a1=a1, a2_seed=seed, **params, **OPT)
+        seed = warm.best_a2
+        assert (warm.best_a2, warm.u1_at_best, warm.chosen_mask) == (cold.best_a2, cold.u1_at_best, cold.chosen_mask)
+        cold_calls += len(cold.samples)
+        warm_calls += len(warm.samples)
+    # continuation has to pay for itself
+    assert warm_calls < cold_calls / 10
+
+
+def test_warm_start_finds_narrow_mask_segment():
+    params = dict(p1x=2.0, p1y=1.0, p2x=1.0, p2y=1.0, c1=1.0, c2=1.0)
+    cold = optimize_a2_for_player1(a1=0.09166666666666666, **params, **OPT)
+    warm = optimize_a2_for_player1_warm(a1=0.09166666666666666, a2_seed=1e-6, **params, **OPT)
+    assert warm.strategy == "warm"
+    assert cold.chosen_mask == warm.chosen_mask == "X,B"
+    assert warm.best_a2 == cold.best_a2